@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import importlib.util
 import logging
 
 from .adapter import Adapter, FakeAdapter
@@ -28,22 +29,21 @@ from .adapter import Adapter, FakeAdapter
 from .protocol import ProtocolAdapter
 
 from pymeasure.adapters.telnet import TelnetAdapter
+from pymeasure.lazy import attach
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
-    from pymeasure.adapters.visa import VISAAdapter
-except ImportError:
-    log.warning("PyVISA library could not be loaded")
+# The adapters using the optional PyVISA, PySerial and VXI-11 libraries and the asynchronous
+# adapters, which need asyncio, are imported at first use
+__getattr__, __dir__, _lazy = attach(__name__, {
+    "asynchronous": ["AsyncAdapter", "AsyncSocketAdapter", "ThreadedAdapter"],
+    "visa": ["VISAAdapter"],
+    "serial": ["SerialAdapter"],
+    "prologix": ["PrologixAdapter"],
+    "vxi11": ["VXI11Adapter"],
+}, optional=("vxi11",))
 
-try:
-    from pymeasure.adapters.serial import SerialAdapter
-    from pymeasure.adapters.prologix import PrologixAdapter
-except ImportError:
-    log.warning("PySerial library could not be loaded")
-
-try:
-    from pymeasure.adapters.vxi11 import VXI11Adapter
-except ImportError:
-    log.warning("VXI-11 library could not be loaded")
+__all__ = ["Adapter", "FakeAdapter", "ProtocolAdapter", "TelnetAdapter"] + _lazy
+if importlib.util.find_spec("vxi11") is not None:
+    __all__.append("VXI11Adapter")
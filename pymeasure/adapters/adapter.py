@@ -23,11 +23,11 @@
 #
 
 import logging
+from contextlib import nullcontext
 from warnings import warn
 
 import numpy as np
 from copy import copy
-from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
 
 
 class Adapter:
@@ -46,8 +46,13 @@ class Adapter:
 
     :param log: Parent logger of the 'Adapter' logger.
     :param \\**kwargs: Keyword arguments just to be cooperative.
+
+    :cvar IEEE_BLOCK_MAX_PREFIX: Maximum number of bytes skipped before the header of an IEEE
+        488.2 block by :meth:`read_ieee_block`.
     """
 
+    IEEE_BLOCK_MAX_PREFIX = 256
+
     def __init__(self, preprocess_reply=None, log=None, **kwargs):
         super().__init__(**kwargs)
         self.preprocess_reply = preprocess_reply
@@ -145,6 +150,15 @@ class Adapter:
         """Flush and discard the input buffer. Implement in subclass."""
         raise NotImplementedError("Adapter class has not implemented input flush.")
 
+    def transaction(self):
+        """Return a context manager to hold while a message is written and its reply read.
+
+        Adapters sharing a connection with other adapters return a lock, such that the
+        messages of different threads do not interleave. Without shared connection, it does
+        nothing.
+        """
+        return nullcontext()
+
     # Deprecated methods.
     def ask(self, command):
         """ Write the command to the instrument and returns the resulting
@@ -210,26 +224,73 @@ class Adapter:
         warn("`Adapter.binary_values` is deprecated, call `Instrument.binary_values` instead.",
              FutureWarning)
         self.write(command)
-        binary = self.read()
+        binary = self.read_bytes(-1)
         # header = binary[:header_bytes]
         data = binary[header_bytes:]
-        return np.fromstring(data, dtype=dtype)
+        return np.frombuffer(data, dtype=dtype).copy()
 
     # Binary format methods
     def read_binary_values(self, header_bytes=0, termination_bytes=None,
-                           dtype=np.float32, **kwargs):
+                           dtype=np.float32, ieee_block=False, **kwargs):
         """ Returns a numpy array from a query for binary data
 
         :param int header_bytes: Number of bytes to ignore in header.
         :param int termination_bytes: Number of bytes to strip at end of message or None.
         :param dtype: The NumPy data type to format the values with.
-        :param \\**kwargs: Further arguments for the NumPy fromstring method.
+        :param bool ieee_block: Read the data as IEEE 488.2 definite length block with
+            :meth:`read_ieee_block`, which reads exactly the announced number of bytes.
+            `header_bytes` is ignored and the number of `termination_bytes` (its absolute
+            value) is read after the block.
+        :param \\**kwargs: Further arguments for the NumPy frombuffer method, or for the
+            fromstring method if a text separator `sep` is given.
         :returns: NumPy array of values
         """
-        binary = self.read_bytes(-1)
-        # header = binary[:header_bytes]
-        data = binary[header_bytes:termination_bytes]
-        return np.fromstring(data, dtype=dtype, **kwargs)
+        if ieee_block:
+            data = self.read_ieee_block(termination_bytes=abs(termination_bytes or 0))
+        else:
+            binary = self.read_bytes(-1)
+            # header = binary[:header_bytes]
+            data = binary[header_bytes:termination_bytes]
+        if kwargs.get("sep"):
+            return np.fromstring(data, dtype=dtype, **kwargs)
+        return np.frombuffer(data, dtype=dtype, **kwargs).copy()
+
+    def read_ieee_block(self, termination_bytes=0):
+        """ Read an IEEE 488.2 definite length arbitrary block and return its data.
+
+        The header ``#<number of digits><length>`` is parsed (bytes preceding it are
+        skipped) and exactly `length` bytes are read, such that the read ends with the data
+        instead of waiting for a timeout. An indefinite length block (``#0``) is read up to
+        the end of the message.
+
+        :param int termination_bytes: Number of bytes following the block (e.g. 1 for a line
+            feed), which are read and discarded.
+        :returns bytes: The data of the block.
+        """
+        skipped = 0
+        while True:
+            byte = self.read_bytes(1)
+            if byte == b"#":
+                break
+            if not byte or skipped >= self.IEEE_BLOCK_MAX_PREFIX:
+                raise ValueError("No IEEE 488.2 block header received.")
+            skipped += 1
+        digits = self.read_bytes(1)
+        if not digits.isdigit():
+            raise ValueError(f"Invalid IEEE 488.2 block header: '#{digits.decode()}'.")
+        if digits == b"0":
+            return self.read_bytes(-1, break_on_termchar=True)
+        length = self.read_bytes(int(digits))
+        try:
+            length = int(length)
+        except ValueError:
+            raise ValueError(f"Invalid IEEE 488.2 block length: '{length.decode()}'.") from None
+        data = self.read_bytes(length)
+        if len(data) < length:
+            raise ValueError(f"IEEE 488.2 block of {length} bytes ended after {len(data)}.")
+        if termination_bytes:
+            self.read_bytes(termination_bytes)
+        return data
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`Adapter.write_binary_values`.
@@ -241,6 +302,9 @@ class Adapter:
         :return: binary string.
         :rtype: bytes
         """
+        # imported here, such that importing the adapters does not load PyVISA
+        from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
+
         if header_fmt == "ieee":
             block = to_ieee_block(values, datatype, is_big_endian)
         elif header_fmt == "hp":
@@ -299,7 +363,9 @@ class FakeAdapter(Adapter):
         result = copy(self._buffer)
         # Reset the buffer
         self._buffer = ""
-        return result[:count].encode()
+        if count >= 0:
+            result = result[:count]
+        return result.encode()
 
     def _write(self, command):
         """ Write the command to a buffer, so that it can
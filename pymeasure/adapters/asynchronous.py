@@ -0,0 +1,282 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+import re
+
+from .adapter import Adapter
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class AsyncAdapter(Adapter):
+    """Base class for adapters, which communicate with coroutines, such that several
+    instruments may be accessed concurrently with :mod:`asyncio`.
+
+    The coroutines :meth:`awrite`, :meth:`awrite_bytes`, :meth:`aread`, and
+    :meth:`aread_bytes` correspond to the methods of :class:`Adapter` and log the
+    communication in the same way. Subclasses implement the private coroutines.
+
+    :param \\**kwargs: Keyword arguments for :class:`Adapter`.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = None
+
+    @property
+    def lock(self):
+        """:class:`asyncio.Lock` to hold while a message is written and its reply read."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def run(self, function, *args, **kwargs):
+        """Call a blocking `function`, which communicates via this adapter, and return its
+        result.
+
+        Only :class:`ThreadedAdapter` supports blocking communication.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support blocking calls.")
+
+    # Directly called coroutines, which ensure proper logging of the communication.
+    # DO NOT OVERRIDE IN SUBCLASS!
+    async def awrite(self, command, **kwargs):
+        """Write a string command to the instrument appending `write_termination`.
+
+        :param str command: Command string to be sent to the instrument
+            (without termination).
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        self.log.debug("WRITE:%s", command)
+        await self._awrite(command, **kwargs)
+
+    async def awrite_bytes(self, content, **kwargs):
+        """Write the bytes `content` to the instrument.
+
+        :param bytes content: The bytes to write to the instrument.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        self.log.debug("WRITE:%s", content)
+        await self._awrite_bytes(content, **kwargs)
+
+    async def aread(self, **kwargs):
+        """Read up to (excluding) `read_termination` or the whole read buffer.
+
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns str: ASCII response of the instrument (excluding read_termination).
+        """
+        read = await self._aread(**kwargs)
+        self.log.debug("READ:%s", read)
+        return read
+
+    async def aread_bytes(self, count=-1, break_on_termchar=False, **kwargs):
+        """Read a certain number of bytes from the instrument.
+
+        :param int count: Number of bytes to read. A value of -1 indicates to
+            read from the whole read buffer.
+        :param bool break_on_termchar: Stop reading at a termination character.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns bytes: Bytes response of the instrument (including termination).
+        """
+        read = await self._aread_bytes(count, break_on_termchar, **kwargs)
+        self.log.debug("READ:%s", read)
+        return read
+
+    async def aclose(self):
+        """Close the connection."""
+        self.close()
+
+    # Coroutines to implement in the subclasses.
+    async def _awrite(self, command, **kwargs):
+        """Write string to the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented writing.")
+
+    async def _awrite_bytes(self, content, **kwargs):
+        """Write bytes to the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented writing bytes.")
+
+    async def _aread(self, **kwargs):
+        """Read string from the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented reading.")
+
+    async def _aread_bytes(self, count, break_on_termchar, **kwargs):
+        """Read bytes from the instrument. Implement in subclass."""
+        raise NotImplementedError("Adapter class has not implemented reading bytes.")
+
+
+class ThreadedAdapter(AsyncAdapter):
+    """Adapter, which offloads the blocking calls of another adapter to a thread.
+
+    Each ThreadedAdapter has a single worker thread, such that calls for one instrument
+    are executed in order, while different instruments are accessed concurrently.
+    The blocking methods are available as well and call the wrapped adapter directly.
+
+    .. code-block:: python
+
+        adapter = ThreadedAdapter(VISAAdapter("GPIB::12"))
+        reply = await adapter.run(instrument.ask, "*IDN?")
+
+    :param adapter: The blocking :class:`Adapter` to wrap.
+    :param bool close_adapter: Close the wrapped adapter, when this adapter is closed.
+    :param \\**kwargs: Keyword arguments for :class:`Adapter`.
+    """
+
+    def __init__(self, adapter, close_adapter=True, **kwargs):
+        super().__init__(**kwargs)
+        self.adapter = adapter
+        self.connection = adapter.connection
+        self.close_adapter = close_adapter
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix=type(adapter).__name__)
+
+    def __repr__(self):
+        return f"<ThreadedAdapter({self.adapter!r})>"
+
+    def close(self):
+        """Stop the worker thread and close the wrapped adapter, if `close_adapter` is set."""
+        self._executor.shutdown(wait=False)
+        if self.close_adapter:
+            self.adapter.close()
+
+    async def run(self, function, *args, **kwargs):
+        """Call the blocking `function` in the worker thread and return its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    def _write(self, command, **kwargs):
+        self.adapter.write(command, **kwargs)
+
+    def _write_bytes(self, content, **kwargs):
+        self.adapter.write_bytes(content, **kwargs)
+
+    def _read(self, **kwargs):
+        return self.adapter.read(**kwargs)
+
+    def _read_bytes(self, count, break_on_termchar, **kwargs):
+        return self.adapter.read_bytes(count, break_on_termchar, **kwargs)
+
+    def flush_read_buffer(self):
+        """Flush and discard the input buffer of the wrapped adapter."""
+        self.adapter.flush_read_buffer()
+
+    async def _awrite(self, command, **kwargs):
+        await self.run(self.adapter.write, command, **kwargs)
+
+    async def _awrite_bytes(self, content, **kwargs):
+        await self.run(self.adapter.write_bytes, content, **kwargs)
+
+    async def _aread(self, **kwargs):
+        return await self.run(self.adapter.read, **kwargs)
+
+    async def _aread_bytes(self, count, break_on_termchar, **kwargs):
+        return await self.run(self.adapter.read_bytes, count, break_on_termchar, **kwargs)
+
+
+class AsyncSocketAdapter(AsyncAdapter):
+    """Adapter for TCP socket connections with :mod:`asyncio` streams.
+
+    The connection is opened with the first communication or with :meth:`aopen`.
+
+    :param host: Host name or address of the instrument, or a VISA resource name of the
+        form :code:`TCPIP[board]::<host>::<port>::SOCKET`.
+    :param int port: Port of the instrument. Required, unless `host` is a resource name.
+    :param str read_termination: Termination of the messages read.
+    :param str write_termination: Termination appended to the messages written.
+    :param float timeout: Timeout in s for connecting and reading.
+    :param str encoding: Encoding of the messages.
+    :param \\**kwargs: Keyword arguments for :class:`Adapter`.
+    """
+
+    RESOURCE_PATTERN = re.compile(r"TCPIP\d*::(?P<host>[^:]+)::(?P<port>\d+)::SOCKET",
+                                  re.IGNORECASE)
+
+    def __init__(self, host, port=None, read_termination="\n", write_termination="\n",
+                 timeout=2, encoding="ascii", **kwargs):
+        super().__init__(**kwargs)
+        self._reader = None
+        self._writer = None
+        if port is None:
+            match = self.RESOURCE_PATTERN.fullmatch(host)
+            if match is None:
+                raise ValueError(f"'{host}' is not a socket resource name and no port is given.")
+            host, port = match.group("host"), int(match.group("port"))
+        self.host = host
+        self.port = port
+        self.read_termination = read_termination
+        self.write_termination = write_termination
+        self.timeout = timeout
+        self.encoding = encoding
+
+    def __repr__(self):
+        return f"<AsyncSocketAdapter(host='{self.host}', port={self.port})>"
+
+    async def aopen(self):
+        """Open the connection, if it is not yet open."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout)
+            self.connection = self._writer
+
+    def close(self):
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = self.connection = None
+
+    async def aclose(self):
+        """Close the connection and wait until it is closed."""
+        writer = self._writer
+        self.close()
+        if writer is not None:
+            await writer.wait_closed()
+
+    async def _awrite(self, command, **kwargs):
+        await self._awrite_bytes((command + self.write_termination).encode(self.encoding))
+
+    async def _awrite_bytes(self, content, **kwargs):
+        await self.aopen()
+        self._writer.write(content)
+        await self._writer.drain()
+
+    async def _aread(self, **kwargs):
+        if not self.read_termination:
+            return (await self._aread_bytes(-1, False)).decode(self.encoding)
+        read = await self._aread_bytes(-1, True)
+        return read.decode(self.encoding)[:-len(self.read_termination)]
+
+    async def _aread_bytes(self, count, break_on_termchar, **kwargs):
+        """Read `count` bytes, up to the termination character, or the available bytes."""
+        await self.aopen()
+        if count >= 0:
+            read = self._reader.readexactly(count)
+        elif break_on_termchar and self.read_termination:
+            read = self._reader.readuntil(self.read_termination.encode(self.encoding))
+        else:
+            read = self._reader.read(2 ** 16)
+        return await asyncio.wait_for(read, self.timeout)
@@ -21,12 +21,128 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import re
+import threading
 import time
+import weakref
+from contextlib import contextmanager
 from warnings import warn
 
 from pymeasure.adapters import VISAAdapter
 
 
+_SPECIAL_CHARACTERS = re.compile(b"([\r\n\x1b+])")
+_ESCAPED_CHARACTERS = re.compile(b"\x1b(.)", re.DOTALL)
+
+
+def escape(data):
+    """ Return binary data with the characters special to the Prologix controller escaped.
+
+    If any of the characters CR (ASCII 13), LF (ASCII 10), ESC (ASCII 27) or '+' (ASCII 43)
+    occur in binary data sent to an instrument, they must be preceded by an ESC character.
+    The time is linear in the size of the data.
+
+    :param bytes data: Data to be sent to an instrument.
+    :returns bytes: The escaped data.
+    """
+    return _SPECIAL_CHARACTERS.sub(b"\x1b\\1", data)
+
+
+def unescape(data):
+    """ Return escaped binary data (see :func:`escape`) without the escape characters.
+
+    :param bytes data: Escaped data.
+    :returns bytes: The original data.
+    """
+    return _ESCAPED_CHARACTERS.sub(b"\\1", data)
+
+
+_controllers = weakref.WeakKeyDictionary()  # controllers by connection
+_controllers_lock = threading.Lock()
+
+
+class PrologixController:
+    """ State of a Prologix controller, which is shared by all the :class:`PrologixAdapter`
+    objects using its connection.
+
+    The controller serializes the transactions of the adapters with a reentrant lock, tracks
+    the currently addressed GPIB instrument, such that the ``++addr`` command is only sent
+    when the address changes, and records the latency of the transactions per address.
+
+    :ivar address: The currently addressed GPIB address, or None if unknown.
+    :ivar auto: Whether read-after-write is enabled, or None if unknown.
+    :ivar written: The GPIB address to which the previous message was written, or None if the
+        previous message was a read or a controller command.
+    :ivar lock: The :class:`threading.RLock` held during a transaction.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.address = None
+        self.auto = None
+        self.written = None
+        self._depth = 0
+        self._latencies = {}
+
+    @contextmanager
+    def transaction(self, address=None):
+        """ Context manager holding the lock of the controller. The duration of the outermost
+        transaction is recorded as latency of `address`.
+
+        If an exception occurs, the addressed instrument is considered unknown.
+
+        :param address: GPIB address of the transaction.
+        """
+        with self.lock:
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                yield self
+            except BaseException:
+                self.address = None
+                self.written = None
+                raise
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._record(address, time.perf_counter() - start)
+
+    def observe(self, command):
+        """ Update the state of the controller with a command sent to it.
+
+        :param command: A controller command, starting with "++".
+        """
+        name, _, argument = command[2:].strip().partition(" ")
+        if name == "addr":
+            argument = argument.split()
+            if argument:
+                self.address = int(argument[0]) if len(argument) == 1 else None
+        elif name == "auto" and argument.strip():
+            self.auto = bool(int(argument))
+        elif name == "rst":
+            self.address = None
+            self.auto = None
+
+    def _record(self, address, duration):
+        count, total, maximum = self._latencies.get(address, (0, 0., 0.))
+        self._latencies[address] = (count + 1, total + duration, max(maximum, duration))
+
+    def latencies(self):
+        """ Return the latency statistics of the transactions per GPIB address.
+
+        :returns: Dictionary by address of dictionaries with the number of transactions
+            ("count"), their mean and maximum duration in seconds ("mean", "max").
+        """
+        with self.lock:
+            return {address: {"count": count, "mean": total / count, "max": maximum}
+                    for address, (count, total, maximum) in self._latencies.items()}
+
+    def reset_latencies(self):
+        """ Discard the recorded latencies. """
+        with self.lock:
+            self._latencies.clear()
+
+
 class PrologixAdapter(VISAAdapter):
     """ Encapsulates the additional commands necessary
     to communicate over a Prologix GPIB-USB Adapter,
@@ -37,6 +153,13 @@ class PrologixAdapter(VISAAdapter):
     Connection sharing is achieved by using the :meth:`.gpib`
     method to spawn new PrologixAdapters for different GPIB addresses.
 
+    The adapters sharing a connection share a :class:`PrologixController`, which
+    serializes their transactions (a write and the reading of its reply by
+    :meth:`Instrument.ask <pymeasure.instruments.Instrument.ask>` is one transaction), so that
+    instruments on the same bus may be used from different threads. The ``++addr`` command is
+    only sent if another address was selected before, and the latencies of the transactions are
+    available by address via :meth:`PrologixController.latencies`.
+
     :param resource_name: A
         `VISA resource string <https://pyvisa.readthedocs.io/en/latest/introduction/names.html>`__
         that identifies the connection to the Prologix device itself, for example
@@ -62,6 +185,7 @@ class PrologixAdapter(VISAAdapter):
     :param kwargs: Key-word arguments if constructing a new serial object
 
     :ivar address: Integer GPIB address of the desired instrument.
+    :ivar controller: The :class:`PrologixController` shared by the adapters of the connection.
 
     Usage example:
 
@@ -111,6 +235,9 @@ class PrologixAdapter(VISAAdapter):
                          preprocess_reply=preprocess_reply,
                          **kwargs)
         self.address = address
+        with _controllers_lock:
+            # adapters opened with the same resource name share the connection, too
+            self.controller = _controllers.setdefault(self.connection, PrologixController())
         if not isinstance(resource_name, PrologixAdapter):
             self.auto = auto
             self.eoi = eoi
@@ -128,8 +255,7 @@ class PrologixAdapter(VISAAdapter):
         feature called, Read-After-Write, saves the user from having to issue read commands
         repeatedly. This property enables (True) or disables (False) this feature.
         """
-        self.write("++auto")
-        return bool(int(self.read(prologix=True)))
+        return bool(int(self._ask_controller("++auto")))
 
     @auto.setter
     def auto(self, value):
@@ -143,9 +269,7 @@ class PrologixAdapter(VISAAdapter):
         Some instruments require EOI signal to be
         asserted in order to properly detect the end of a command.
         """
-        self.write("++eoi")
-        return bool(int(self.read(prologix=True)))
-        self.read(prologix=True)
+        return bool(int(self._ask_controller("++eoi")))
 
     @eoi.setter
     def eoi(self, value):
@@ -167,8 +291,7 @@ class PrologixAdapter(VISAAdapter):
         instruments received over GPIB port.
         """
         values = {0: "\r\n", 1: "\r", 2: "\n", 3: ""}
-        self.write("++eos")
-        return values[int(self.read(prologix=True))]
+        return values[int(self._ask_controller("++eos"))]
 
     @eos.setter
     def eos(self, value):
@@ -181,8 +304,7 @@ class PrologixAdapter(VISAAdapter):
 
         possible values: 1 - 3000
         """
-        self.write("++read_tmo_ms")
-        return int(self.read(prologix=True))
+        return int(self._ask_controller("++read_tmo_ms"))
 
     @gpib_read_timeout.setter
     def gpib_read_timeout(self, value):
@@ -192,8 +314,7 @@ class PrologixAdapter(VISAAdapter):
     def version(self):
         """Get the version string of the Prologix controller.
         """
-        self.write('++ver')
-        return self.read(prologix=True)
+        return self._ask_controller("++ver")
 
     def reset(self):
         """Perform a power-on reset of the controller.
@@ -215,19 +336,43 @@ class PrologixAdapter(VISAAdapter):
         self.write(command)
         return self.read()
 
+    def _ask_controller(self, command):
+        """Send a command to the controller itself and return its reply."""
+        with self.transaction():
+            self.write(command)
+            return self.read(prologix=True)
+
+    def transaction(self):
+        """Return the context manager of a transaction with the instrument, which holds the
+        lock of the shared :attr:`controller`."""
+        return self.controller.transaction(self.address)
+
+    def _select_address(self, **kwargs):
+        """Send the GPIB address in :attr:`address`, if defined and not selected already."""
+        if self.address is not None and self.controller.address != self.address:
+            super().write("++addr %d" % self.address, **kwargs)
+            self.controller.address = self.address
+
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
 
-        If the GPIB address in :attr:`address` is defined, it is sent first.
+        If the GPIB address in :attr:`address` is defined and not selected already, it is
+        sent first.
 
         :param str command: Command string to be sent to the instrument
             (without termination).
         :param kwargs: Keyword arguments for the connection itself.
         """
         # Overrides write instead of _write in order to ensure proper logging
-        if self.address is not None and not command.startswith("++"):
-            super().write("++addr %d" % self.address, **kwargs)
-        super().write(command, **kwargs)
+        with self.transaction():
+            if command.startswith("++"):
+                super().write(command, **kwargs)
+                self.controller.observe(command)
+                self.controller.written = None
+            else:
+                self._select_address(**kwargs)
+                super().write(command, **kwargs)
+                self.controller.written = self.address
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`.write_binary_values`.
@@ -240,20 +385,8 @@ class PrologixAdapter(VISAAdapter):
         :rtype: bytes
         """
         block = super()._format_binary_values(values, datatype, is_big_endian, header_fmt)
-        # Prologix needs certian characters to be escaped.
-        # Special care must be taken when sending binary data to instruments. If any of the
-        # following characters occur in the binary data -- CR (ASCII 13), LF (ASCII 10), ESC
-        # (ASCII 27), '+' (ASCII 43) - they must be escaped by preceding them with an ESC
-        # character.
-        special_chars = b'\x0d\x0a\x1b\x2b'
-        new_block = b''
-        for b in block:
-            escape = b''
-            if b in special_chars:
-                escape = b'\x1b'
-            new_block += (escape + bytes((b,)))
-
-        return new_block
+        # Prologix needs certain characters to be escaped, see `escape`.
+        return escape(block)
 
     def write_binary_values(self, command, values, **kwargs):
         """ Write binary data to the instrument, e.g. waveform for signal generators.
@@ -266,10 +399,11 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Key-word arguments to pass onto :meth:`._format_binary_values`
         :returns: number of bytes written
         """
-        if self.address is not None:
-            address_command = "++addr %d\n" % self.address
-            self.write(address_command)
-        super().write_binary_values(command, values, "\n", **kwargs)
+        with self.transaction():
+            self._select_address()
+            written = super().write_binary_values(command, values, "\n", **kwargs)
+            self.controller.written = self.address
+            return written
 
     def _read(self, prologix=False, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -278,9 +412,15 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        if not prologix:
-            self.write("++read eoi")
-        return super()._read()
+        if prologix:
+            return super()._read()
+        with self.transaction():
+            self._select_address()
+            if not (self.controller.auto and self.controller.written == self.address):
+                # with read-after-write, the instrument is addressed to talk after a write
+                super().write("++read eoi")
+            self.controller.written = None
+            return super()._read()
 
     def gpib(self, address, **kwargs):
         """ Return a PrologixAdapter object that references the GPIB
@@ -295,8 +435,9 @@ class PrologixAdapter(VISAAdapter):
 
     def _check_for_srq(self):
         # it was int(self.ask("++srq"))
-        self.write("++srq")
-        return int(self.read())
+        with self.transaction():
+            self.write("++srq")
+            return int(self.read())
 
     def wait_for_srq(self, timeout=25, delay=0.1):
         """ Blocks until a SRQ, and leaves the bit high
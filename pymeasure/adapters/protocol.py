@@ -23,7 +23,6 @@
 #
 
 import logging
-from unittest.mock import MagicMock
 from warnings import warn
 
 from .adapter import Adapter
@@ -90,6 +89,8 @@ class ProtocolAdapter(Adapter):
         self._setup_connection(connection_attributes, connection_methods)
 
     def _setup_connection(self, connection_attributes, connection_methods):
+        # imported here, as unittest.mock imports asyncio, which takes considerable time
+        from unittest.mock import MagicMock
         self.connection = MagicMock()
         if connection_attributes is not None:
             for key, value in connection_attributes.items():
@@ -23,6 +23,8 @@
 #
 
 import logging
+import threading
+from contextlib import nullcontext
 from warnings import warn
 
 import pyvisa
@@ -34,6 +36,156 @@ from .protocol import ProtocolAdapter
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+_connections = {}  # shared connections by (VISA library, resource name)
+_registry_lock = threading.RLock()
+
+# Arguments of `ResourceManager.open_resource`, which are no attributes of the resource
+_OPEN_ARGUMENTS = ("access_mode", "open_timeout", "resource_pyclass")
+
+
+def _is_open(resource):
+    """Return whether the pyvisa resource has not been closed."""
+    try:
+        resource.session
+    except pyvisa.errors.InvalidSession:
+        return False
+    return True
+
+
+class SharedConnection:
+    """A pyvisa resource opened once in the process and shared by all the adapters using it.
+
+    Adapters get the connection of a resource with :meth:`acquire` and give it back with
+    :meth:`release`. The resource is closed when the last adapter released it.
+
+    :ivar manager: The :class:`pyvisa.ResourceManager` which opened the resource.
+    :ivar connection: The opened pyvisa resource.
+    :ivar interface_type: The :class:`pyvisa.constants.InterfaceType` of the resource.
+    :ivar lock: The :class:`threading.RLock` held during a transaction of an adapter.
+    :ivar users: Number of adapters using the connection.
+    """
+
+    def __init__(self, manager, connection, interface_type):
+        self.manager = manager
+        self.connection = connection
+        self.interface_type = interface_type
+        self.lock = threading.RLock()
+        self.users = 0
+        self._keys = set()
+
+    @classmethod
+    def acquire(cls, resource_name, visa_library='', **kwargs):
+        """Return the shared connection to `resource_name`, opening the resource if necessary.
+
+        The keyword arguments are resolved as described for :class:`VISAAdapter`. They are
+        passed to :meth:`pyvisa.ResourceManager.open_resource` when opening the resource. An
+        already open connection keeps its settings, as other adapters rely on them: a
+        setting differing from the requested value is warned about, see :meth:`configure`.
+
+        :param resource_name: VISA resource string.
+        :param visa_library: PyVISA VisaLibrary Instance, path of the VISA library or
+            VisaLibrary spec string (``@py`` or ``@ivi``).
+        :param \\**kwargs: Keyword arguments for configuring the PyVISA connection.
+        """
+        with _registry_lock:
+            shared = cls._lookup(visa_library, resource_name)
+            if shared is None:
+                # pyvisa returns the same resource manager for the same library
+                manager = pyvisa.ResourceManager(visa_library)
+                info = manager.resource_info(resource_name)
+                # The same resource may be named differently, e.g. "GPIB::5" and "GPIB0::5::INSTR"
+                shared = cls._lookup(visa_library, info.resource_name)
+                if shared is None:
+                    kwargs = cls._interface_kwargs(info.interface_type, kwargs)
+                    connection = manager.open_resource(resource_name, **kwargs)
+                    shared = cls(manager, connection, info.interface_type)
+                    kwargs = {}  # applied already
+                for name in (resource_name, info.resource_name):
+                    if name is not None:
+                        _connections[visa_library, name] = shared
+                        shared._keys.add((visa_library, name))
+            shared.configure(**cls._interface_kwargs(shared.interface_type, kwargs))
+            shared.users += 1
+            return shared
+
+    def configure(self, **kwargs):
+        """Check that the open connection has the settings in `kwargs`.
+
+        The settings are not changed, as other adapters use the connection.
+
+        :param \\**kwargs: Attributes of the pyvisa resource and their requested values.
+        :raises ValueError: If a keyword is no attribute of the resource.
+        """
+        for key, value in kwargs.items():
+            if key in _OPEN_ARGUMENTS:
+                continue
+            if not hasattr(self.connection, key):
+                raise ValueError(f"'{key}' is not a valid attribute for type "
+                                 f"{self.connection.__class__.__name__}")
+            current = getattr(self.connection, key)
+            if current != value:
+                warn(f"The connection to {self.connection.resource_name} is shared with other "
+                     f"adapters and keeps {key}={current!r} instead of {value!r}.")
+
+    @staticmethod
+    def _lookup(visa_library, resource_name):
+        """Return the open shared connection registered for `resource_name`, if any."""
+        shared = _connections.get((visa_library, resource_name))
+        if shared is not None and not _is_open(shared.connection):
+            shared._unregister()  # closed directly
+            return None
+        return shared
+
+    @staticmethod
+    def _interface_kwargs(interface_type, kwargs):
+        """Return the kwargs, with the entries of `interface_type` merged in as defaults and the
+        entries of all other interfaces removed."""
+        kwargs = dict(kwargs)
+        for key in list(kwargs.keys()):  # iterate over a copy of the keys as we modify kwargs
+            # Remove all interface-specific kwargs:
+            if key in pyvisa.constants.InterfaceType.__members__:
+                if getattr(pyvisa.constants.InterfaceType, key) is interface_type:
+                    # For the present interface, dump contents into kwargs first if they are not
+                    # present already. This way, it is possible to override default values with
+                    # kwargs passed to Instrument.__init__()
+                    for k, v in kwargs[key].items():
+                        kwargs.setdefault(k, v)
+                del kwargs[key]
+        return kwargs
+
+    def share(self):
+        """Register one more adapter using the connection and return the shared connection."""
+        with _registry_lock:
+            self.users += 1
+            return self
+
+    def release(self):
+        """Give back the connection; the resource is closed if no adapter uses it anymore."""
+        with _registry_lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            self._unregister()
+            self.connection.close()
+            if (self.manager.visalib.library_path == "unset"
+                    and not any(shared.manager is self.manager
+                                for shared in _connections.values())):
+                # if using the pyvisa-sim library the manager has to be also closed.
+                # this works around https://github.com/pyvisa/pyvisa-sim/issues/82
+                self.manager.close()
+
+    def _unregister(self):
+        for key in self._keys:
+            if _connections.get(key) is self:
+                del _connections[key]
+        self._keys.clear()
+
+    @staticmethod
+    def connections():
+        """Return the currently open shared connections by (VISA library, resource name)."""
+        with _registry_lock:
+            return dict(_connections)
+
 
 # noinspection PyPep8Naming,PyUnresolvedReferences
 class VISAAdapter(Adapter):
@@ -81,8 +233,18 @@ class VISAAdapter(Adapter):
         See :ref:`connection_settings` for how to tweak settings when *connecting* to an instrument.
         See :ref:`default_connection_settings` for how to best define default settings when
         *implementing an instrument*.
+
+    Adapters opened with the same VISA library and resource name share one connection, see
+    :class:`SharedConnection`, whose lock they hold during a :meth:`transaction`. The
+    keyword arguments of a later adapter do not change the settings of the already open
+    connection; a conflicting setting is warned about.
+
+    :cvar IDLE_TIMEOUT: Time in ms without new bytes after which :meth:`read_bytes` with
+        ``count=-1`` returns.
     """
 
+    IDLE_TIMEOUT = 50
+
     def __init__(self, resource_name, visa_library='', preprocess_reply=None,
                  query_delay=0, log=None, **kwargs):
         super().__init__(preprocess_reply=preprocess_reply, log=log)
@@ -101,51 +263,47 @@ class VISAAdapter(Adapter):
             # Allow to reuse the connection.
             self.resource_name = getattr(resource_name, "resource_name", None)
             self.connection = resource_name.connection
-            self.manager = resource_name.manager
+            self.manager = getattr(resource_name, "manager", None)
             self.query_delay = resource_name.query_delay
+            shared = getattr(resource_name, "shared_connection", None)
+            self.shared_connection = None if shared is None else shared.share()
             return
         elif isinstance(resource_name, int):
             resource_name = "GPIB0::%d::INSTR" % resource_name
 
         self.resource_name = resource_name
-        self.manager = pyvisa.ResourceManager(visa_library)
-
-        # Clean up kwargs considering the interface type matching resource_name
-        if_type = self.manager.resource_info(self.resource_name).interface_type
-        for key in list(kwargs.keys()):  # iterate over a copy of the keys as we modify kwargs
-            # Remove all interface-specific kwargs:
-            if key in pyvisa.constants.InterfaceType.__members__:
-                if getattr(pyvisa.constants.InterfaceType, key) is if_type:
-                    # For the present interface, dump contents into kwargs first if they are not
-                    # present already. This way, it is possible to override default values with
-                    # kwargs passed to Instrument.__init__()
-                    for k, v in kwargs[key].items():
-                        kwargs.setdefault(k, v)
-                del kwargs[key]
-
-        self.connection = self.manager.open_resource(
-            resource_name,
-            **kwargs
-        )
+        self.shared_connection = SharedConnection.acquire(resource_name, visa_library, **kwargs)
+        self.manager = self.shared_connection.manager
+        self.connection = self.shared_connection.connection
 
     def close(self):
         """Close the connection.
 
         .. note::
 
-            This closes the connection to the resource for all adapters using
-            it currently (e.g. different adapters using the same GPIB line).
+            The connection is shared by all the adapters using the same resource (e.g.
+            different adapters using the same GPIB line) and closed when the last of them
+            is closed.
         """
-        super().close()
+        shared = getattr(self, "shared_connection", None)
+        if shared is None:
+            super().close()
+            return
+        self.shared_connection = None  # release only once
         try:
-            if self.manager.visalib.library_path == "unset":
-                # if using the pyvisa-sim library the manager has to be also closed.
-                # this works around https://github.com/pyvisa/pyvisa-sim/issues/82
-                self.manager.close()
+            shared.release()
         except AttributeError:
             # AttributeError can occur during __del__ calling close
             pass
 
+    def transaction(self):
+        """Return a context manager holding the lock of the shared connection during a
+        transaction, such that the messages of different threads do not interleave."""
+        shared = getattr(self, "shared_connection", None)
+        if shared is None:
+            return nullcontext()
+        return shared.lock
+
     def _write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
 
@@ -188,14 +346,48 @@ class VISAAdapter(Adapter):
             # pyvisa's `read_raw` reads until newline, if no termination_character defined
             # and if not configured to stop at a termination lane etc.
             # see https://github.com/pyvisa/pyvisa/issues/728
-            result = bytearray()
-            while True:
-                try:
-                    result.extend(self.connection.read_bytes(1))
-                except pyvisa.errors.VisaIOError as exc:
-                    if exc.error_code == pyvisa.constants.StatusCode.error_timeout:
-                        return bytes(result)
-                    raise
+            return self._read_until_idle()
+
+    def _read_until_idle(self):
+        """Read until no byte arrives for :attr:`IDLE_TIMEOUT` ms.
+
+        The first data is awaited with the timeout of the connection. Afterwards, the timeout
+        is shortened to :attr:`IDLE_TIMEOUT`, such that the read finishes shortly after the
+        data ends. Serial connections read the bytes available in their buffer at once, other
+        interfaces read a whole message (in chunks of the `chunk_size` of the connection) at
+        once.
+        The lock of a shared connection is held, as its timeout is changed meanwhile.
+        """
+        connection = self.connection
+        result = bytearray()
+        with self.transaction():
+            timeout = connection.timeout
+            idle_timeout = (self.IDLE_TIMEOUT if timeout is None
+                            else min(self.IDLE_TIMEOUT, timeout))
+            idle = False
+            buffered = True  # whether the connection reports the bytes in its buffer
+            try:
+                while True:
+                    available = 0
+                    if buffered:
+                        try:
+                            available = connection.bytes_in_buffer
+                        except (AttributeError, NotImplementedError, pyvisa.errors.VisaIOError):
+                            buffered = False
+                    try:
+                        if buffered:
+                            result.extend(connection.read_bytes(max(available, 1)))
+                        else:
+                            result.extend(connection.read_raw())
+                    except pyvisa.errors.VisaIOError as exc:
+                        if exc.error_code == pyvisa.constants.StatusCode.error_timeout:
+                            return bytes(result)
+                        raise
+                    if not idle:
+                        connection.timeout = idle_timeout
+                        idle = True
+            finally:
+                connection.timeout = timeout
 
     def ask(self, command):
         """ Writes the command to the instrument and returns the resulting
@@ -27,18 +27,124 @@ import logging
 import numpy as np
 import pyqtgraph as pg
 from .Qt import QtCore, QtGui
+from .refresh import RefreshCoordinator
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+class MinMaxDecimator:
+    """ Incremental min/max decimation of a curve for level-of-detail rendering.
+
+    Consecutive points are grouped in buckets of :attr:`factor` points, each of which is
+    drawn as its minimum and maximum, such that the envelope of the curve is preserved with at
+    most twice :attr:`points` points. Only the points added since the previous
+    :meth:`update` are bucketed; when there are too many buckets, pairs of buckets are merged
+    and the factor doubles. The points of the last incomplete bucket are drawn as they are.
+
+    :param points: number of buckets to aim for, about the width of the plot in pixels
+    """
+
+    def __init__(self, points=2000):
+        self.points = int(points)
+        self.reset()
+
+    def reset(self):
+        """ Forgets the bucketed points """
+        self.factor = 1
+        self.rows = 0  # number of points which are bucketed
+        self.imin = np.empty(0, dtype=np.int64)  # index of the minimum of each bucket
+        self.imax = np.empty(0, dtype=np.int64)
+        self.bounds = (np.inf, -np.inf)  # range of the x values
+
+    def update(self, x, y):
+        """ Returns the decimated x and y arrays of a curve, which continues the curve of the
+        previous update.
+
+        :param x: array of the x values
+        :param y: array of the y values
+        """
+        if len(y) < self.rows:
+            self.reset()
+        if len(x) > self.rows:
+            with np.errstate(invalid='ignore'):
+                new = x[self.rows:]
+                self.bounds = (np.fmin(self.bounds[0], np.nanmin(new, initial=np.inf)),
+                               np.fmax(self.bounds[1], np.nanmax(new, initial=-np.inf)))
+        if self.factor == 1 and len(y) > 2 * self.points:
+            self.factor = int(np.ceil(len(y) / self.points))
+        self._bucket(y)
+        while len(self.imin) > 2 * self.points:
+            self._merge(y)
+            self._bucket(y)
+        indices = np.concatenate((self._ordered(self.imin, self.imax),
+                                  np.arange(self.rows, len(y))))
+        return x[indices], y[indices]
+
+    def _bucket(self, y):
+        count = (len(y) - self.rows) // self.factor
+        if self.factor == 1 or count <= 0:
+            return
+        stop = self.rows + count * self.factor
+        buckets = y[self.rows:stop].reshape(count, self.factor)
+        offsets = self.rows + self.factor * np.arange(count)
+        self.imin = np.concatenate((self.imin, offsets + np.argmin(buckets, axis=1)))
+        self.imax = np.concatenate((self.imax, offsets + np.argmax(buckets, axis=1)))
+        self.rows = stop
+
+    def _merge(self, y):
+        """ Merges pairs of buckets, an unpaired last bucket is bucketed again """
+        pairs = len(self.imin) // 2
+        if len(self.imin) % 2:
+            self.rows -= self.factor
+        imin = self.imin[:2 * pairs].reshape(pairs, 2)
+        imax = self.imax[:2 * pairs].reshape(pairs, 2)
+        rows = np.arange(pairs)
+        self.imin = imin[rows, np.argmin(y[imin], axis=1)]
+        self.imax = imax[rows, np.argmax(y[imax], axis=1)]
+        self.factor *= 2
+
+    @staticmethod
+    def _ordered(imin, imax):
+        return np.stack((np.minimum(imin, imax), np.maximum(imin, imax)), axis=1).ravel()
+
+    def decimate(self, x, y, start, stop):
+        """ Returns the decimated x and y arrays of the points within a range of x values, e.g.
+        the visible range of a zoomed plot, which are bucketed from scratch.
+
+        :param x: array of the x values
+        :param y: array of the y values
+        :param start: lower x bound
+        :param stop: upper x bound
+        """
+        with np.errstate(invalid='ignore'):
+            indices = np.flatnonzero((start <= x) & (x <= stop))
+        factor = int(np.ceil(len(indices) / self.points))
+        if factor <= 1:
+            return x[indices], y[indices]
+        count = len(indices) // factor
+        buckets = indices[:count * factor].reshape(count, factor)
+        rows = np.arange(count)
+        imin = buckets[rows, np.argmin(y[buckets], axis=1)]
+        imax = buckets[rows, np.argmax(y[buckets], axis=1)]
+        indices = np.concatenate((self._ordered(imin, imax), indices[count * factor:]))
+        return x[indices], y[indices]
+
+
 class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results object. The data can
     be forced to fully reload on each update, useful for cases when the data is changing across
     the full file instead of just appending.
+
+    With level-of-detail rendering (`lod`), long curves are drawn decimated by a
+    :class:`MinMaxDecimator`, which buckets only the new rows on each update. When the plot is
+    zoomed in, the visible range of the data is decimated anew.
+
+    :param lod: number of points (about the plot width in pixels) above which the curve is
+        decimated, or None to draw all points
     """
 
-    def __init__(self, results, x, y, force_reload=False, wdg=None, **kwargs):
+    def __init__(self, results, x, y, force_reload=False, wdg=None, lod=None, **kwargs):
         super().__init__(**kwargs)
         self.results = results
         self.wdg = wdg
@@ -46,15 +152,53 @@ class ResultsCurve(pg.PlotDataItem):
         self.x, self.y = x, y
         self.force_reload = force_reload
         self.color = self.opts['pen'].color()
+        self.decimator = None if lod is None else MinMaxDecimator(lod)
+        self._drawn = None  # snapshot version, axes and view range of the drawn data
+        self._view_range = None  # visible x range, if the plot is zoomed in
+        self._decimated = None  # decimated x and y arrays of the whole curve
 
     def update_data(self):
         """Updates the data by polling the results"""
-        if self.force_reload:
-            self.results.reload()
-        data = self.results.data  # get the current snapshot
+        snapshot = RefreshCoordinator.default().snapshot(self.results, reload=self.force_reload)
+        drawn = (snapshot.version, self.x, self.y, self._view_range)
+        if drawn == self._drawn:
+            return
+        data = snapshot.data
 
         # Set x-y data
-        self.setData(data[self.x], data[self.y])
+        if self.decimator is None:
+            self.setData(data[self.x], data[self.y])
+        else:
+            if self.force_reload or self._drawn is None or drawn[1:3] != self._drawn[1:3]:
+                self.decimator.reset()
+            x = data[self.x].to_numpy()
+            y = data[self.y].to_numpy()
+            self._decimated = self.decimator.update(x, y)
+            if self._view_range is None:
+                self.setData(*self._decimated)
+            else:
+                self.setData(*self.decimator.decimate(x, y, *self._view_range))
+        self._drawn = drawn
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        # While zoomed in, only the visible points are set, but auto-ranging covers all of them
+        if self._view_range is None or (ax == 1 and orthoRange is not None):
+            return super().dataBounds(ax, frac, orthoRange)
+        if ax == 0:
+            return list(self.decimator.bounds)
+        return [np.nanmin(self._decimated[1]), np.nanmax(self._decimated[1])]
+
+    def viewRangeChanged(self, *args, **kwargs):
+        super().viewRangeChanged(*args, **kwargs)
+        if self.decimator is None or self.getViewBox() is None:
+            return
+        start, stop = self.getViewBox().viewRange()[0]
+        xmin, xmax = self.decimator.bounds
+        view_range = None if start <= xmin and xmax <= stop else (start, stop)
+        if view_range != self._view_range:
+            self._view_range = view_range
+            if self._drawn is not None:
+                self.update_data()
 
     def set_color(self, color):
         self.pen.setColor(color)
@@ -66,7 +210,16 @@ class ResultsCurve(pg.PlotDataItem):
 
 class ResultsImage(pg.ImageItem):
     """ Creates an image loaded dynamically from a file through the Results
-    object."""
+    object.
+
+    Each update bins only the rows added since the previous update into the pixels of the image,
+    whose colors are looked up in a table of the colormap. The colors of all pixels are only
+    recomputed when the range of the z values changes.
+
+    :cvar LUT_SIZE: Number of colors of the colormap lookup table
+    """
+
+    LUT_SIZE = 512
 
     def __init__(self, results, x, y, z, force_reload=False, wdg=None, **kwargs):
         self.results = results
@@ -85,6 +238,8 @@ class ResultsImage(pg.ImageItem):
         self.img_data = np.zeros((self.ysize, self.xsize, 4))
         self.force_reload = force_reload
         self.cm = pg.colormap.get('viridis')
+        self.color_table = self.cm.getLookupTable(nPts=self.LUT_SIZE, alpha=True, mode='float')
+        self._reset_pixels()
 
         super().__init__(image=self.img_data)
 
@@ -96,24 +251,75 @@ class ResultsImage(pg.ImageItem):
                      int(self.ystart / self.ystep) - 0.5)  # 0.5 so pixels centered
         self.setTransform(tr)
 
-    def update_data(self):
-        if self.force_reload:
-            self.results.reload()
-
-        data = self.results.data
-        zmin = data[self.z].min()
-        zmax = data[self.z].max()
+    def _reset_pixels(self):
+        self.z_data = np.full((self.ysize, self.xsize), np.nan)
+        self.img_data[:] = 0
+        self._rows = 0  # number of rows of the results binned into the image
+        self._zrange = (np.inf, -np.inf)
+        self._axes = (self.x, self.y, self.z)
+        self._version = None
 
-        # populate the image array with the new data
-        for idx, row in data.iterrows():
-            xdat = row[self.x]
-            ydat = row[self.y]
-            xidx, yidx = self.find_img_index(xdat, ydat)
-            self.img_data[yidx, xidx, :] = self.colormap((row[self.z] - zmin) / (zmax - zmin))
+    def update_data(self):
+        snapshot = RefreshCoordinator.default().snapshot(self.results, reload=self.force_reload)
+        if (self.x, self.y, self.z) != self._axes or (
+                self.force_reload and snapshot.version != self._version):
+            self._reset_pixels()
+        start, stop = snapshot.delta(self._rows)
+        if start < self._rows:  # the data was reloaded
+            self._reset_pixels()
+        self._version = snapshot.version
+        if start == stop:
+            return
+        new = snapshot.data.iloc[start:stop]
+        self._rows = stop
+
+        xidx, yidx = self.find_img_indices(new[self.x].to_numpy(dtype=float),
+                                           new[self.y].to_numpy(dtype=float))
+        z = new[self.z].to_numpy(dtype=float)
+        self.z_data[yidx, xidx] = z
+
+        zrange = self._zrange
+        if not np.all(np.isnan(z)):
+            zrange = (min(zrange[0], np.nanmin(z)), max(zrange[1], np.nanmax(z)))
+        if zrange != self._zrange:
+            # the normalization changed, recolor all pixels
+            self._zrange = zrange
+            self.img_data[:] = self.colormap_lut(self.z_data)
+        else:
+            self.img_data[yidx, xidx] = self.colormap_lut(self.z_data[yidx, xidx])
 
         # set image data, need to transpose since pyqtgraph assumes column-major order
         self.setImage(image=np.transpose(self.img_data, axes=(1, 0, 2)))
 
+    def find_img_indices(self, x, y):
+        """ Finds the integer image indices corresponding to the closest
+        x and y points of arrays of x and y data, see :meth:`find_img_index`.
+        """
+        return (self._bin(x, self.xstart, self.xend, self.xstep, self.xsize),
+                self._bin(y, self.ystart, self.yend, self.ystep, self.ysize))
+
+    @staticmethod
+    def _bin(values, start, end, step, size):
+        with np.errstate(invalid='ignore'):
+            inside = (start <= values) & (values <= end)
+            # rounds half up, as round_up
+            indices = np.floor((values - start) / step + 0.5)
+        return np.where(inside, indices, size - 1).astype(int)
+
+    def colormap_lut(self, z):
+        """ Return the colors of an array of z values, normalized to the range of the data,
+        as 0.0-1.0 floats RGBA, looked up in :attr:`color_table`. NaN values are transparent.
+        """
+        zmin, zmax = self._zrange
+        span = zmax - zmin
+        with np.errstate(invalid='ignore'):
+            scaled = (z - zmin) * ((self.LUT_SIZE - 1) / span if span > 0 else 0.)
+        valid = np.isfinite(scaled)
+        indices = np.rint(np.clip(np.where(valid, scaled, 0), 0, self.LUT_SIZE - 1)).astype(int)
+        colors = self.color_table[indices]
+        colors[~valid] = 0
+        return colors
+
     def find_img_index(self, x, y):
         """ Finds the integer image indices corresponding to the
         closest x and y points of the data given some x and y data.
@@ -143,31 +349,123 @@ class ResultsImage(pg.ImageItem):
 
 class BufferCurve(pg.PlotDataItem):
     """ Creates a curve based on a predefined buffer size and allows data to be added dynamically.
+
+    In rolling mode (see :meth:`prepare`), the buffer keeps the last points instead of
+    overflowing. By default, the curve is redrawn on every append. With a `refresh_time`,
+    redraws are coalesced: appended points are drawn at most once per `refresh_time`,
+    e.g. ``1 / 60`` for the display refresh period. :attr:`data_updated` is emitted after
+    each redraw.
+
+    :param lod: number of points above which the curve is decimated (see
+        :class:`MinMaxDecimator`), or None to draw all points
+    :param refresh_time: minimum time between redraws in seconds, or None to redraw on
+        every append
     """
 
     data_updated = QtCore.Signal()
 
-    def __init__(self, **kwargs):
+    def __init__(self, lod=None, refresh_time=None, **kwargs):
         super().__init__(**kwargs)
         self._buffer = None
-
-    def prepare(self, size, dtype=np.float32):
-        """ Prepares the buffer based on its size, data type """
-        self._buffer = np.empty((size, 2), dtype=dtype)
-        self._ptr = 0
+        self._size = self._ptr = 0
+        self.rolling = False
+        self.decimator = None if lod is None else MinMaxDecimator(lod)
+        self.refresh_time = refresh_time
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self.redraw)
+
+    def prepare(self, size, dtype=np.float32, rolling=False):
+        """ Prepares the buffer based on its size, data type
+
+        :param size: number of points of the buffer
+        :param dtype: data type of the buffer
+        :param rolling: whether to keep the last `size` points once the buffer is full, instead
+            of raising an exception
+        """
+        self.rolling = rolling
+        self._size = size
+        # A rolling buffer stores each point twice, half a buffer apart, such that the last
+        # points are always a contiguous view without copying or reallocating
+        self._buffer = np.empty((2 * size if rolling else size, 2), dtype=dtype)
+        self._ptr = 0  # number of appended points
+        if self.decimator is not None:
+            self.decimator.reset()
 
     def append(self, x, y):
         """ Appends data to the curve with optional errors """
         if self._buffer is None:
             raise Exception("BufferCurve buffer must be prepared")
-        if len(self._buffer) <= self._ptr:
+        if not self.rolling and self._size <= self._ptr:
             raise Exception("BufferCurve overflow")
 
         # Set x-y data
-        self._buffer[self._ptr, :2] = [x, y]
-        self.setData(self._buffer[:self._ptr, :2])
-
+        index = self._ptr % self._size
+        self._buffer[index, :2] = [x, y]
+        if self.rolling:
+            self._buffer[index + self._size, :2] = [x, y]
         self._ptr += 1
+        self._schedule_redraw()
+
+    def extend(self, xs, ys):
+        """ Appends arrays of points to the curve
+
+        :param xs: array of x values
+        :param ys: array of y values
+        """
+        if self._buffer is None:
+            raise Exception("BufferCurve buffer must be prepared")
+        count = len(xs)
+        if len(ys) != count:
+            raise ValueError("The x and y arrays must have the same length")
+        if not self.rolling:
+            if self._ptr + count > self._size:
+                raise Exception("BufferCurve overflow")
+            self._buffer[self._ptr:self._ptr + count, 0] = xs
+            self._buffer[self._ptr:self._ptr + count, 1] = ys
+        else:
+            # Only the last points of a long block are kept
+            skip = max(count - self._size, 0)
+            points = np.column_stack((xs[skip:], ys[skip:]))
+            start = (self._ptr + skip) % self._size
+            first = min(len(points), self._size - start)
+            for offset in (0, self._size):
+                self._buffer[offset + start:offset + start + first] = points[:first]
+                self._buffer[offset:offset + len(points) - first] = points[first:]
+        self._ptr += count
+        self._schedule_redraw()
+
+    @property
+    def points(self):
+        """ Get the number of points in the buffer """
+        return min(self._ptr, self._size)
+
+    def buffered_data(self):
+        """ Returns views of the x and y values of the points in the buffer """
+        if self.rolling and self._ptr > self._size:
+            start = self._ptr % self._size
+            window = self._buffer[start:start + self._size]
+        else:
+            window = self._buffer[:self._ptr]
+        return window[:, 0], window[:, 1]
+
+    def _schedule_redraw(self):
+        if not self.refresh_time:
+            self.redraw()
+        elif not self._redraw_timer.isActive():
+            self._redraw_timer.start(int(self.refresh_time * 1e3))
+
+    def redraw(self):
+        """ Draws the points in the buffer """
+        self._redraw_timer.stop()
+        x, y = self.buffered_data()
+        if self.decimator is None:
+            self.setData(x, y)
+        else:
+            if self.rolling and self._ptr > self._size:
+                # the points are not only appended, but also dropped
+                self.decimator.reset()
+            self.setData(*self.decimator.update(x, y))
         self.data_updated.emit()
 
 
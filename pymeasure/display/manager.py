@@ -120,6 +120,9 @@ class BaseManager(QtCore.QObject):
     """Controls the execution of :class:`.Experiment` classes by implementing
     a queue system in which Experiments are added, removed, executed, or
     aborted.
+
+    If a :class:`~pymeasure.experiment.estimator.DurationStore` is given, the durations of
+    the finished experiments are recorded in it.
     """
     _is_continuous = True
     _start_on_add = True
@@ -131,7 +134,7 @@ class BaseManager(QtCore.QObject):
     abort_returned = QtCore.Signal(object)
     log = QtCore.Signal(object)
 
-    def __init__(self, port=5888, log_level=logging.INFO, parent=None):
+    def __init__(self, port=5888, log_level=logging.INFO, duration_store=None, parent=None):
         super().__init__(parent)
 
         self.experiments = ExperimentQueue()
@@ -139,6 +142,7 @@ class BaseManager(QtCore.QObject):
         self._running_experiment = None
         self._monitor = None
         self.log_level = log_level
+        self.duration_store = duration_store
 
         self.port = port
 
@@ -153,6 +157,20 @@ class BaseManager(QtCore.QObject):
         else:
             raise Exception("There is no Experiment running")
 
+    def running_timer(self):
+        """ Returns the :class:`~pymeasure.experiment.estimator.RunTimer` of the running
+        experiment, or None if no experiment is running.
+        """
+        worker = self._worker
+        if not self.is_running() or worker is None:
+            return None
+        return worker.timer
+
+    def queued_experiments(self):
+        """ Returns a list of the experiments in the queue which wait to be run. """
+        return [experiment for experiment in self.experiments.queue
+                if experiment.procedure.status == Procedure.QUEUED]
+
     def _update_progress(self, progress):
         if self.is_running():
             self._running_experiment.browser_item.setProgress(progress)
@@ -201,8 +219,11 @@ class BaseManager(QtCore.QObject):
                 log.debug("Manager is initiating the next experiment")
                 experiment = self.experiments.next()
                 self._running_experiment = experiment
+                # The curves follow the running experiment from memory instead of its file
+                experiment.results.start_live_data()
 
-                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level)
+                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level,
+                                      duration_store=self.duration_store)
 
                 self._monitor = Monitor(self._worker.monitor_queue)
                 self._monitor.worker_running.connect(self._running)
@@ -222,6 +243,8 @@ class BaseManager(QtCore.QObject):
 
     def _clean_up(self):
         self._worker.join()
+        # The data of the finished experiment is read from its file again
+        self._running_experiment.results.stop_live_data()
         del self._worker
         self._monitor.wait()
         del self._monitor
@@ -281,7 +304,8 @@ class Manager(BaseManager):
         in accordance with the execution status of the Experiments.
         """
 
-    def __init__(self, widget_list, browser, port=5888, log_level=logging.INFO, parent=None):
+    def __init__(self, widget_list, browser, port=5888, log_level=logging.INFO,
+                 duration_store=None, parent=None):
         super().__init__(parent)
 
         self.experiments = ExperimentQueue()
@@ -289,6 +313,7 @@ class Manager(BaseManager):
         self._running_experiment = None
         self._monitor = None
         self.log_level = log_level
+        self.duration_store = duration_store
 
         self.widget_list = widget_list
         self.browser = browser
@@ -0,0 +1,259 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import time
+import weakref
+from collections import deque
+from functools import partial
+
+from .Qt import QtCore
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class Snapshot:
+    """ The data of a :class:`~pymeasure.experiment.results.Results` object
+    as read at a refresh tick.
+
+    :param data: :class:`pandas.DataFrame` with the data
+    :param version: number which is incremented whenever the data changed
+    :param tick: refresh tick at which the data was read
+    :param stamp: :attr:`~pymeasure.experiment.results.Results.data_stamp` of the results
+        before the data was read
+    """
+
+    def __init__(self, data, version, tick, stamp=None):
+        self.data = data
+        self.version = version
+        self.tick = tick
+        self.stamp = stamp
+
+    @property
+    def rows(self):
+        return len(self.data)
+
+    def delta(self, rows):
+        """ Returns the (start, stop) range of the rows which are new to a
+        consumer that has seen `rows` rows. If the data has fewer rows, e.g.
+        after a reload, the range starts at 0.
+        """
+        return (rows if rows <= self.rows else 0), self.rows
+
+    def __repr__(self):
+        return "<{}(rows={},version={},tick={})>".format(
+            self.__class__.__name__, self.rows, self.version, self.tick)
+
+
+class RefreshGroup(QtCore.QObject):
+    """ Timer shared by the display widgets which refresh at the same
+    interval. The :attr:`tick` signal is emitted within a refresh tick of the
+    coordinator, such that all connected widgets share the data read.
+
+    The timer adapts its interval to the load: the duration of each tick in
+    which new data was read is recorded in :attr:`frame_times`. If a tick
+    takes longer than the :attr:`BUDGET` fraction of the interval, the
+    interval is doubled; if it takes less than a quarter of the budget, e.g.
+    for experiments with a low data rate, the interval is shortened. Ticks
+    without new data cost little and are counted in :attr:`skipped_ticks`.
+
+    Widgets connect their slots to the :attr:`tick` signal with
+    :meth:`register`, which disconnects them when the widget is destroyed. The
+    timer stops when the last registered widget was destroyed.
+
+    :cvar BUDGET: fraction of the interval a tick may take
+    :cvar MIN_FACTOR: shortest interval, relative to the refresh time
+    :cvar MAX_FACTOR: longest interval, relative to the refresh time
+    :cvar FRAME_TIMES: number of recorded frame times
+
+    :param coordinator: :class:`RefreshCoordinator` of the ticks
+    :param refresh_time: nominal interval between ticks in seconds
+    :param adaptive: whether the interval adapts to the duration of the ticks
+    """
+
+    tick = QtCore.Signal()
+
+    BUDGET = 0.5
+    MIN_FACTOR = 0.25
+    MAX_FACTOR = 10
+    FRAME_TIMES = 100
+
+    def __init__(self, coordinator, refresh_time, adaptive=True, parent=None):
+        super().__init__(parent)
+        self.coordinator = coordinator
+        self.refresh_time = refresh_time
+        self.adaptive = adaptive
+        self.interval = refresh_time
+        self.frame_times = deque(maxlen=self.FRAME_TIMES)
+        self.skipped_ticks = 0
+        self.widgets = 0
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.dispatch)
+        self.timer.start(int(refresh_time * 1e3))
+
+    def register(self, widget, *slots):
+        """ Connects the `slots` to the :attr:`tick` signal until `widget` is destroyed
+
+        :param widget: :class:`QtCore.QObject` whose lifetime limits the connections
+        :param slots: callables or signals to call at each tick
+        """
+        connections = [self.tick.connect(slot) for slot in slots]
+        widget.destroyed.connect(partial(self._unregister, connections))
+        self.widgets += 1
+        if not self.timer.isActive():
+            self.timer.start(int(self.interval * 1e3))
+
+    def _unregister(self, connections, *args):
+        for connection in connections:
+            QtCore.QObject.disconnect(connection)
+        self.widgets -= 1
+        if self.widgets == 0:
+            self.timer.stop()
+
+    def dispatch(self):
+        """ Emits the :attr:`tick` signal within a new refresh tick """
+        start = time.perf_counter()
+        self.coordinator.begin_tick()
+        try:
+            self.tick.emit()
+        finally:
+            changed = self.coordinator.end_tick()
+        if not changed:
+            self.skipped_ticks += 1
+            return
+        duration = time.perf_counter() - start
+        self.frame_times.append(duration)
+        if self.adaptive:
+            self._adapt(duration)
+
+    def _adapt(self, duration):
+        budget = self.BUDGET * self.interval
+        if duration > budget:
+            interval = min(2 * self.interval, self.MAX_FACTOR * self.refresh_time)
+        elif duration < budget / 4:
+            interval = max(0.8 * self.interval, self.MIN_FACTOR * self.refresh_time)
+        else:
+            return
+        if interval != self.interval:
+            log.debug("Refresh interval of %g s changed to %g s after a tick of %g s",
+                      self.refresh_time, interval, duration)
+            self.interval = interval
+            self.timer.setInterval(int(interval * 1e3))
+
+
+class RefreshCoordinator(QtCore.QObject):
+    """ Coordinates the refreshing of the display widgets, such that the
+    data of each :class:`~pymeasure.experiment.results.Results` object is read
+    only once per refresh tick, however many curves, images and tables
+    show it.
+
+    Widgets connect to the :attr:`RefreshGroup.tick` signal of the
+    :meth:`group` of their refresh time and get the data through
+    :meth:`snapshot`. Within a tick, all of them get the same versioned
+    :class:`Snapshot`, from which each consumer takes the range of rows which
+    is new to it (see :meth:`Snapshot.delta`). The data is not read again
+    while the :attr:`~pymeasure.experiment.results.Results.data_stamp` of the
+    results is unchanged. Outside of a tick, e.g. when an experiment
+    finished, the data is always read.
+
+    The attributes :attr:`requests` and :attr:`reads` count the requested
+    snapshots and the reads of the data, :attr:`saved_reads` their difference.
+    """
+
+    _default = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups = {}
+        self._snapshots = weakref.WeakKeyDictionary()
+        self._tick = 0
+        self._in_tick = False
+        self._changed = False
+        self.requests = 0
+        self.reads = 0
+
+    @classmethod
+    def default(cls):
+        """ Returns the coordinator shared by the display widgets """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def saved_reads(self):
+        """ Number of snapshot requests which did not read the data """
+        return self.requests - self.reads
+
+    def group(self, refresh_time):
+        """ Returns the :class:`RefreshGroup` of a refresh time (in seconds),
+        which is created on first use.
+        """
+        interval = int(refresh_time * 1e3)
+        group = self._groups.get(interval)
+        if group is None:
+            group = self._groups[interval] = RefreshGroup(self, refresh_time, parent=self)
+        return group
+
+    def begin_tick(self):
+        """ Starts a refresh tick, during which each data is read once """
+        self._tick += 1
+        self._in_tick = True
+        self._changed = False
+
+    def end_tick(self):
+        """ Ends a refresh tick and returns whether new data was read during it """
+        self._in_tick = False
+        return self._changed
+
+    def snapshot(self, results, reload=False):
+        """ Returns the current :class:`Snapshot` of the data of a results
+        object, which is read unless it was already read during this tick.
+
+        :param results: :class:`~pymeasure.experiment.results.Results` object
+        :param reload: whether to reload the data file fully before reading
+        """
+        self.requests += 1
+        last = self._snapshots.get(results)
+        stamp = getattr(results, 'data_stamp', None)
+        if self._in_tick and last is not None:
+            if last.tick == self._tick:
+                return last
+            if not reload and stamp is not None and stamp == last.stamp:
+                last.tick = self._tick
+                return last
+        if reload:
+            results.reload()
+        data = results.data
+        self.reads += 1
+        if last is None:
+            version = 0
+        elif reload or len(data) != last.rows:
+            version = last.version + 1
+        else:
+            version = last.version
+        if last is None or version != last.version:
+            self._changed = True
+        snapshot = self._snapshots[results] = Snapshot(data, version, self._tick, stamp)
+        return snapshot
@@ -30,6 +30,8 @@ from datetime import datetime, timedelta
 from ..thread import StoppableQThread
 from ..Qt import QtCore, QtWidgets
 from .sequencer_widget import SequenceEvaluationError
+from ...experiment import Procedure
+from ...experiment.estimator import DurationEstimator
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -71,6 +73,12 @@ class EstimatorWidget(QtWidgets.QWidget):
     asking for two keyword arguments in the Implementation of the `get_estimates` function:
     `sequence` and `sequence_length`, respectively.
 
+    If the procedure does not implement `get_estimates`, the built-in estimates are shown,
+    which are predicted by a :class:`~pymeasure.experiment.estimator.DurationEstimator`
+    from the durations recorded in the `duration_store` of the parent: the duration of
+    the procedure with the entered parameters, of the sequence, and the remaining time of
+    the queue, which is extrapolated from the progress of the running experiment.
+
     """
     provide_sequence = False
     provide_sequence_length = False
@@ -81,6 +89,10 @@ class EstimatorWidget(QtWidgets.QWidget):
         super().__init__(parent)
         self._parent = parent
 
+        self.builtin = parent.procedure_class.get_estimates is Procedure.get_estimates
+        if self.builtin:
+            self.estimator = DurationEstimator(parent.duration_store)
+
         self.check_get_estimates_signature()
 
         self.update_thread = EstimatorThread(self.get_estimates)
@@ -99,6 +111,10 @@ class EstimatorWidget(QtWidgets.QWidget):
         correct for the EstimatorWidget, stores the number of estimates.
         """
 
+        if self.builtin:
+            self.number_of_estimates = len(self.get_estimates())
+            return
+
         # Check function arguments
         proc = self._parent.make_procedure()
         call_signature = signature(proc.get_estimates)
@@ -173,12 +189,16 @@ class EstimatorWidget(QtWidgets.QWidget):
         sequence_length = None
         if hasattr(self._parent, "sequencer"):
             try:
-                sequence = self._parent.sequencer.get_sequence()
+                # the length of a lazy sequence is known without expanding it
+                sequence = self._parent.sequencer.get_sequence(lazy=not self.provide_sequence)
             except SequenceEvaluationError:
                 sequence_length = 0
             else:
                 sequence_length = len(sequence)
 
+        if self.builtin:
+            return self._builtin_estimates(procedure, sequence)
+
         if self.provide_sequence:
             kwargs["sequence"] = sequence
 
@@ -234,6 +254,56 @@ class EstimatorWidget(QtWidgets.QWidget):
 
         return estimates
 
+    def _builtin_estimates(self, procedure, sequence):
+        estimator = self.estimator
+        duration = estimator.predict(procedure)
+        estimates = [("Duration", self._format_duration(duration))]
+
+        if hasattr(self._parent, "sequencer"):
+            if sequence is None:
+                sequence_duration = 0.
+            else:
+                sequence_duration = estimator.predict_sequence(
+                    procedure.__class__, sequence.parameters(), len(sequence),
+                    base_parameters=procedure.parameter_values())
+            estimates.append(("Sequence length", str(0 if sequence is None else len(sequence))))
+            estimates.append(("Sequence duration", self._format_duration(sequence_duration)))
+
+        remaining = self.queue_remaining()
+        estimates.append(("Queue remaining", self._format_duration(remaining)))
+        if remaining is None:
+            finished = "unknown"
+        else:
+            finished = str(datetime.now() + timedelta(seconds=remaining))[:-7]
+        estimates.append(("Queue finished at", finished))
+        return estimates
+
+    def queue_remaining(self):
+        """ Return the predicted time in seconds until the experiments of the queue are
+        finished, or None if a duration cannot be predicted.
+        """
+        manager = self._parent.manager
+        remaining = 0.
+        timer = manager.running_timer()
+        if timer is not None:
+            running = timer.remaining()
+            if running is None:
+                duration = self.estimator.predict(manager.running_experiment().procedure)
+                if duration is None:
+                    return None
+                running = max(duration - timer.elapsed, 0.)
+            remaining += running
+        for experiment in manager.queued_experiments():
+            duration = self.estimator.predict(experiment.procedure)
+            if duration is None:
+                return None
+            remaining += duration
+        return remaining
+
+    @staticmethod
+    def _format_duration(duration):
+        return "unknown" if duration is None else "%d s" % int(duration)
+
     def _set_continuous_updating(self):
         state = self.update_box.checkState()
 
@@ -25,10 +25,15 @@
 import logging
 
 import re
+import time
+from collections import deque
+from warnings import warn
+
 import pyqtgraph as pg
 
 from ..curves import ResultsCurve, Crosshairs
 from ..Qt import QtCore, QtWidgets
+from ..refresh import RefreshCoordinator
 from ...experiment import Procedure
 
 log = logging.getLogger(__name__)
@@ -39,6 +44,12 @@ class PlotFrame(QtWidgets.QFrame):
     """ Combines a PyQtGraph Plot with Crosshairs. Refreshes
     the plot based on the refresh_time, and allows the axes
     to be changed on the fly, which updates the plotted data
+
+    The refresh ticks are shared with the other display widgets of the same
+    refresh time through the :class:`~pymeasure.display.refresh.RefreshCoordinator`,
+    such that each data is read only once per tick, and their interval adapts to the load
+    (see :class:`~pymeasure.display.refresh.RefreshGroup`). The durations of the recent
+    updates of the curves are recorded in :attr:`frame_times`.
     """
 
     LABEL_STYLE = {'font-size': '10pt', 'font-family': 'Arial', 'color': '#000000'}
@@ -51,6 +62,7 @@ class PlotFrame(QtWidgets.QFrame):
         super().__init__(parent)
         self.refresh_time = refresh_time
         self.check_status = check_status
+        self.frame_times = deque(maxlen=100)
         self._setup_ui()
         self.change_x_axis(x_axis)
         self.change_y_axis(y_axis)
@@ -81,16 +93,27 @@ class PlotFrame(QtWidgets.QFrame):
                                                   style=QtCore.Qt.PenStyle.DashLine))
         self.crosshairs.coordinates.connect(self.update_coordinates)
 
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_curves)
-        self.timer.timeout.connect(self.crosshairs.update)
-        self.timer.timeout.connect(self.updated)
-        self.timer.start(int(self.refresh_time * 1e3))
+        self.refresh_group = RefreshCoordinator.default().group(self.refresh_time)
+        self.refresh_group.register(self, self.update_curves, self.crosshairs.update,
+                                    self.updated)
+
+    @property
+    def timer(self):
+        """ The :class:`QtCore.QTimer` of the refresh ticks, shared with the other display
+        widgets of the same refresh time.
+
+        .. deprecated:: 0.15
+           Use :attr:`refresh_group` instead.
+        """
+        warn("`PlotFrame.timer` is deprecated, use `PlotFrame.refresh_group` instead.",
+             FutureWarning)
+        return self.refresh_group.timer
 
     def update_coordinates(self, x, y):
         self.coordinates.setText(f"({x:g}, {y:g})")
 
     def update_curves(self):
+        start = time.perf_counter()
         for item in self.plot.items:
             if isinstance(item, self.ResultsClass):
                 if self.check_status:
@@ -98,6 +121,7 @@ class PlotFrame(QtWidgets.QFrame):
                         item.update_data()
                 else:
                     item.update_data()
+        self.frame_times.append(time.perf_counter() - start)
 
     def parse_axis(self, axis):
         """ Returns the units of an axis by searching the string
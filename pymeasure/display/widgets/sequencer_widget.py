@@ -25,7 +25,6 @@ import logging
 import os
 from functools import partial
 from inspect import signature
-from collections import ChainMap
 
 from ..Qt import QtCore, QtWidgets, QtGui
 from ...experiment.sequencer import SequenceHandler, SequenceEvaluationError
@@ -529,8 +528,15 @@ class SequencerWidget(QtWidgets.QWidget):
         if node_index.isValid():
             self.tree.selectRow(node_index)
 
-    def get_sequence(self):
-        return self.data.parameters_sequence(self.names_inv)
+    def get_sequence(self, lazy=False):
+        """ Return the parameter settings of the sequence tree, see
+        :meth:`SequenceHandler.parameters_sequence
+        <pymeasure.experiment.sequencer.SequenceHandler.parameters_sequence>`.
+
+        :param lazy: whether to return a lazily generated
+            :class:`~pymeasure.experiment.sequencer.ParametersSequence`.
+        """
+        return self.data.parameters_sequence(self.names_inv, lazy=lazy)
 
     def queue_sequence(self):
         """
@@ -541,7 +547,7 @@ class SequencerWidget(QtWidgets.QWidget):
         self.queue_button.setEnabled(False)
 
         try:
-            sequence = self.get_sequence()
+            sequence = self.get_sequence(lazy=True)
         except SequenceEvaluationError:
             log.error("Evaluation of one of the sequence strings went wrong, no sequence queued.")
         else:
@@ -549,10 +555,8 @@ class SequencerWidget(QtWidgets.QWidget):
                 "Queuing %d measurements based on the entered sequences." % len(sequence)
             )
 
-            for entry in sequence:
+            for parameters in sequence.parameters():
                 QtWidgets.QApplication.processEvents()
-                parameters = dict(ChainMap(*entry[::-1]))
-
                 procedure = self._parent.make_procedure()
                 procedure.set_parameters(parameters)
                 self._parent.queue(procedure=procedure)
@@ -23,13 +23,16 @@
 #
 
 import logging
+from collections import OrderedDict
 from functools import partial
+from warnings import warn
 
 import numpy as np
 import pyqtgraph as pg
 import pandas as pd
 
 from ..Qt import QtCore, QtWidgets, QtGui
+from ..refresh import RefreshCoordinator
 from .tab_widget import TabWidget
 from ...experiment import Procedure
 
@@ -41,9 +44,19 @@ log.addHandler(logging.NullHandler())
 
 
 class ResultsTable(QtCore.QObject):
-    """ Class representing a panda dataframe """
+    """ Class representing a panda dataframe
+
+    The data is kept as one NumPy array per column, which are taken over from the snapshots of
+    the results without copying. New rows are handled in O(new rows), the rows of each value of
+    the index column are looked up in a dictionary, and the formatted cells are cached, such
+    that only the visible cells of a table are formatted, once.
+
+    :cvar CELL_CACHE_SIZE: Maximum number of formatted cells which are cached
+    """
     data_changed = QtCore.Signal(int, int, int, int)
 
+    CELL_CACHE_SIZE = 20000
+
     def __init__(self, results, color, column_index=None,
                  force_reload=False, wdg=None, **kwargs):
         super().__init__()
@@ -53,31 +66,92 @@ class ResultsTable(QtCore.QObject):
         self.last_row_count = 0
         self.wdg = wdg
         self.column_index = column_index
+        self._cells = OrderedDict()
+        self.column_names = []
+        self._dtypes = []
         self.data = self.results.data
         self._started = False
+        self._version = None  # version of the snapshot of the data
 
     @property
     def data(self):
-        return self._data
+        """ The data as :class:`pandas.DataFrame`, indexed by the index column """
+        if self.column_index is not None:
+            return self._frame.set_index(self.column_index)
+        return self._frame
 
     @data.setter
     def data(self, value):
-        self._data = value
-        if self.column_index is not None:
-            self._data = self._data.set_index(self.column_index)
+        self._set_frame(value, 0)
+
+    def _set_frame(self, frame, start):
+        """ Takes over the columns of a snapshot of the data, of which the rows from `start` on
+        are new.
+        """
+        self._frame = frame
+        names = [name for name in frame.columns if name != self.column_index]
+        arrays = [frame[name].to_numpy() for name in names]
+        dtypes = [array.dtype for array in arrays]
+        if start == 0 or names != self.column_names or dtypes != self._dtypes:
+            start = 0
+            self._cells.clear()
+            self._row_of = {}
+        self.column_names = names
+        self._arrays = arrays
+        self._dtypes = dtypes
+        if self.column_index is None:
+            self.index = None
         else:
-            self._data.reset_index()
+            self.index = frame[self.column_index].to_numpy()
+            for row, value in enumerate(self.index[start:].tolist(), start):
+                self._row_of.setdefault(value, row)
 
     @property
     def rows(self):
-        return self._data.shape[0]
+        return len(self._frame)
 
     @property
     def columns(self):
-        return self._data.shape[1]
+        return len(self.column_names)
+
+    def row_of(self, value):
+        """ Returns the first row of a value of the index column, or None """
+        return self._row_of.get(value)
+
+    def cell(self, row, col, float_digits=6):
+        """ Returns the text and the sort value of a cell """
+        key = (row, col, float_digits)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = self._format(row, col, float_digits)
+            if len(self._cells) > self.CELL_CACHE_SIZE:
+                self._cells.popitem(last=False)
+        return cell
+
+    def _format(self, row, col, float_digits):
+        try:
+            if row is None:
+                raise IndexError("No row for the index value")
+            array = self._arrays[col]
+            value = array[row]
+            # Cast to column type
+            value_render = array.dtype.type(value)
+        except (IndexError, ValueError, TypeError):
+            value = np.nan
+            value_render = ""
+        if isinstance(value_render, np.float64):
+            # limit maximum number of decimal digits displayed
+            value_render = f"{value_render:.{float_digits:d}g}"
+        text = str(value_render)
+        try:
+            # For numerical sort
+            return text, float(value)
+        except (TypeError, ValueError):
+            return text, text
 
     def init(self):
         self.last_row_count = 0
+        self._version = None
 
     def start(self):
         self._started = True
@@ -88,10 +162,13 @@ class ResultsTable(QtCore.QObject):
     def update_data(self):
         if not self._started:
             return
-        if self.force_reload:
-            self.results.reload()
-        self.data = self.results.data
-        current_row_count, columns = self._data.shape
+        snapshot = RefreshCoordinator.default().snapshot(self.results, reload=self.force_reload)
+        if snapshot.version == self._version:
+            return
+        self._version = snapshot.version
+        start, _ = snapshot.delta(self.rows)
+        self._set_frame(snapshot.data, 0 if self.force_reload else start)
+        current_row_count, columns = self.rows, self.columns
         if (self.last_row_count < current_row_count):
             # Request cells content update
             self.data_changed.emit(self.last_row_count, 0,
@@ -103,6 +180,8 @@ class ResultsTable(QtCore.QObject):
 
     def set_index(self, index):
         self.column_index = index
+        self._version = None
+        self._set_frame(self._frame, 0)
 
 
 class PandasModelBase(QtCore.QAbstractTableModel):
@@ -135,6 +214,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         if results_list is None:
             results_list = []
         self.results_list = results_list
+        self._reset_header()
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
 
@@ -159,6 +239,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         self.beginResetModel()
         if results in self.results_list:
             self.results_list.remove(results)
+        self._reset_header()
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
         results.stop()
@@ -172,24 +253,12 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
         if index.isValid() and role in (QtCore.Qt.ItemDataRole.DisplayRole, SORT_ROLE):
-            try:
-                results, row, col = self.translate_to_local(index.row(), index.column())
-                value = results.data.iat[row, col]
-                column_type = results.data.dtypes.iat[col]
-                # Cast to column type
-                value_render = column_type.type(value)
-            except (IndexError, ValueError, TypeError):
-                value = np.nan
-                value_render = ""
-            if isinstance(value_render, np.float64):
-                # limit maximum number of decimal digits displayed
-                value_render = f"{value_render:.{self.float_digits:d}g}"
-
+            results, row, col = self.translate_to_local(index.row(), index.column())
+            text, sort_value = results.cell(row, col, self.float_digits)
             if role == QtCore.Qt.ItemDataRole.DisplayRole:
-                return str(value_render)
+                return text
             elif role == SORT_ROLE:
-                # For numerical sort
-                return float(value)
+                return sort_value
 
         return None
 
@@ -212,7 +281,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
                 return str(self.horizontal_header[section])
 
             if orientation == QtCore.Qt.Orientation.Vertical:
-                return str(self.vertical_header[section])
+                return str(self.vertical_header_label(section))
         elif role == QtCore.Qt.ItemDataRole.DecorationRole:
             if orientation == QtCore.Qt.Orientation.Horizontal:
                 return self.horizontal_header_decoration(section)
@@ -224,6 +293,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     def _data_changed(self, results, r1, c1, r2, c2):
         """ Internal method to handle data changed signal """
+        self._update_header(results, r1, r2)
         rows, rows_start, columns, columns_start = \
             self._get_new_rows_columns(results, r1, c1, r2, c2)
         if rows or columns:
@@ -286,6 +356,17 @@ class PandasModelBase(QtCore.QAbstractTableModel):
     def vertical_header(self):
         return range(self.row_count)
 
+    def vertical_header_label(self, section):
+        return self.vertical_header[section]
+
+    def _reset_header(self):
+        """ Recomputes the vertical header after the tables changed """
+        pass
+
+    def _update_header(self, results, r1, r2):
+        """ Updates the vertical header with the rows r1 to r2 of a table """
+        pass
+
     def horizontal_header_decoration(self, section):
         return None
 
@@ -311,6 +392,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         for r in self.results_list:
             r.start()
             r.update_data()
+        self._reset_header()
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
         self.endResetModel()
@@ -354,7 +436,7 @@ class PandasModelByRow(PandasModelBase):
         for res in self.results_list:
             if res == results:
                 break
-            rows += results.rows
+            rows += res.rows
         return rows + row, col
 
     @property
@@ -364,13 +446,19 @@ class PandasModelByRow(PandasModelBase):
         else:
             header = []
             for r in self.results_list:
-                header.extend(r.data.index)
+                header.extend(r.index.tolist())
         return header
 
+    def vertical_header_label(self, section):
+        if self.column_index is None:
+            return section
+        results, row, _ = self.translate_to_local(section, 0)
+        return results.index[row]
+
     @property
     def horizontal_header(self):
         if self.results_list:
-            return self.results_list[0].data.columns
+            return self.results_list[0].column_names
         else:
             return []
 
@@ -416,9 +504,8 @@ class PandasModelByColumn(PandasModelBase):
         if (self.column_index is not None):
             # Remap row to matching index entry when indexing is used
             try:
-                index = self.vertical_header[row]
-                row = list(results.data.index).index(index)
-            except ValueError:
+                row = results.row_of(self.vertical_header[row])
+            except IndexError:
                 row = None
         return results, row, col - columns
 
@@ -428,14 +515,14 @@ class PandasModelByColumn(PandasModelBase):
         for res in self.results_list:
             if res == results:
                 break
-            columns += results.columns
+            columns += res.columns
         return row, col + columns
 
     @property
     def horizontal_header(self):
         size = len(self.results_list)
         if size:
-            v = list(self.results_list[0].data.columns)
+            v = list(self.results_list[0].column_names)
             return v * size
         else:
             return []
@@ -448,11 +535,28 @@ class PandasModelByColumn(PandasModelBase):
 
     @property
     def vertical_header(self):
-        header = set([])
-        for r in self.results_list:
-            header = header.union(set(r.data.index))
-        header = sorted(list(header))
-        return header
+        return self._header
+
+    def _reset_header(self):
+        self._header = []
+        self._header_values = set()
+        if self.column_index is not None:
+            for r in self.results_list:
+                self._update_header(r, 0, r.rows - 1)
+
+    def _update_header(self, results, r1, r2):
+        """ Merges the new index values of a table into the sorted union of the index values """
+        if self.column_index is None or results.index is None:
+            return
+        new = set(results.index[r1:r2 + 1].tolist()) - self._header_values
+        if not new:
+            return
+        self._header_values.update(new)
+        new = sorted(new)
+        if self._header and new[0] < self._header[-1]:
+            self._header = sorted(self._header + new)
+        else:
+            self._header.extend(new)
 
 
 class Table(QtWidgets.QTableView):
@@ -492,9 +596,19 @@ class Table(QtWidgets.QTableView):
         self.refresh_time = refresh_time
         self.check_status = check_status
         if self.refresh_time is not None:
-            self.timer = QtCore.QTimer(self)
-            self.timer.timeout.connect(self.update_tables)
-            self.timer.start(int(self.refresh_time * 1e3))
+            self.refresh_group = RefreshCoordinator.default().group(self.refresh_time)
+            self.refresh_group.register(self, self.update_tables)
+
+    @property
+    def timer(self):
+        """ The :class:`QtCore.QTimer` of the refresh ticks, shared with the other display
+        widgets of the same refresh time.
+
+        .. deprecated:: 0.15
+           Use :attr:`refresh_group` instead.
+        """
+        warn("`Table.timer` is deprecated, use `Table.refresh_group` instead.", FutureWarning)
+        return self.refresh_group.timer
 
     def setModel(self, model):
         model.float_digits = self.float_digits
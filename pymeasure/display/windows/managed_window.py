@@ -46,6 +46,7 @@ from ..widgets import (
     EstimatorWidget,
 )
 from ...experiment import Results, Procedure, unique_filename
+from ...experiment.estimator import DurationStore
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -118,6 +119,11 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         should be saved to the selected file, or not (i.e., to a temporary file instead).
     :param hide_groups: a boolean controlling whether parameter groups are hidden (True, default)
         or disabled/grayed-out (False) when the group conditions are not met.
+    :param duration_store: a :class:`~pymeasure.experiment.estimator.DurationStore`, the path of
+        its file, or :code:`True` for the default path. The durations of finished experiments are
+        recorded in it, and the :class:`~pymeasure.display.widgets.estimator_widget.EstimatorWidget`
+        shows the durations predicted from them for procedures without a :code:`get_estimates`
+        method.
 
     """
 
@@ -135,6 +141,7 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                  inputs_in_scrollarea=False,
                  enable_file_input=True,
                  hide_groups=True,
+                 duration_store=None,
                  ):
 
         super().__init__(parent)
@@ -155,8 +162,15 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.log.setLevel(log_level)
         self.widget_list = widget_list
 
+        if duration_store is True:
+            duration_store = DurationStore()
+        elif isinstance(duration_store, str):
+            duration_store = DurationStore(duration_store)
+        self.duration_store = duration_store
+
         # Check if the get_estimates function is reimplemented
         self.use_estimator = not self.procedure_class.get_estimates == Procedure.get_estimates
+        self.use_estimator = self.use_estimator or self.duration_store is not None
 
         # Validate DATA_COLUMNS fit pymeasure column header format
         Procedure.parse_columns(self.procedure_class.DATA_COLUMNS)
@@ -202,6 +216,7 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.manager = Manager(self.widget_list,
                                self.browser,
                                log_level=self.log_level,
+                               duration_store=self.duration_store,
                                parent=self)
         self.manager.abort_returned.connect(self.abort_returned)
         self.manager.queued.connect(self.queued)
@@ -665,18 +680,20 @@ class ManagedWindow(ManagedWindowBase):
     :param linewidth: linewidth for the displayed curves, default is 1
     :param log_fmt: formatting string for the log-widget
     :param log_datefmt: formatting string for the date in the log-widget
+    :param lod: number of points above which the curves are drawn decimated, about the width of
+        the plot in pixels, or None (default) to draw all points
     :param \\**kwargs: optional keyword arguments that will be passed to
         :class:`~pymeasure.display.windows.managed_window.ManagedWindowBase`
 
     """
 
     def __init__(self, procedure_class, x_axis=None, y_axis=None, linewidth=1,
-                 log_fmt=None, log_datefmt=None, **kwargs):
+                 log_fmt=None, log_datefmt=None, lod=None, **kwargs):
         self.x_axis = x_axis
         self.y_axis = y_axis
         self.log_widget = LogWidget("Experiment Log", fmt=log_fmt, datefmt=log_datefmt)
         self.plot_widget = PlotWidget("Results Graph", procedure_class.DATA_COLUMNS, self.x_axis,
-                                      self.y_axis, linewidth=linewidth)
+                                      self.y_axis, linewidth=linewidth, lod=lod)
         self.plot_widget.setMinimumSize(100, 200)
 
         if "widget_list" not in kwargs:
@@ -28,6 +28,7 @@ from .parameters import (Parameter, IntegerParameter, FloatParameter,
 from .procedure import Procedure, UnknownProcedure
 from .results import Results, unique_filename, replace_placeholders
 from .workers import Worker
+from .runner import BatchRunner
 from .listeners import Listener, Recorder
 from .config import get_config
 from .experiment import Experiment, get_array, get_array_steps, get_array_zero
@@ -0,0 +1,340 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .results import block_size
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def procedure_key(procedure_class):
+    """ Returns the key of a procedure class in a :class:`DurationStore`. """
+    return f"{procedure_class.__module__}.{procedure_class.__qualname__}"
+
+
+def parameters_key(parameters):
+    """ Returns the key of a dictionary of parameter values in a :class:`DurationStore`. """
+    return json.dumps(parameters, sort_keys=True, default=str)
+
+
+class RunTimer:
+    """ Records the timestamps of the 'results' and 'progress' emits of a running procedure,
+    from which the remaining time is estimated.
+
+    The :class:`~pymeasure.experiment.workers.Worker` owns a timer and passes every emit to
+    :meth:`record`, which costs a few attribute updates.
+
+    :cvar PROGRESS_SAMPLES: Number of the latest progress emits used for the estimate.
+    """
+
+    PROGRESS_SAMPLES = 100
+
+    def __init__(self):
+        self.started = None
+        self.stopped = None
+        self.rows = 0
+        self.emits = 0
+        self.last_result = None
+        self.progress = deque(maxlen=self.PROGRESS_SAMPLES)
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.stopped = None
+
+    def stop(self):
+        self.stopped = time.perf_counter()
+
+    def record(self, topic, record):
+        """ Records an emit of a procedure.
+
+        :param topic: The topic of the emit.
+        :param record: The emitted record.
+        """
+        if topic == 'results':
+            now = time.perf_counter()
+            size = block_size(record)
+            self.rows += 1 if size is None else size
+            self.emits += 1
+            self.last_result = now
+        elif topic == 'progress':
+            self.progress.append((time.perf_counter(), float(record)))
+
+    @property
+    def elapsed(self):
+        """ Get the time since the start in seconds, or the duration of a finished run. """
+        if self.started is None:
+            return 0.
+        end = time.perf_counter() if self.stopped is None else self.stopped
+        return end - self.started
+
+    @property
+    def row_rate(self):
+        """ Get the number of rows emitted per second. """
+        if self.last_result is None or self.last_result <= self.started:
+            return 0.
+        return self.rows / (self.last_result - self.started)
+
+    def remaining(self):
+        """ Returns the remaining time in seconds extrapolated from the progress emits, or None
+        if the progress does not increase.
+        """
+        if self.stopped is not None:
+            return 0.
+        if self.started is None:
+            return None
+        samples = np.array(self.progress) if self.progress else np.empty((0, 2))
+        samples = samples[samples[:, 1] > 0]
+        if len(samples) == 0:
+            return None
+        if len(samples) == 1:
+            stamp, progress = samples[0]
+            rate = progress / (stamp - self.started) if stamp > self.started else 0.
+        else:
+            rate = np.polyfit(samples[:, 0], samples[:, 1], 1)[0]
+            stamp, progress = samples[-1]
+        if rate <= 0:
+            return None
+        return max((100. - progress) / rate - (time.perf_counter() - stamp), 0.)
+
+
+class DurationStore:
+    """ Small local store of the durations of finished runs, per procedure class and keyed
+    by the parameter values, persisted as a JSON file.
+
+    Repeated runs with the same parameter values update a running average of their
+    duration. The store is thread-safe; it is written whenever a run is recorded.
+
+    :cvar MAX_RUNS: Maximum number of parameter sets kept per procedure class, the least
+        recently run ones are dropped.
+    :cvar AVERAGED_RUNS: Number of runs over which the duration of a parameter set is
+        averaged; later runs are weighted by an exponential moving average.
+
+    :param path: The path of the JSON file, defaults to ``~/.pymeasure/durations.json``.
+    """
+
+    MAX_RUNS = 500
+    AVERAGED_RUNS = 10
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".pymeasure", "durations.json")
+        self.path = path
+        self.version = 0
+        self._lock = threading.Lock()
+        self._procedures = {}
+        self.load()
+
+    def load(self):
+        """ Loads the store from its file, an unreadable file is ignored. """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                procedures = json.load(f)
+        except FileNotFoundError:
+            procedures = {}
+        except (OSError, ValueError):
+            log.warning("Could not read the duration store '%s'", self.path, exc_info=True)
+            procedures = {}
+        with self._lock:
+            self._procedures = procedures
+            self.version += 1
+
+    def save(self):
+        """ Writes the store to its file. """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            text = json.dumps(self._procedures, default=str)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temporary, self.path)
+
+    def record(self, procedure, duration, rows=0):
+        """ Records the duration of a finished run and saves the store.
+
+        :param procedure: The :class:`.Procedure` object which has run.
+        :param duration: The duration of the run in seconds.
+        :param rows: The number of data rows the run emitted.
+        """
+        parameters = procedure.parameter_values()
+        key = parameters_key(parameters)
+        with self._lock:
+            runs = self._procedures.setdefault(procedure_key(procedure.__class__), {})
+            entry = runs.pop(key, None)
+            if entry is None:
+                entry = {"parameters": parameters, "duration": duration, "runs": 0}
+            entry["runs"] += 1
+            entry["duration"] += (duration - entry["duration"]) / min(entry["runs"],
+                                                                      self.AVERAGED_RUNS)
+            entry["rows"] = rows
+            runs[key] = entry  # (re)inserted as the most recent entry
+            while len(runs) > self.MAX_RUNS:
+                del runs[next(iter(runs))]
+            self.version += 1
+        try:
+            self.save()
+        except OSError:
+            log.warning("Could not write the duration store '%s'", self.path, exc_info=True)
+
+    def runs(self, procedure_class):
+        """ Returns a dictionary of the recorded runs of a procedure class by parameter key,
+        each a dictionary with the 'parameters', the average 'duration' and the number of
+        'runs'. """
+        with self._lock:
+            return dict(self._procedures.get(procedure_key(procedure_class), {}))
+
+
+class DurationEstimator:
+    """ Predicts the duration of procedures from the runs recorded in a
+    :class:`DurationStore`.
+
+    The duration of a parameter set which has run before is its recorded average. Other
+    parameter sets are predicted by a power-law model, fitted by least squares to the
+    logarithms of the recorded durations and of the positive numerical parameters which
+    vary between the runs, such that durations proportional to a number of points or to a
+    delay are extrapolated. The model is refitted when the store changes; with a single
+    recorded run, its duration is used.
+
+    :param store: The :class:`DurationStore`.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._models = {}
+
+    def predict(self, procedure):
+        """ Returns the predicted duration of a procedure in seconds, or None if no run of
+        its class was recorded.
+
+        :param procedure: :class:`.Procedure` object with the parameters of the run.
+        """
+        return self.predict_parameters(procedure.__class__, procedure.parameter_values())
+
+    def predict_parameters(self, procedure_class, parameters):
+        """ Returns the predicted duration of a run of a procedure class in seconds, or None
+        if no run of the class was recorded.
+
+        :param procedure_class: The :class:`.Procedure` subclass.
+        :param parameters: Dictionary of the parameter values of the run.
+        """
+        runs, model = self._model(procedure_class)
+        entry = runs.get(parameters_key(parameters))
+        if entry is not None:
+            return entry["duration"]
+        if model is None:
+            return None
+        names, coefficients, mean = model
+        if not names:
+            return mean
+        features = [_positive(parameters.get(name)) for name in names]
+        if None in features:
+            return mean
+        return float(np.exp(coefficients[0] + np.dot(coefficients[1:], np.log(features))))
+
+    def predict_sequence(self, procedure_class, parameter_sets, length=None,
+                         base_parameters=None, samples=1000):
+        """ Returns the predicted total duration of a sequence of runs in seconds, or None
+        if no run of the class was recorded. Longer sequences are extrapolated from their
+        first `samples` parameter sets.
+
+        :param procedure_class: The :class:`.Procedure` subclass.
+        :param parameter_sets: Iterable of dictionaries of parameter values, e.g. the
+            :meth:`~pymeasure.experiment.sequencer.ParametersSequence.parameters` of a
+            sequence.
+        :param length: The number of parameter sets, defaults to ``len(parameter_sets)``.
+        :param base_parameters: Dictionary of the values of the parameters not set by the
+            sequence.
+        :param samples: Maximum number of parameter sets predicted individually.
+        """
+        if length is None:
+            length = len(parameter_sets)
+        total = 0.
+        count = 0
+        for parameters in parameter_sets:
+            if count == samples:
+                break
+            merged = dict(base_parameters or {})
+            merged.update(parameters)
+            duration = self.predict_parameters(procedure_class, merged)
+            if duration is None:
+                return None
+            total += duration
+            count += 1
+        if count == 0:
+            return 0.
+        return total * length / count
+
+    def _model(self, procedure_class):
+        key = procedure_key(procedure_class)
+        version, runs, model = self._models.get(key, (None, None, None))
+        if version != self.store.version:
+            runs = self.store.runs(procedure_class)
+            model = self.fit(list(runs.values()))
+            self._models[key] = (self.store.version, runs, model)
+        return runs, model
+
+    @staticmethod
+    def fit(entries):
+        """ Fits the power-law model to recorded runs and returns the names of the fitted
+        parameters, the coefficients (intercept first) and the mean duration, or None
+        without runs.
+
+        :param entries: List of the dictionaries of recorded runs (see
+            :meth:`DurationStore.runs`).
+        """
+        durations = np.array([entry["duration"] for entry in entries], dtype=float)
+        if len(durations) == 0:
+            return None
+        mean = float(durations.mean())
+        if len(durations) < 2 or np.any(durations <= 0):
+            return [], None, mean
+        names = []
+        columns = []
+        for name in entries[0]["parameters"]:
+            values = [_positive(entry["parameters"].get(name)) for entry in entries]
+            if None in values or len(set(values)) < 2:
+                continue
+            names.append(name)
+            columns.append(np.log(values))
+        if not names:
+            return [], None, mean
+        design = np.column_stack([np.ones(len(durations))] + columns)
+        coefficients = np.linalg.lstsq(design, np.log(durations), rcond=None)[0]
+        return names, coefficients, mean
+
+
+def _positive(value):
+    """ Returns a positive numerical value as float, otherwise None. """
+    if isinstance(value, bool) or not isinstance(value, (int, float, np.number)):
+        return None
+    return float(value) if value > 0 else None
@@ -23,8 +23,12 @@
 #
 
 import logging
-from logging import StreamHandler, FileHandler
+from logging import StreamHandler
+from queue import Empty
+from threading import Thread
+from time import time
 
+from .results import Results
 from ..log import QueueListener
 from ..thread import StoppableThread
 
@@ -93,27 +97,109 @@ class Listener(StoppableThread):
             self.__class__.__name__, self.port, self.topic, self.should_stop())
 
 
-class Recorder(QueueListener):
-    """ Recorder loads the initial Results for a filepath and
-    appends data by listening for it over a queue. The queue
-    ensures that no data is lost between the Recorder and Worker.
+class Recorder(Thread):
+    """ Recorder appends the data emitted by a Worker to the data files of a
+    Results object.
+
+    Records are formatted when they are handled and put on the queue, which
+    ensures that no data is lost between the Recorder and Worker. The
+    recorder thread drains the queue in batches, writes them through a large
+    buffer and flushes the files when the time or row budget since the last
+    flush is exhausted, as well as when the Recorder is stopped.
+
+    :cvar FLUSH_INTERVAL: Maximum time in seconds before written data is flushed
+    :cvar FLUSH_ROWS: Maximum number of rows written before the data is flushed
+    :cvar BUFFER_SIZE: Size of the file buffers in bytes
     """
 
-    def __init__(self, results, queue, **kwargs):
+    FLUSH_INTERVAL = 0.1
+    FLUSH_ROWS = 10000
+    BUFFER_SIZE = 2 ** 20
+
+    def __init__(self, results, queue, flush_interval=None, flush_rows=None, buffer_size=None):
         """ Constructs a Recorder to record the Procedure data into
-        the file path, by waiting for data on the subscription port
-        """
-        handlers = []
-        for filename in results.data_filenames:
-            fh = FileHandler(filename=filename, **kwargs)
-            fh.setFormatter(results.formatter)
-            fh.setLevel(logging.NOTSET)
-            handlers.append(fh)
+        the data files of the results, by waiting for data on the queue
 
-        super().__init__(queue, *handlers)
+        :param results: Results object whose data files are written
+        :param queue: Queue on which the formatted records are passed
+        :param flush_interval: Overrides :attr:`FLUSH_INTERVAL`
+        :param flush_rows: Overrides :attr:`FLUSH_ROWS`
+        :param buffer_size: Overrides :attr:`BUFFER_SIZE`
+        """
+        super().__init__(daemon=True)
+        self.results = results
+        self.queue = queue
+        self.formatter = results.formatter
+        self.flush_interval = self.FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.flush_rows = self.FLUSH_ROWS if flush_rows is None else flush_rows
+        self.buffer_size = self.BUFFER_SIZE if buffer_size is None else buffer_size
+        self._terminator = b"" if self.formatter.BINARY else "\n"
+
+    def handle(self, record):
+        """ Formats a record, or a block of records, and queues it for writing """
+        self.handle_converted(*self.formatter.convert(record))
+
+    def handle_converted(self, columns, size):
+        """ Formats the values of a record, or of a block of records, which have been converted
+        by :meth:`~pymeasure.experiment.results.CSVFormatter.convert`, and queues them for
+        writing
+        """
+        self.queue.put((self.formatter.format_converted(columns, size) + self._terminator,
+                        1 if size is None else size))
 
     def stop(self):
-        for handler in self.handlers:
-            handler.close()
-
-        super().stop()
+        """ Writes and flushes all queued data, closes the files and waits
+        for the recorder thread to finish
+        """
+        self.queue.put(None)
+        if self.is_alive():
+            self.join()
+
+    def _open(self, filename):
+        if self.formatter.BINARY:
+            return open(filename, "ab", buffering=self.buffer_size)
+        return open(filename, "a", buffering=self.buffer_size, encoding=Results.ENCODING)
+
+    def _get_batch(self, timeout):
+        """ Returns the queued items, waiting at most timeout for the first one """
+        try:
+            batch = [self.queue.get(timeout=timeout)]
+        except Empty:
+            return []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except Empty:
+                return batch
+
+    def run(self):
+        files = [self._open(filename) for filename in self.results.data_filenames]
+        stopped = False
+        pending_rows = 0
+        last_flush = time()
+        try:
+            while not stopped:
+                # Without pending data, there is nothing to flush and no need to wake up
+                timeout = None
+                if pending_rows:
+                    timeout = max(self.flush_interval - (time() - last_flush), 0)
+                batch = self._get_batch(timeout)
+                if None in batch:
+                    stopped = True
+                    batch = batch[:batch.index(None)]
+                if batch:
+                    data = self._terminator[:0].join(chunk for chunk, _ in batch)
+                    for f in files:
+                        f.write(data)
+                    pending_rows += sum(rows for _, rows in batch)
+                if pending_rows and (stopped or pending_rows >= self.flush_rows or
+                                     time() - last_flush >= self.flush_interval):
+                    for f in files:
+                        f.flush()
+                    pending_rows = 0
+                    last_flush = time()
+        except Exception:
+            log.exception("Recorder failed to write the data")
+        finally:
+            for f in files:
+                f.close()
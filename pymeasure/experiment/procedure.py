@@ -55,9 +55,19 @@ class Procedure:
 
     If keyword arguments are provided, they are added to the object as
     attributes.
+
+    The :attr:`DATA_FORMAT` selects how the :class:`.Results` store the data:
+    "csv" for text files or "binary" for rows of packed float64 values,
+    which avoids the text conversion for high-rate acquisitions.
+
+    The :attr:`RESOURCES` name the hardware resources (e.g. VISA resource names) which the
+    procedure uses. Procedures declaring resources are run one at a time by the
+    :class:`~pymeasure.experiment.runner.BatchRunner`.
     """
 
     DATA_COLUMNS = []
+    DATA_FORMAT = "csv"
+    RESOURCES = ()
     MEASURE = {}
     FINISHED, FAILED, ABORTED, QUEUED, RUNNING = 0, 1, 2, 3, 4
     STATUS_STRINGS = {
@@ -23,15 +23,20 @@
 #
 
 from decimal import Decimal
+import io
+import json
 import logging
 import os
 import re
+import struct
 import sys
+import threading
 from importlib import import_module
 from importlib.machinery import SourceFileLoader
 from datetime import datetime
 from string import Formatter
 
+import numpy as np
 import pandas as pd
 import pint
 
@@ -118,9 +123,33 @@ def unique_filename(directory, prefix='DATA', suffix='', ext='csv',
     return filename
 
 
+def block_size(record):
+    """ Returns the number of rows of a block of records, or None for a single record.
+
+    A block is a :class:`pandas.DataFrame` or a dictionary with equal-length arrays as values,
+    scalar values of such a dictionary are used for all its rows.
+
+    :param record: a record (dictionary) or block of records emitted as results.
+    """
+    if isinstance(record, pd.DataFrame):
+        return len(record)
+    if not isinstance(record, dict):
+        return None
+    sizes = {len(value) for value in record.values()
+             if not isinstance(value, (str, int, float, Decimal)) and np.ndim(value) > 0}
+    if not sizes:
+        return None
+    if len(sizes) > 1:
+        raise ValueError("The arrays of a block of records must have the same length, not %s"
+                         % sorted(sizes))
+    return sizes.pop()
+
+
 class CSVFormatter(logging.Formatter):
     """ Formatter of data results """
 
+    BINARY = False
+
     def __init__(self, columns, delimiter=','):
         """Creates a csv formatter for a given list of columns (=header).
 
@@ -135,59 +164,304 @@ class CSVFormatter(logging.Formatter):
         self.delimiter = delimiter
 
     def format(self, record):
-        """Formats a record as csv.
+        """Formats a record, or a block of records (see :func:`block_size`), as csv.
 
         :param record: record to format.
         :type record: dict
         :return: a string
         """
-        line = []
+        return self.format_converted(*self.convert(record))
+
+    def convert(self, record):
+        """Converts the values of a record, or of a block of records, to the columns' units.
+
+        :param record: record, or block of records, to convert.
+        :return: tuple of the list with the converted value (or array of a block) of each column
+            and the number of rows of a block, or None for a single record.
+        """
+        size = block_size(record)
+        if size is not None:
+            return self.convert_block(record, size), size
+        return [self.convert_value(x, record.get(x, float("nan"))) for x in self.columns], None
+
+    def format_converted(self, columns, size):
+        """Formats the values returned by :meth:`convert` as csv.
+
+        :param columns: list with the converted value, or array of a block, of each column.
+        :param size: number of rows of a block, or None for a single record.
+        :return: a string
+        """
+        if size is not None:
+            columns = [[str(column)] * size if np.ndim(column) == 0 else map(str, column.tolist())
+                       for column in columns]
+            return "\n".join(self.delimiter.join(line) for line in zip(*columns))
+        return self.delimiter.join(f"{value}" for value in columns)
+
+    def convert_block(self, block, size):
+        """Converts the columns of a block of records to the columns' units.
+
+        :param block: :class:`pandas.DataFrame` or dictionary of arrays.
+        :param size: number of rows of the block.
+        :return: list with a converted array, or scalar, for each column.
+        """
+        columns = []
         for x in self.columns:
-            value = record.get(x, float("nan"))
-            if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
-                line.append(f"{value}")
+            values = block.get(x, float("nan"))
+            if isinstance(values, str) or np.ndim(values) == 0:
+                columns.append(self.convert_value(x, values))
             else:
-                units = self.units.get(x, None)
-                if units is not None:
-                    if isinstance(value, str):
-                        try:
-                            value = ureg.Quantity(value)
-                        except pint.UndefinedUnitError:
-                            log.warning(
-                                f"Value {value} for column {x} cannot be parsed to"
-                                f" unit {units}.")
-                    if isinstance(value, pint.Quantity):
-                        try:
-                            line.append(f"{value.m_as(units)}")
-                        except pint.DimensionalityError:
-                            line.append("nan")
-                            log.warning(
-                                f"Value {value} for column {x} does not have the "
-                                f"right unit {units}.")
-                    elif isinstance(value, bool):
-                        line.append("nan")
-                        log.warning(
-                            f"Boolean for column {x} does not have unit {units}.")
-                    else:
-                        line.append("nan")
-                        log.warning(
-                            f"Value {value} for column {x} does not have the right"
-                            f" type for unit {units}.")
-                else:
-                    if isinstance(value, pint.Quantity):
-                        if value.units == ureg.dimensionless:
-                            line.append(f"{value.magnitude}")
-                        else:
-                            self.units[x] = value.to_base_units().units
-                            line.append(f"{value.m_as(self.units[x])}")
-                            log.info(f"Column {x} units was set to {self.units[x]}")
-                    else:
-                        line.append(f"{value}")
-        return self.delimiter.join(line)
+                columns.append(self.convert_array(x, values))
+        return columns
+
+    def convert_array(self, x, values):
+        """Converts the array of values of a column to the column's units.
+
+        :param x: name of the column.
+        :param values: array-like with the values to convert.
+        :return: numpy array with the converted values.
+        """
+        if isinstance(values, pint.Quantity):
+            units = self.units.get(x, None)
+            if units is None:
+                if values.units == ureg.dimensionless:
+                    return np.asarray(values.magnitude)
+                self.units[x] = units = values.to_base_units().units
+                log.info(f"Column {x} units was set to {self.units[x]}")
+            try:
+                return np.asarray(values.m_as(units))
+            except pint.DimensionalityError:
+                log.warning(
+                    f"Values {values} for column {x} do not have the right unit {units}.")
+                return np.full(len(values), float("nan"))
+        values = np.asarray(values)
+        if values.dtype.kind in "iuf" or (values.dtype.kind == "b" and x not in self.units):
+            return values
+        return np.array([self.convert_value(x, value) for value in values.tolist()],
+                        dtype=object)
+
+    def convert_value(self, x, value):
+        """Converts the value of a column to the column's units.
+
+        :param x: name of the column.
+        :param value: value to convert.
+        :return: the converted value, or NaN if it cannot be converted.
+        """
+        if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
+            return value
+        units = self.units.get(x, None)
+        if units is not None:
+            if isinstance(value, str):
+                try:
+                    value = ureg.Quantity(value)
+                except pint.UndefinedUnitError:
+                    log.warning(
+                        f"Value {value} for column {x} cannot be parsed to"
+                        f" unit {units}.")
+            if isinstance(value, pint.Quantity):
+                try:
+                    return value.m_as(units)
+                except pint.DimensionalityError:
+                    log.warning(
+                        f"Value {value} for column {x} does not have the "
+                        f"right unit {units}.")
+            elif isinstance(value, bool):
+                log.warning(
+                    f"Boolean for column {x} does not have unit {units}.")
+            else:
+                log.warning(
+                    f"Value {value} for column {x} does not have the right"
+                    f" type for unit {units}.")
+            return float("nan")
+        if isinstance(value, pint.Quantity):
+            if value.units == ureg.dimensionless:
+                return value.magnitude
+            self.units[x] = value.to_base_units().units
+            log.info(f"Column {x} units was set to {self.units[x]}")
+            return value.m_as(self.units[x])
+        return value
 
     def format_header(self):
         return self.delimiter.join(self.columns)
 
+    def parse_data(self, chunk, columns=None):
+        """Parses the complete lines of a chunk of a data file.
+
+        :param chunk: bytes read from the data file.
+        :param columns: list of column names. If None, the chunk starts at the beginning of the
+            file and the column names are read from its labels line.
+        :return: tuple of a :class:`pandas.DataFrame` with the parsed rows and the number of
+            bytes consumed.
+        """
+        # A trailing incomplete line is left in the file until it is finished
+        chunk = chunk[:chunk.rfind(b"\n") + 1]
+        if not chunk.strip():
+            return None, 0
+        if columns is None:
+            frame = pd.read_csv(io.BytesIO(chunk), comment=Results.COMMENT,
+                                sep=self.delimiter, encoding=Results.ENCODING)
+        else:
+            frame = pd.read_csv(io.BytesIO(chunk), comment=Results.COMMENT, header=None,
+                                names=columns, sep=self.delimiter, encoding=Results.ENCODING)
+        return frame, len(chunk)
+
+
+class BinaryFormatter(CSVFormatter):
+    """ Formatter of data results as packed binary rows.
+
+    Each value is converted as by :class:`CSVFormatter` and stored as a little-endian float64,
+    values which cannot be represented as a float are stored as NaN. The file header is the same
+    as for csv files, with the column labels stored as a JSON list in a comment line, such that
+    the data can be appended to and read from the file without any text conversion.
+    """
+
+    BINARY = True
+    DTYPE = np.dtype("<f8")
+    FORMAT_LINE = "Format: binary float64"
+    COLUMNS_LINE = "Columns: "
+
+    def __init__(self, columns):
+        super().__init__(columns)
+        self._struct = struct.Struct("<%dd" % len(columns))
+
+    def format_converted(self, columns, size):
+        """Formats the values returned by :meth:`convert` as packed binary rows.
+
+        :param columns: list with the converted value, or array of a block, of each column.
+        :param size: number of rows of a block, or None for a single record.
+        :return: bytes
+        """
+        if size is not None:
+            rows = np.empty((size, len(self.columns)), dtype=self.DTYPE)
+            for i, column in enumerate(columns):
+                try:
+                    rows[:, i] = column
+                except (TypeError, ValueError):
+                    rows[:, i] = [self._float(value) for value in np.broadcast_to(column, size)]
+            return rows.tobytes()
+        return self._struct.pack(*map(self._float, columns))
+
+    @staticmethod
+    def _float(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float("nan")
+
+    def format_header(self):
+        return Results.COMMENT + self.COLUMNS_LINE + json.dumps(self.columns)
+
+    def parse_data(self, chunk, columns=None):
+        """Parses the complete rows of a chunk of a data file.
+
+        :param chunk: bytes read from the data file.
+        :param columns: list of column names. If None, the chunk starts at the beginning of the
+            file and the column names are read from its header.
+        :return: tuple of a :class:`pandas.DataFrame` with the parsed rows and the number of
+            bytes consumed.
+        """
+        start = 0
+        if columns is None:
+            marker = (Results.COMMENT + self.COLUMNS_LINE).encode(Results.ENCODING)
+            position = chunk.find(marker)
+            end = chunk.find(b"\n", position)
+            if position == -1 or end == -1:
+                return None, 0
+            columns = json.loads(chunk[position + len(marker):end].decode(Results.ENCODING))
+            start = end + 1
+        row_size = len(columns) * self.DTYPE.itemsize
+        rows = (len(chunk) - start) // row_size
+        values = np.frombuffer(chunk, dtype=self.DTYPE, count=rows * len(columns), offset=start)
+        frame = pd.DataFrame(values.reshape(rows, len(columns)), columns=columns)
+        return frame, start + rows * row_size
+
+
+class ColumnBuffer:
+    """ Append-only, column-wise storage of tabular data.
+
+    Each column is kept in a preallocated NumPy array, whose capacity is doubled whenever it
+    is exhausted. Appending rows is therefore amortized O(new rows) and :meth:`frame` returns a
+    :class:`pandas.DataFrame` of views onto the stored rows without copying them.
+
+    :param columns: list of column names; if None, they are taken from the first appended frame
+    :param capacity: number of rows allocated initially
+    """
+
+    def __init__(self, columns=None, capacity=1000):
+        self.columns = None if columns is None else list(columns)
+        self._capacity = max(int(capacity), 1)
+        self._arrays = {}
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def append(self, frame):
+        """ Appends the rows of a :class:`pandas.DataFrame` to the buffer.
+
+        Columns missing in `frame` are filled with NaN. Column dtypes are promoted (e.g. from
+        integer to float, or to object for strings) when new rows require it.
+
+        :param frame: :class:`pandas.DataFrame` with the rows to append
+        """
+        if self.columns is None:
+            self.columns = list(frame.columns)
+        count = len(frame)
+        self.append_columns([frame[name].to_numpy() if name in frame else np.nan
+                             for name in self.columns], count)
+
+    def append_columns(self, values, count):
+        """ Appends rows given column-wise to the buffer.
+
+        :param values: list with an array of `count` values, or a scalar used for all rows,
+            for each of the :attr:`columns`
+        :param count: number of rows to append
+        """
+        if count == 0:
+            return
+        end = self._length + count
+        if end > self._capacity:
+            self._capacity = max(end, 2 * self._capacity)
+            for name, array in self._arrays.items():
+                self._arrays[name] = self._resized(array, array.dtype)
+        for name, column in zip(self.columns, values):
+            dtype = np.asarray(column).dtype
+            if dtype.kind in "SU":
+                dtype = np.dtype(object)
+            array = self._arrays.get(name)
+            if array is None:
+                array = self._resized(np.empty(0, dtype=dtype), dtype)
+            elif not np.can_cast(dtype, array.dtype, casting="safe"):
+                array = self._resized(array, self._promote(array.dtype, dtype))
+            array[self._length:end] = column
+            self._arrays[name] = array
+        self._length = end
+
+    def frame(self):
+        """ Returns a :class:`pandas.DataFrame` of the stored rows, sharing memory with the
+        buffer.
+        """
+        if self.columns is None:
+            return pd.DataFrame()
+        if not self._arrays:
+            return pd.DataFrame(columns=self.columns)
+        length = self._length
+        return pd.DataFrame({name: self._arrays[name][:length] for name in self.columns},
+                            copy=False)
+
+    def _resized(self, array, dtype):
+        """ Returns a copy of `array` with the current capacity and the given dtype """
+        new = np.empty(self._capacity, dtype=dtype)
+        if dtype == object:
+            new[:] = None
+        new[:self._length] = array[:self._length]
+        return new
+
+    @staticmethod
+    def _promote(old, new):
+        if old.kind in "biuf" and new.kind in "biuf":
+            return np.result_type(old, new)
+        return np.dtype(object)
+
 
 class Results:
     """ The Results class provides a convenient interface to reading and
@@ -196,11 +470,19 @@ class Results:
     :cvar COMMENT: The character used to identify a comment (default: #)
     :cvar DELIMITER: The character used to delimit the data (default: ,)
     :cvar LINE_BREAK: The character used for line breaks (default \\n)
-    :cvar CHUNK_SIZE: The length of the data chuck that is read
+    :cvar CHUNK_SIZE: The number of rows for which the data columns are initially allocated
+
+    :cvar FORMATTERS: Dictionary of the available data formats and their formatters
 
     :param procedure: Procedure object
     :param data_filename: The data filename where the data is or should be
                           stored
+    :param data_format: The format of the data file, a key of :attr:`FORMATTERS`. Defaults to
+                        the :attr:`~.Procedure.DATA_FORMAT` of the procedure ("csv").
+
+    While a procedure is running, its data can be collected in memory as well
+    (see :meth:`start_live_data`), such that :attr:`data` is served without reading the
+    data file.
     """
 
     COMMENT = '#'
@@ -208,8 +490,9 @@ class Results:
     LINE_BREAK = "\n"
     CHUNK_SIZE = 1000
     ENCODING = "utf-8"
+    FORMATTERS = {"csv": CSVFormatter, "binary": BinaryFormatter}
 
-    def __init__(self, procedure, data_filename):
+    def __init__(self, procedure, data_filename, data_format=None):
         if not isinstance(procedure, Procedure):
             raise ValueError("Results require a Procedure object")
         self.procedure = procedure
@@ -217,8 +500,20 @@ class Results:
         self.parameters = procedure.parameter_objects()
         self._header_count = -1
         self._metadata_count = -1
-
-        self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS)
+        self._data = None
+        self._data_buffer = None
+        self._data_offset = 0  # byte position up to which the data file has been parsed
+        self._live = None
+        self._live_lock = threading.Lock()
+        self._emitted = False  # whether records have been passed to append_converted
+
+        if data_format is None:
+            data_format = self.procedure.DATA_FORMAT
+        if data_format not in self.FORMATTERS:
+            raise ValueError("Data format '%s' is not one of %s" % (
+                data_format, list(self.FORMATTERS)))
+        self.data_format = data_format
+        self.formatter = self.FORMATTERS[data_format](columns=self.procedure.DATA_COLUMNS)
 
         if isinstance(data_filename, (list, tuple)):
             data_filenames, data_filename = data_filename, data_filename[0]
@@ -234,10 +529,13 @@ class Results:
             # TODO: Correctly store and retrieve status
         else:
             for filename in self.data_filenames:
-                with open(filename, 'w', encoding=Results.ENCODING) as f:
-                    f.write(self.header())
-                    f.write(self.labels())
-            self._data = None
+                if self.formatter.BINARY:
+                    with open(filename, 'wb') as f:
+                        f.write((self.header() + self.labels()).encode(Results.ENCODING))
+                else:
+                    with open(filename, 'w', encoding=Results.ENCODING) as f:
+                        f.write(self.header())
+                        f.write(self.labels())
 
     def __getstate__(self):
         # Get all information needed to reconstruct procedure
@@ -251,10 +549,13 @@ class Results:
         state = self.__dict__.copy()
         del state['procedure']
         del state['procedure_class']
+        del state['_live_lock']
+        state['_live'] = None
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        self._live_lock = threading.Lock()
 
         # Restore the procedure
         module = SourceFileLoader(self._module, self._file).load_module()
@@ -277,6 +578,8 @@ class Results:
         can be reconstructed
         """
         h = []
+        if self.formatter.BINARY:
+            h.append(self.formatter.FORMAT_LINE)
         procedure = re.search("'(?P<name>[^']+)'",
                               repr(self.procedure_class)).group("name")
         h.append("Procedure: <%s>" % procedure)
@@ -330,14 +633,26 @@ class Results:
             return
 
         for filename in self.data_filenames:
-            with open(filename, 'r+', encoding=Results.ENCODING) as f:
-                contents = f.readlines()
-                contents.insert(self._header_count - 1, c_header)
+            if self.formatter.BINARY:
+                with open(filename, 'rb+') as f:
+                    contents = f.read()
+                    position = 0
+                    for _ in range(self._header_count - 1):
+                        position = contents.index(b"\n", position) + 1
+
+                    f.seek(position)
+                    f.write(c_header.encode(Results.ENCODING) + contents[position:])
+            else:
+                with open(filename, 'r+', encoding=Results.ENCODING) as f:
+                    contents = f.readlines()
+                    contents.insert(self._header_count - 1, c_header)
 
-                f.seek(0)
-                f.writelines(contents)
+                    f.seek(0)
+                    f.writelines(contents)
 
         self._header_count += self._metadata_count
+        # The file was rewritten in front of the data, so the byte position is invalid
+        self._reset_data()
 
     @staticmethod
     def parse_header(header, procedure_class=None):
@@ -415,72 +730,151 @@ class Results:
         header = ""
         header_read = False
         header_count = 0
-        with open(data_filename, "r", encoding=Results.ENCODING) as f:
+        data_format = "csv"
+        with open(data_filename, "rb") as f:
             while not header_read:
-                line = f.readline()
-                if line.startswith(Results.COMMENT):
+                line = f.readline().decode(Results.ENCODING)
+                if line.startswith(Results.COMMENT + BinaryFormatter.FORMAT_LINE):
+                    data_format = "binary"
+                if (data_format == "binary" and
+                        line.startswith(Results.COMMENT + BinaryFormatter.COLUMNS_LINE)):
+                    header_read = True
+                elif line.startswith(Results.COMMENT):
                     header += line.strip('\t\v\n\r\f') + Results.LINE_BREAK
                     header_count += 1
                 else:
                     header_read = True
         procedure = Results.parse_header(header[:-1], procedure_class)
-        results = Results(procedure, data_filename)
+        results = Results(procedure, data_filename, data_format=data_format)
         results._header_count = header_count
         return results
 
     @property
     def data(self):
-        # Need to update header count for correct referencing
-        if self._header_count == -1:
-            self._header_count = len(
-                self.header()[-1].split(Results.LINE_BREAK))
-        if self._data is None or len(self._data) == 0:
-            # Data has not been read
-            try:
-                self.reload()
-            except Exception:
-                # Empty dataframe
-                self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
-        else:  # Concatenate additional data, if any, to already loaded data
-            skiprows = len(self._data) + self._header_count
-            chunks = pd.read_csv(
-                self.data_filename,
-                comment=Results.COMMENT,
-                header=0,
-                names=self._data.columns,
-                chunksize=Results.CHUNK_SIZE,
-                skiprows=skiprows,
-                iterator=True,
-                encoding=Results.ENCODING,
-            )
-            try:
-                tmp_frame = pd.concat(chunks, ignore_index=True)
-                # only append new data if there is any
-                # if no new data, tmp_frame dtype is object, which override's
-                # self._data's original dtype - this can cause problems plotting
-                # (e.g. if trying to plot int data on a log axis)
-                if len(tmp_frame) > 0:
-                    self._data = pd.concat([self._data, tmp_frame],
-                                           ignore_index=True)
-            except Exception:
-                pass  # All data is up to date
+        """ A :class:`pandas.DataFrame` with the data of the file.
+
+        Only the bytes appended to the file since the previous access are read and parsed, such
+        that the cost of an update depends on the amount of new data only. While the data is
+        collected in memory (see :meth:`start_live_data`), the collected rows are returned and
+        the file is not read.
+        """
+        live = self._live
+        if live is not None:
+            with self._live_lock:
+                return live.frame()
+        try:
+            self._read_new_data()
+        except Exception:
+            log.debug("Could not read new data from '%s'", self.data_filename, exc_info=True)
+        if self._data is None:
+            # Empty dataframe
+            self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
         return self._data
 
+    @property
+    def data_stamp(self):
+        """ A value which changes whenever data is added, much cheaper to get than
+        :attr:`data`: the number of rows collected in memory, or else the size of the data file.
+        """
+        live = self._live
+        if live is not None:
+            return "rows", len(live)
+        try:
+            return "bytes", os.path.getsize(self.data_filename)
+        except OSError:
+            return None
+
+    @property
+    def live(self):
+        """ Whether the data is collected in memory, see :meth:`start_live_data`. """
+        return self._live is not None
+
+    def start_live_data(self):
+        """ Starts collecting the records passed to :meth:`append_data` in memory.
+
+        The :class:`~pymeasure.experiment.workers.Worker` passes each emitted record, or block
+        of records, to :meth:`append_data`. While live, :attr:`data` returns a
+        :class:`pandas.DataFrame` of the collected rows (sharing memory with them), so that
+        following a running procedure costs O(new rows) and does not re-read the data file.
+        Rows already stored in the data file are taken over.
+
+        Has to be called before the worker emits records: the worker writes to the data file
+        through a queue, such that rows emitted earlier might not be in the file yet.
+
+        :raises RuntimeError: if records have already been passed to :meth:`append_data`.
+        """
+        with self._live_lock:
+            if self._live is not None:
+                return
+            if self._emitted:
+                raise RuntimeError("Live data has to be started before records are emitted")
+            buffer = ColumnBuffer(self.procedure.DATA_COLUMNS, capacity=Results.CHUNK_SIZE)
+            data = self.data
+            if len(data) > 0:
+                buffer.append(data)
+            self._live = buffer
+
+    def stop_live_data(self):
+        """ Stops collecting data in memory, :attr:`data` is read from the data file again. """
+        with self._live_lock:
+            self._live = None
+
+    def append_data(self, record):
+        """ Appends a record, or a block of records (see :func:`block_size`), to the data
+        collected in memory. The values are converted to the units of the columns as they are
+        for the data file. Does nothing unless :attr:`live`.
+
+        :param record: dictionary of a record or a block of records.
+        """
+        if self._live is not None:
+            self.append_converted(*self.formatter.convert(record))
+        else:
+            self._emitted = True
+
+    def append_converted(self, columns, size):
+        """ Appends the values of a record, or of a block of records, which have been converted
+        by :meth:`CSVFormatter.convert`, to the data collected in memory. Does nothing unless
+        :attr:`live`.
+
+        :param columns: list with the converted value, or array of a block, of each column.
+        :param size: number of rows of a block, or None for a single record.
+        """
+        with self._live_lock:
+            self._emitted = True
+            if self._live is not None:
+                self._live.append_columns(columns, 1 if size is None else size)
+
     def reload(self):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
         """
-        chunks = pd.read_csv(
-            self.data_filename,
-            comment=Results.COMMENT,
-            chunksize=Results.CHUNK_SIZE,
-            iterator=True,
-            encoding=Results.ENCODING,
-        )
-        try:
-            self._data = pd.concat(chunks, ignore_index=True)
-        except Exception:
-            self._data = chunks.read()
+        self._reset_data()
+        self._read_new_data()
+
+    def _reset_data(self):
+        self._data = None
+        self._data_buffer = None
+        self._data_offset = 0
+
+    def _read_new_data(self):
+        """ Parses the data appended to the data file since the last read and adds it to the
+        data.
+        """
+        with open(self.data_filename, "rb") as f:
+            f.seek(self._data_offset)
+            chunk = f.read()
+        columns = None if self._data_buffer is None else self._data_buffer.columns
+        frame, consumed = self.formatter.parse_data(chunk, columns)
+        if frame is None:
+            return
+        if self._data_buffer is None:
+            self._data_buffer = ColumnBuffer(frame.columns, capacity=Results.CHUNK_SIZE)
+        self._data_offset += consumed
+        # if no new data, frame dtype is object, which would override the original dtype
+        # - this can cause problems plotting (e.g. if trying to plot int data on a log axis)
+        if len(frame) > 0 or self._data is None:
+            self._data_buffer.append(frame)
+            self._data = self._data_buffer.frame()
 
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
@@ -0,0 +1,237 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .procedure import Procedure
+from .results import Results, unique_filename
+from .workers import Worker
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+_resource_locks = {}
+_resource_locks_lock = threading.Lock()
+
+
+def resource_lock(name):
+    """ Returns the lock of a hardware resource, which is shared by all
+    :class:`BatchRunner` objects of the process.
+
+    :param name: Name of the resource, e.g. a VISA resource name.
+    """
+    with _resource_locks_lock:
+        if name not in _resource_locks:
+            _resource_locks[name] = threading.Lock()
+        return _resource_locks[name]
+
+
+class RunReport:
+    """ Summary of a single run of a :class:`BatchRunner`.
+
+    :param filename: The data file of the run.
+    :param status: The final status of the procedure, e.g. :attr:`.Procedure.FINISHED`.
+    :param rows: The number of data rows emitted.
+    :param duration: The duration of the run in seconds.
+    :param error: The error message if the run could not be executed.
+    """
+
+    def __init__(self, filename, status, rows=0, duration=0., error=None):
+        self.filename = filename
+        self.status = status
+        self.rows = rows
+        self.duration = duration
+        self.error = error
+
+    @property
+    def finished(self):
+        return self.status == Procedure.FINISHED
+
+    def __repr__(self):
+        return "<{}(filename={!r},status={},rows={},duration={:.3g})>".format(
+            self.__class__.__name__, self.filename,
+            Procedure.STATUS_STRINGS.get(self.status, self.status), self.rows, self.duration)
+
+
+class BatchReport:
+    """ Aggregate report of the runs of a :class:`BatchRunner`.
+
+    :param runs: List of :class:`RunReport` objects in the order of the parameter sets.
+    :param duration: The wall-clock duration of the batch in seconds.
+    """
+
+    def __init__(self, runs, duration):
+        self.runs = runs
+        self.duration = duration
+
+    @property
+    def failed(self):
+        """ Get the reports of the runs which did not finish. """
+        return [run for run in self.runs if not run.finished]
+
+    @property
+    def rows(self):
+        """ Get the total number of data rows of all runs. """
+        return sum(run.rows for run in self.runs)
+
+    @property
+    def throughput(self):
+        """ Get the number of runs per second. """
+        return len(self.runs) / self.duration if self.duration > 0 else float('inf')
+
+    @property
+    def row_rate(self):
+        """ Get the number of data rows per second. """
+        return self.rows / self.duration if self.duration > 0 else float('inf')
+
+    @property
+    def speedup(self):
+        """ Get the ratio of the summed run durations to the wall-clock duration. """
+        busy = sum(run.duration for run in self.runs)
+        return busy / self.duration if self.duration > 0 else 1.
+
+    def __str__(self):
+        return ("{} runs ({} failed) in {:.3g} s: {:.3g} runs/s, {:.3g} rows/s, "
+                "speedup {:.2f}").format(len(self.runs), len(self.failed), self.duration,
+                                         self.throughput, self.row_rate, self.speedup)
+
+
+def run_results(results):
+    """ Runs the procedure of a :class:`.Results` object to completion in the current
+    thread and returns a :class:`RunReport`. This is the task executed by the processes
+    of a :class:`BatchRunner`.
+
+    :param results: :class:`.Results` object of the procedure to run.
+    """
+    start = time.perf_counter()
+    worker = Worker(results)
+    worker.run()
+    # the run timer of the worker counts the emitted rows
+    return RunReport(results.data_filename, results.procedure.status, worker.timer.rows,
+                     time.perf_counter() - start)
+
+
+class BatchRunner:
+    """ Runs a procedure for a list of parameter sets in a pool of processes,
+    without any graphical interface.
+
+    Each run writes its own data file. Procedures which declare
+    :attr:`~.Procedure.RESOURCES` are run one at a time, holding the locks of their
+    resources (see :func:`resource_lock`), as they share hardware; all other runs are
+    executed concurrently.
+
+    .. code-block:: python
+
+        runner = BatchRunner(SimulationProcedure, directory="data", max_workers=4)
+        report = runner.run([{'iterations': 100, 'delay': 0.01},
+                             {'iterations': 200, 'delay': 0.01}])
+        print(report)
+
+    The parameter sets of a sequence are obtained with
+    :meth:`SequenceHandler.parameters_sequence
+    <pymeasure.experiment.sequencer.SequenceHandler.parameters_sequence>`, whose
+    ``names_map`` maps the parameter names to the attribute names of the procedure.
+
+    :param procedure_class: The :class:`.Procedure` subclass to run.
+    :param directory: The directory of the data files.
+    :param prefix: The prefix of the data filenames, which may contain placeholders of the
+        parameters (see :func:`.unique_filename`).
+    :param data_format: The format of the data files, defaults to the
+        :attr:`~.Procedure.DATA_FORMAT` of the procedure.
+    :param max_workers: The number of processes, defaults to the number of processors.
+    :param mp_context: The :mod:`multiprocessing` context of the process pool.
+    """
+
+    def __init__(self, procedure_class, directory='.', prefix='DATA', data_format=None,
+                 max_workers=None, mp_context=None):
+        self.procedure_class = procedure_class
+        self.directory = directory
+        self.prefix = prefix
+        self.data_format = data_format
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+
+    @property
+    def serialized(self):
+        """ Get whether the runs are serialized as the procedure uses hardware resources. """
+        return bool(self.procedure_class.RESOURCES)
+
+    def make_results(self, parameters):
+        """ Returns a :class:`.Results` object with a new data file for a parameter set.
+
+        :param parameters: Dictionary of parameter values by attribute name.
+        """
+        procedure = self.procedure_class()
+        procedure.set_parameters(parameters)
+        procedure.refresh_parameters()
+        if self.data_format is None:
+            data_format = procedure.DATA_FORMAT
+        else:
+            data_format = self.data_format
+        ext = "csv" if data_format == "csv" else "dat"
+        # The data file is created here, such that the filenames of the batch are unique
+        filename = unique_filename(self.directory, prefix=self.prefix, ext=ext,
+                                   procedure=procedure)
+        return Results(procedure, filename, data_format=data_format)
+
+    def run(self, parameters_sets):
+        """ Runs the procedure for each parameter set and returns a :class:`BatchReport`.
+
+        :param parameters_sets: Iterable of dictionaries of parameter values by attribute
+            name.
+        """
+        results = [self.make_results(parameters) for parameters in parameters_sets]
+        start = time.perf_counter()
+        workers = 1 if self.serialized else self.max_workers
+        with ProcessPoolExecutor(max_workers=workers, mp_context=self.mp_context) as pool:
+            if self.serialized:
+                runs = [self._run_locked(pool, r) for r in results]
+            else:
+                futures = [pool.submit(run_results, r) for r in results]
+                runs = [self._report(future, r) for future, r in zip(futures, results)]
+        report = BatchReport(runs, time.perf_counter() - start)
+        log.info("%s: %s", self.procedure_class.__name__, report)
+        return report
+
+    def _run_locked(self, pool, results):
+        # Sorted acquisition avoids deadlocks between runners sharing several resources
+        locks = [resource_lock(name) for name in sorted(set(self.procedure_class.RESOURCES))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            return self._report(pool.submit(run_results, results), results)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    @staticmethod
+    def _report(future, results):
+        try:
+            return future.result()
+        except Exception as exc:
+            log.exception("Run of %s could not be executed", results.data_filename)
+            return RunReport(results.data_filename, Procedure.FAILED, error=repr(exc))
@@ -24,7 +24,6 @@
 
 import logging
 import re
-from itertools import product
 
 import numpy as np
 
@@ -352,74 +351,237 @@ class SequenceHandler:
 
         file_obj.write("\n".join(str(item) for item in self._sequences))
 
-    def parameters_sequence(self, names_map=None):
+    def parameters_sequence(self, names_map=None, lazy=False):
         """
         Generate a list of parameters from the sequence tree.
 
+        The expressions are evaluated right away, such that evaluation errors are raised by
+        this method, but with `lazy` the parameter settings themselves are not expanded:
+        a :class:`ParametersSequence` generates them on iteration, and provides their number
+        and a structured array of them without building the list.
+
         :param names_map: an optional dict to map parameter name
-        :return: A list of dictionaries. Each dictionary represents a parameters setting
+        :param lazy: whether to return a :class:`ParametersSequence` instead of a list.
+        :return: A list of tuples of dictionaries. Each tuple represents a parameters setting
         for running an experiment.
         """
 
-        sequences = []
-        current_sequence = [[] for i in range(self.MAXDEPTH)]
-        temp_sequence = [[] for i in range(self.MAXDEPTH)]
-
-        idx = 0
-        while (idx < len(self._sequences)):
-            depth, parameter, seq = self._sequences[idx].level, \
-                self._sequences[idx].parameter, \
-                self._sequences[idx].expression
-            values = self.eval_string(seq, parameter, depth)
+        roots = []
+        stack = []
+        for item in self._sequences:
+            depth, parameter = item.level, item.parameter
+            values = self.eval_string(item.expression, parameter, depth)
             if names_map is not None:
                 parameter = names_map[parameter]
-
-            try:
-                sequence_entry = [{parameter: value} for value in values]
-            except TypeError:
+            if values.ndim == 0:
                 log.error(
                     "TypeError, likely no sequence for one of the parameters"
                 )
+                values = values[np.newaxis][:0]
+
+            node = SequenceNode(parameter, values)
+            del stack[depth:]
+            if depth == 0:
+                roots.append(node)
+            elif depth == len(stack):
+                stack[-1].children.append(node)
             else:
-                current_sequence[depth].extend(sequence_entry)
+                raise SequenceEvaluationError("Invalid sequence: level missing ?")
+            stack.append(node)
 
-            idx += 1
-            next_depth = -1 if idx >= len(self._sequences) else self._sequences[idx].level
-
-            for depth_idx in range(depth, next_depth, -1):
-                temp_sequence[depth_idx].extend(current_sequence[depth_idx])
-
-                if depth_idx != 0:
-                    sequence_products = list(product(
-                        current_sequence[depth_idx - 1],
-                        temp_sequence[depth_idx]
-                    ))
-
-                    for i in range(len(sequence_products)):
-                        try:
-                            element = sequence_products[i][1]
-                        except IndexError:
-                            log.error(
-                                "IndexError, likely empty nested parameter"
-                            )
-                        else:
-                            if isinstance(element, tuple):
-                                sequence_products[i] = (
-                                    sequence_products[i][0], *element)
-
-                    temp_sequence[depth_idx - 1].extend(sequence_products)
-                    temp_sequence[depth_idx] = []
-
-                current_sequence[depth_idx] = []
-                current_sequence[depth_idx - 1] = []
-
-            if depth == next_depth:
-                temp_sequence[depth].extend(current_sequence[depth])
-                current_sequence[depth] = []
-
-        sequences = temp_sequence[0]
-
-        for idx in range(len(sequences)):
-            if not isinstance(sequences[idx], tuple):
-                sequences[idx] = (sequences[idx],)
-        return sequences
+        sequence = ParametersSequence(roots)
+        if lazy:
+            return sequence
+        return list(sequence)
+
+
+class SequenceNode:
+    """ Node of an evaluated sequence tree: a parameter, its values and the nodes of the
+    parameters nested in it.
+
+    :param parameter: The parameter name.
+    :param values: :class:`numpy.ndarray` of the values of the parameter.
+    """
+
+    def __init__(self, parameter, values):
+        self.parameter = parameter
+        self.values = values
+        self.children = []
+
+    def __len__(self):
+        """ Number of parameter settings generated by this node. """
+        if not self.children:
+            return len(self.values)
+        return len(self.values) * sum(len(child) for child in self.children)
+
+    def __iter__(self):
+        if not self.children:
+            for value in self.values:
+                yield ({self.parameter: value},)
+            return
+        for value in self.values:
+            head = {self.parameter: value}
+            for child in self.children:
+                for entry in child:
+                    yield (head, *entry)
+
+    def __getitem__(self, index):
+        if not self.children:
+            return ({self.parameter: self.values[index]},)
+        value_index, index = divmod(index, sum(len(child) for child in self.children))
+        child, index = _locate(self.children, index)
+        return ({self.parameter: self.values[value_index]}, *child[index])
+
+    def columns(self):
+        """ Returns the number of settings and a dict of the parameter columns as tuples of
+        values and presence masks (None if present in every setting).
+        """
+        if not self.children:
+            return len(self.values), {self.parameter: (self.values, None)}
+        count, child_columns = _concatenate([child.columns() for child in self.children])
+        repeats = len(self.values)
+        columns = {self.parameter: (np.repeat(self.values, count, axis=0), None)}
+        for name, (values, present) in child_columns.items():
+            values = np.tile(values, (repeats,) + (1,) * (values.ndim - 1))
+            if present is not None:
+                present = np.tile(present, repeats)
+                if name == self.parameter:  # the nested value takes precedence
+                    outer = columns[name][0]
+                    mask = present.reshape((-1,) + (1,) * (values.ndim - 1))
+                    values, present = np.where(mask, values, outer), None
+            columns[name] = (values, present)
+        return repeats * count, columns
+
+
+class ParametersSequence:
+    """ Lazily generated parameter settings of a sequence tree, as returned by
+    :meth:`SequenceHandler.parameters_sequence` with `lazy=True`.
+
+    Iterating yields the same tuples of single-parameter dictionaries as the list form, one
+    at a time. The number of settings (``len``), the :attr:`shape` and indexing are computed
+    from the tree without expanding it.
+
+    :param roots: List of the :class:`SequenceNode` objects of the top level.
+    """
+
+    def __init__(self, roots):
+        self.roots = roots
+        self._length = sum(len(root) for root in roots)
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def names(self):
+        """ Get the parameter names in order of appearance. """
+        names = {}
+        nodes = list(self.roots)
+        while nodes:
+            node = nodes.pop(0)
+            names[node.parameter] = None
+            nodes[:0] = node.children
+        return list(names)
+
+    @property
+    def shape(self):
+        """ Get the number of parameter settings and of parameters. """
+        return self._length, len(self.names)
+
+    def __iter__(self):
+        for root in self.roots:
+            yield from root
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("sequence index out of range")
+        root, index = _locate(self.roots, index)
+        return root[index]
+
+    def parameters(self):
+        """ Generates a dictionary of the parameter values for each setting, in which the
+        values of nested parameters take precedence. """
+        for entry in self:
+            parameters = {}
+            for item in entry:
+                parameters.update(item)
+            yield parameters
+
+    def to_array(self):
+        """ Returns the parameter settings as a :class:`numpy.ndarray` with a structured
+        dtype, which has a field for each parameter.
+
+        Values are stored with the (common) dtype of the parameter values. Settings without
+        a value of a parameter are filled with NaN (integer and boolean parameters are
+        converted to float for this), an empty string or None.
+        """
+        count, columns = _concatenate([root.columns() for root in self.roots])
+        fields = []
+        for name, (values, present) in columns.items():
+            if present is not None:
+                values = _fill_missing(values, present)
+            columns[name] = values
+            fields.append((name, values.dtype, values.shape[1:]))
+        array = np.empty(count, dtype=fields)
+        for name, values in columns.items():
+            array[name] = values
+        return array
+
+
+def _locate(nodes, index):
+    """ Returns the node of a list of nodes which generates the setting at index, and the
+    index within that node. """
+    for node in nodes:
+        length = len(node)
+        if index < length:
+            return node, index
+        index -= length
+    raise IndexError("sequence index out of range")
+
+
+def _concatenate(blocks):
+    """ Concatenates blocks of columns (see :meth:`SequenceNode.columns`) along the
+    settings, marking the values missing in a block. """
+    count = sum(size for size, _ in blocks)
+    names = {}
+    for _, columns in blocks:
+        for name, (values, _) in columns.items():
+            names.setdefault(name, values)
+    concatenated = {}
+    for name, example in names.items():
+        parts, masks, complete = [], [], True
+        for size, columns in blocks:
+            if name in columns:
+                values, present = columns[name]
+                masks.append(np.ones(size, dtype=bool) if present is None else present)
+                complete = complete and present is None
+            else:
+                values = np.zeros((size,) + example.shape[1:], dtype=example.dtype)
+                masks.append(np.zeros(size, dtype=bool))
+                complete = False
+            parts.append(values)
+        values = np.concatenate(parts) if parts else example[:0]
+        concatenated[name] = (values, None if complete else np.concatenate(masks))
+    return count, concatenated
+
+
+def _fill_missing(values, present):
+    """ Returns values with the settings which are not present filled with a missing
+    value suited to the dtype. """
+    kind = values.dtype.kind
+    if kind in "iub":
+        values = values.astype(float)
+        kind = "f"
+    if kind in "fc":
+        missing = np.nan
+    elif kind in "US":
+        missing = ""
+    else:
+        values = values.astype(object)
+        missing = None
+    values = values.copy()
+    values[~present] = missing
+    return values
@@ -27,9 +27,10 @@ import time
 import traceback
 from queue import Queue
 
+from .estimator import RunTimer
 from .listeners import Recorder
 from .procedure import Procedure
-from .results import Results
+from .results import Results, block_size
 from ..thread import StoppableThread
 
 log = logging.getLogger(__name__)
@@ -48,9 +49,15 @@ class Worker(StoppableThread):
     """ Worker runs the procedure and emits information about
     the procedure and its status over a ZMQ TCP port. In a child
     thread, a Recorder is run to write the results to
+
+    The :attr:`timer` (a :class:`~pymeasure.experiment.estimator.RunTimer`) records the
+    timestamps of the emitted results and progress. If a
+    :class:`~pymeasure.experiment.estimator.DurationStore` is given, the duration of a
+    finished run is recorded in it for estimating the duration of later runs.
     """
 
-    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
+    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None,
+                 duration_store=None):
         """ Constructs a Worker to perform the Procedure
         defined in the file at the filepath
         """
@@ -72,6 +79,9 @@ class Worker(StoppableThread):
         self.log_queue = log_queue
         self.log_level = log_level
 
+        self.timer = RunTimer()
+        self.duration_store = duration_store
+
         global log
         log = logging.getLogger()
         log.setLevel(self.log_level)
@@ -104,7 +114,15 @@ class Worker(StoppableThread):
             super().join(0)
 
     def emit(self, topic, record):
-        """ Emits data of some topic over TCP """
+        """ Emits data of some topic over TCP
+
+        A 'results' record can also be a block of records (see
+        :func:`~pymeasure.experiment.results.block_size`), which is written to
+        the file and published as a single message. If the results collect
+        their data in memory (see :meth:`Results.start_live_data
+        <pymeasure.experiment.results.Results.start_live_data>`), the record is
+        appended to it as well.
+        """
         log.debug("Emitting message: %s %s", topic, record)
 
         try:
@@ -114,8 +132,13 @@ class Worker(StoppableThread):
             )
         except (NameError, AttributeError):
             pass  # No dumps defined
+        self.timer.record(topic, record)
         if topic == 'results':
-            self.recorder.handle(record)
+            if block_size(record) != 0:
+                # convert once for the file and the data in memory
+                converted = self.results.formatter.convert(record)
+                self.recorder.handle_converted(*converted)
+                self.results.append_converted(*converted)
         elif topic == 'status' or topic == 'progress':
             self.monitor_queue.put((topic, record))
 
@@ -141,7 +164,12 @@ class Worker(StoppableThread):
         elif self.procedure.status == Procedure.RUNNING:
             self.update_status(Procedure.FINISHED)
             self.emit('progress', 100.)
+        self.timer.stop()
+        if self.duration_store is not None and self.procedure.status == Procedure.FINISHED:
+            self.duration_store.record(self.procedure, self.timer.elapsed, self.timer.rows)
 
+        if self.recorder.ident is None:
+            self.recorder.start()  # write the data emitted before a failure
         self.recorder.stop()
         self.monitor_queue.put(None)
         if self.context is not None:
@@ -157,7 +185,6 @@ class Worker(StoppableThread):
         self.procedure = self.results.procedure
 
         self.recorder = Recorder(self.results, self.recorder_queue)
-        self.recorder.start()
 
         # locals()[self.procedures_file] = __import__(self.procedures_file)
 
@@ -166,6 +193,7 @@ class Worker(StoppableThread):
         self.procedure.emit = self.emit
 
         log.info("Worker started running an instance of %r", self.procedure.__class__.__name__)
+        self.timer.start()
         self.update_status(Procedure.RUNNING)
         self.emit('progress', 0.)
 
@@ -173,6 +201,9 @@ class Worker(StoppableThread):
             self.procedure.startup()
             self.procedure.evaluate_metadata()
             self.results.store_metadata()
+            # The metadata rewrites the data files, so the recorder starts appending afterwards.
+            # The data emitted before is queued until then.
+            self.recorder.start()
             self.procedure.execute()
         except (KeyboardInterrupt, SystemExit):
             self.handle_abort()
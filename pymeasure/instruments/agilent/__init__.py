@@ -22,16 +22,20 @@
 # THE SOFTWARE.
 #
 
-from .agilent8257D import Agilent8257D
-from .agilent8722ES import Agilent8722ES
-from .agilentE4408B import AgilentE4408B
-from .agilentE4980 import AgilentE4980
-from .agilent34410A import Agilent34410A
-from .agilent34450A import Agilent34450A
-from .agilent4156 import Agilent4156
-from .agilent4294A import Agilent4294A
-from .agilent33220A import Agilent33220A
-from .agilent33500 import Agilent33500
-from .agilent33521A import Agilent33521A
-from .agilentB1500 import AgilentB1500
-from .agilent4284A import Agilent4284A
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "agilent8257D": ["Agilent8257D"],
+    "agilent8722ES": ["Agilent8722ES"],
+    "agilentE4408B": ["AgilentE4408B"],
+    "agilentE4980": ["AgilentE4980"],
+    "agilent34410A": ["Agilent34410A"],
+    "agilent34450A": ["Agilent34450A"],
+    "agilent4156": ["Agilent4156"],
+    "agilent4294A": ["Agilent4294A"],
+    "agilent33220A": ["Agilent33220A"],
+    "agilent33500": ["Agilent33500"],
+    "agilent33521A": ["Agilent33521A"],
+    "agilentB1500": ["AgilentB1500"],
+    "agilent4284A": ["Agilent4284A"],
+})
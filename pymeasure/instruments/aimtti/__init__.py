@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .aimttiPL import PL068P, PL155P, PL303P, PL601P, PL303QMDP, PL303QMTP
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "aimttiPL": ["PL068P", "PL155P", "PL303P", "PL601P", "PL303QMDP", "PL303QMTP"],
+})
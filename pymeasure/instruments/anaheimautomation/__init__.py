@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .dpseriesmotorcontroller import DPSeriesMotorController
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "dpseriesmotorcontroller": ["DPSeriesMotorController"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .anc300 import ANC300Controller
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "anc300": ["ANC300Controller"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .bkprecision9130b import BKPrecision9130B
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "bkprecision9130b": ["BKPrecision9130B"],
+})
@@ -24,7 +24,7 @@
 
 import logging
 
-from .common_base import CommonBase
+from .common_base import CommonBase, _threaded
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -60,6 +60,34 @@ class Channel(CommonBase):
         """
         return command.format_map({self.placeholder: self.id})
 
+    # Batches and property cache
+    def batch(self, separator=";", max_commands=None):
+        """Return a :class:`~pymeasure.instruments.common_base.Batch` of the parent, which
+        sends the property accesses within the context as a single message.
+
+        :param separator: Separator of the commands in a message and of the replies.
+        :param max_commands: Maximum number of commands per message, None for no limit.
+        """
+        return self.parent.batch(separator=separator, max_commands=max_commands)
+
+    def _get_batch(self):
+        return self.parent._get_batch()
+
+    def _root_command(self, command):
+        return self.parent._root_command(self.insert_id(command))
+
+    def _get_cache(self):
+        return self.parent._get_cache()
+
+    @property
+    def async_adapter(self):
+        """Get the asynchronous adapter of the parent."""
+        return self.parent.async_adapter
+
+    def transaction(self):
+        """Return the transaction context manager of the parent."""
+        return self.parent.transaction()
+
     # Calls to the instrument
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
@@ -131,6 +159,24 @@ class Channel(CommonBase):
         """
         return self.parent.check_set_errors()
 
+    async def acheck_get_errors(self):
+        """Check for errors after having gotten a property in an asynchronous batch.
+
+        :return: List of error entries.
+        """
+        if _threaded(self.async_adapter):
+            return await super().acheck_get_errors()
+        return await self.parent.acheck_get_errors()
+
+    async def acheck_set_errors(self):
+        """Check for errors after having set a property in an asynchronous batch.
+
+        :return: List of error entries.
+        """
+        if _threaded(self.async_adapter):
+            return await super().acheck_set_errors()
+        return await self.parent.acheck_set_errors()
+
     # Communication functions
     def wait_for(self, query_delay=None):
         """Wait for some time. Used by 'ask' to wait before reading.
@@ -22,13 +22,29 @@
 # THE SOFTWARE.
 #
 
+from concurrent.futures import Future, InvalidStateError
+from contextlib import nullcontext
+from functools import wraps
 from inspect import getmembers
 import logging
+import threading
 from warnings import warn
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+_batches_lock = threading.Lock()
+
+
+def _threaded(adapter):
+    """Return whether `adapter` is a :class:`~pymeasure.adapters.ThreadedAdapter`.
+
+    The asynchronous adapters (and asyncio) are imported at their first use only, as importing
+    them takes considerable time.
+    """
+    from ..adapters.asynchronous import ThreadedAdapter
+    return isinstance(adapter, ThreadedAdapter)
+
 
 class DynamicProperty(property):
     """ Class that allows managing python property behaviour in a "dynamic" fashion
@@ -92,20 +108,327 @@ class DynamicProperty(property):
         self.name = name
 
 
+class BatchFuture(Future):
+    """Future for the value of a property, which is read within a :class:`Batch`.
+
+    The value is available after the batch has been sent. Requesting the :meth:`result`
+    earlier sends the commands collected so far. If the batch does not hold the command of
+    the future anymore, e.g. because it has been discarded, :meth:`result` raises an
+    :class:`~concurrent.futures.InvalidStateError` instead of waiting.
+
+    :param batch: The :class:`Batch` which will provide the value.
+    """
+
+    def __init__(self, batch):
+        super().__init__()
+        self._batch = batch
+
+    def result(self, timeout=None):
+        if not self.done():
+            if not self._batch._holds(self):
+                raise InvalidStateError("The batch holds no command for this future.")
+            self._batch.send()
+        return super().result(timeout)
+
+
+class Batch:
+    """Context manager, which collects property accesses and sends them as a single message.
+
+    Create it with :meth:`CommonBase.batch`. Within the context, the getters of
+    :meth:`CommonBase.control` properties return a :class:`BatchFuture` and the setters are
+    queued. When the context is left, the commands are joined with `separator` and sent
+    to the instrument with a single :meth:`~CommonBase.ask` (or :meth:`~CommonBase.write`, if
+    there are only setters). The reply is split at `separator` and each part is processed
+    like the reply of the individual property.
+
+    .. code-block:: python
+
+        with instrument.batch():
+            voltage = instrument.voltage  # a BatchFuture
+            instrument.current = 0.1
+            frequency = instrument.ch_A.frequency
+        print(voltage.result(), frequency.result())
+
+    Used with :code:`async with`, the batch is sent with :meth:`asend` instead. Do not
+    await anything else within the context, as other tasks accessing properties of the
+    instrument in the meantime would add them to the batch.
+
+    The batch collects the property accesses of the thread which entered the context only,
+    other threads communicate with the instrument as usual.
+
+    For SCPI instruments, a colon is prepended to each further command (except common
+    commands like :code:`*IDN?`) such that it is interpreted from the root of the
+    command tree.
+
+    Only properties are collected, other methods like :meth:`~CommonBase.write` communicate
+    immediately. Properties with `values_kwargs` are not batched either: the commands
+    collected so far are sent and the property is read as usual. In an asynchronous batch,
+    they are queued and sent as a message of their own.
+
+    The errors of properties with `check_get_errors` or `check_set_errors` are checked after
+    sending a message, in an asynchronous batch with the coroutines
+    :meth:`~CommonBase.acheck_get_errors` and :meth:`~CommonBase.acheck_set_errors`.
+
+    :param instrument: Instrument which sends the messages.
+    :param separator: Separator of the commands in a message and of the replies.
+    :param max_commands: Maximum number of commands per message, None for no limit.
+    """
+
+    def __init__(self, instrument, separator=";", max_commands=None):
+        self.instrument = instrument
+        self.separator = separator
+        self.max_commands = max_commands
+        self._entries = []
+        self._sending = []  # entries of the messages being sent
+        self._previous = None
+        self.asynchronous = False
+
+    def __enter__(self):
+        self._previous = self.instrument._set_batch(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrument._set_batch(self._previous)
+        if exc_type is None:
+            self.send()
+        else:
+            self.cancel()
+        return False
+
+    async def __aenter__(self):
+        self.asynchronous = True
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.instrument._set_batch(self._previous)
+        if exc_type is None:
+            await self.asend()
+        else:
+            self.cancel()
+        return False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def query(self, owner, command, process, check_errors=False, ask_kwargs=None):
+        """Queue a query and return a :class:`BatchFuture` for its processed reply.
+
+        :param owner: Instrument or channel which queues the command.
+        :param command: Command as it is sent to the instrument.
+        :param process: Callable which returns the value for the reply string.
+        :param check_errors: Call `owner.check_get_errors` after sending the message.
+        :param ask_kwargs: Keyword arguments for :meth:`~CommonBase.ask`. If given, the query
+            is sent as a message of its own.
+        """
+        future = BatchFuture(self)
+        self._entries.append((command, owner, check_errors, future, process, ask_kwargs))
+        return future
+
+    def write(self, owner, command, check_errors=False):
+        """Queue a command which does not return a reply.
+
+        :param owner: Instrument or channel which queues the command.
+        :param command: Command as it is sent to the instrument.
+        :param check_errors: Call `owner.check_set_errors` after sending the message.
+        """
+        self._entries.append((command, owner, check_errors, None, None, None))
+
+    def cancel(self):
+        """Discard the queued commands, cancel their futures and invalidate the values cached
+        by their setters."""
+        entries, self._entries = self._entries, []
+        self._discard(entries)
+
+    @staticmethod
+    def _discard(entries):
+        """Cancel the futures and invalidate the values cached by the setters of `entries`."""
+        for command, owner, check_errors, future, process, ask_kwargs in entries:
+            if future is None:
+                owner.invalidate_cache()
+            else:
+                future.cancel()
+
+    def _holds(self, future):
+        """Return whether the command of `future` is queued or being sent."""
+        return any(entry[3] is future for entry in self._entries + self._sending)
+
+    def _chunks(self, entries):
+        """Return `entries` split into the messages to send."""
+        chunks = [[]]
+        for entry in entries:
+            if entry[5] is not None:
+                chunks.extend([[entry], []])
+            elif len(chunks[-1]) == self.max_commands:
+                chunks.append([entry])
+            else:
+                chunks[-1].append(entry)
+        return [chunk for chunk in chunks if chunk]
+
+    def send(self):
+        """Send the queued commands and resolve the futures.
+
+        If a message fails, the futures of the following messages are cancelled.
+        """
+        entries, self._entries = self._entries, []
+        if not entries:
+            return
+        chunks = self._chunks(entries)
+        self._sending.extend(entries)
+        try:
+            for index, chunk in enumerate(chunks):
+                try:
+                    self._send(chunk)
+                except Exception:
+                    for later in chunks[index + 1:]:
+                        self._discard(later)
+                    raise
+        finally:
+            sent = set(map(id, entries))
+            self._sending = [entry for entry in self._sending if id(entry) not in sent]
+
+    async def asend(self):
+        """Send the queued commands with the asynchronous adapter of the instrument and resolve
+        the futures.
+
+        If a message fails, the futures of the following messages are cancelled.
+        """
+        adapter = self.instrument.async_adapter
+        if _threaded(adapter):
+            await adapter.run(self.send)
+            return
+        entries, self._entries = self._entries, []
+        if not entries:
+            return
+        chunks = self._chunks(entries)
+        self._sending.extend(entries)
+        try:
+            for index, chunk in enumerate(chunks):
+                try:
+                    await self._asend(chunk)
+                except Exception:
+                    for later in chunks[index + 1:]:
+                        self._discard(later)
+                    raise
+        finally:
+            sent = set(map(id, entries))
+            self._sending = [entry for entry in self._sending if id(entry) not in sent]
+
+    def _join(self, commands):
+        from .generic_types import SCPIMixin
+        scpi = getattr(self.instrument, "SCPI", False) or isinstance(self.instrument, SCPIMixin)
+        commands = [command.rstrip(self.separator) for command in commands]
+        if scpi:
+            commands[1:] = [c if c.startswith((":", "*")) else ":" + c for c in commands[1:]]
+        return self.separator.join(commands)
+
+    def _send(self, entries):
+        message, queries = self._prepare(entries)
+        try:
+            if queries:
+                reply = self.instrument.ask(message, **(entries[0][5] or {}))
+                replies = self._split(reply, message, queries)
+            else:
+                self.instrument.write(message)
+                replies = []
+            self._check_errors(entries, message)
+        except Exception as exc:
+            self._fail(entries, queries, exc)
+            raise
+        self._resolve(queries, replies)
+
+    async def _asend(self, entries):
+        message, queries = self._prepare(entries)
+        try:
+            if queries:
+                reply = await self.instrument.aask(message, **(entries[0][5] or {}))
+                replies = self._split(reply, message, queries)
+            else:
+                await self.instrument.awrite(message)
+                replies = []
+            await self._acheck_errors(entries, message)
+        except Exception as exc:
+            self._fail(entries, queries, exc)
+            raise
+        self._resolve(queries, replies)
+
+    def _prepare(self, entries):
+        """Return the message and the query entries of `entries`."""
+        message = self._join([entry[0] for entry in entries])
+        return message, [entry for entry in entries if entry[3] is not None]
+
+    def _split(self, reply, message, queries):
+        replies = reply.strip().split(self.separator)
+        if len(replies) != len(queries):
+            raise ValueError(f"Expected {len(queries)} replies to '{message}', "
+                             f"received '{self.separator.join(replies)}'.")
+        return replies
+
+    def _fail(self, entries, queries, exc):
+        for entry in queries:
+            entry[3].set_exception(exc)
+        self._discard(entries)
+
+    @staticmethod
+    def _resolve(queries, replies):
+        for (command, owner, check_errors, future, process, ask_kwargs), reply in zip(queries,
+                                                                                      replies):
+            try:
+                future.set_result(process(reply))
+            except Exception as exc:
+                future.set_exception(exc)
+
+    @staticmethod
+    def _checks(entries, asynchronous=False):
+        """Return the error checks of the owners of `entries`."""
+        checks = []
+        for command, owner, check_errors, future, process, ask_kwargs in entries:
+            if check_errors:
+                if asynchronous:
+                    check = owner.acheck_set_errors if future is None else owner.acheck_get_errors
+                else:
+                    check = owner.check_set_errors if future is None else owner.check_get_errors
+                if check not in checks:
+                    checks.append(check)
+        return checks
+
+    @staticmethod
+    def _log_errors(errors, message):
+        errors = [str(error) for error in errors]
+        if errors:
+            log.error(f"Error received after sending the batch '{message}': "
+                      f"""'{"', '".join(errors)}'.""")
+
+    def _check_errors(self, entries, message):
+        for check in self._checks(entries):
+            self._log_errors(check(), message)
+
+    async def _acheck_errors(self, entries, message):
+        for check in self._checks(entries, asynchronous=True):
+            self._log_errors(await check(), message)
+
+
 class CommonBase:
     """Base class for instruments and channels.
 
     This class contains everything needed for pymeasure's property creator
     :meth:`control` and its derivatives :meth:`measurement` and :meth:`setting`.
 
+    Property values may be cached, see the `cache` parameter of :meth:`control` and
+    :attr:`cache_properties`. The cache is invalidated by :meth:`invalidate_cache`, which
+    is called after any `reset` or `clear` method.
+
     :param preprocess_reply: An optional callable used to preprocess
         strings received from the instrument. The callable returns the
         processed string.
 
         .. deprecated:: 0.11
             Implement it in the instrument's `read` method instead.
+
+    :cvar cache_properties: Cache the values of properties, whose `cache` parameter is None.
     """
 
+    cache_properties = False
+
     # Variable holding the list of DynamicProperty parameters that are configurable
     # by users
     _fget_params_list = ('get_command',
@@ -126,6 +449,37 @@ class CommonBase:
     # Prefix used to store reserved variables
     __reserved_prefix = "___"
 
+    # Thread local storage of the active Batch collecting the property accesses of a thread
+    _batches = None
+
+    # Dictionary of cached property values
+    _property_cache = None
+
+    # Whether `cache_properties` has been enabled anywhere, such that properties look it up
+    # only if necessary
+    _cache_requested = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Invalidate the property cache after the `reset` and `clear` methods."""
+        super().__init_subclass__(**kwargs)
+        if cls.cache_properties:
+            CommonBase._cache_requested = True
+        for name in ("reset", "clear"):
+            method = getattr(cls, name, None)
+            if callable(method) and not getattr(method, "_invalidates_cache", False):
+                setattr(cls, name, CommonBase._invalidating(method))
+
+    @staticmethod
+    def _invalidating(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.invalidate_cache()
+        wrapper._invalidates_cache = True
+        return wrapper
+
     def __init__(self, preprocess_reply=None, **kwargs):
         self._special_names = self._setup_special_names()
         self._create_channels()
@@ -284,6 +638,8 @@ class CommonBase:
         if hasattr(self, '_special_names'):
             if name in self._special_names:
                 name = self.__reserved_prefix + name
+        if name == "cache_properties" and value:
+            CommonBase._cache_requested = True
         super().__setattr__(name, value)
 
     def __getattribute__(self, name):
@@ -365,7 +721,67 @@ class CommonBase:
             del collection[child.id]
         delattr(self, child._name)
 
+    # Batches
+    def batch(self, separator=";", max_commands=None):
+        """Return a :class:`Batch` context manager, which sends the property accesses
+        within the context as a single message.
+
+        :param separator: Separator of the commands in a message and of the replies.
+        :param max_commands: Maximum number of commands per message, None for no limit.
+        """
+        return Batch(self, separator=separator, max_commands=max_commands)
+
+    def _get_batch(self):
+        """Return the :class:`Batch` active in the current thread or None."""
+        if self._batches is None:
+            return None
+        return getattr(self._batches, "batch", None)
+
+    def _set_batch(self, batch):
+        """Activate `batch` (or None) in the current thread and return the previous batch."""
+        if self._batches is None:
+            with _batches_lock:
+                if self._batches is None:
+                    self._batches = threading.local()
+        previous = getattr(self._batches, "batch", None)
+        self._batches.batch = batch
+        return previous
+
+    def _root_command(self, command):
+        """Return the command as the instrument sends it, e.g. with inserted channel ids."""
+        return command
+
+    # Property cache
+    def _get_cache(self):
+        """Return the dictionary of cached property values."""
+        if self._property_cache is None:
+            self._property_cache = {}
+        return self._property_cache
+
+    def invalidate_cache(self, *names):
+        """Invalidate cached property values, such that they are read from the device again.
+
+        :param names: Names of the properties to invalidate. If none are given, all properties
+            of this instance (and of its channels, if it is the instrument) are invalidated.
+        """
+        cache = self._get_cache()
+        if names:
+            for name in names:
+                cache.pop((self, getattr(type(self), name).fget), None)
+        elif cache is self._property_cache:
+            cache.clear()
+        else:
+            for key in [key for key in cache if key[0] is self]:
+                del cache[key]
+
     # Communication functions
+    def transaction(self):
+        """Return a context manager to hold while a message is written and its reply read,
+        which :meth:`ask` and :meth:`binary_values` use to keep other threads sharing the
+        connection from interleaving messages. Implement in subclass.
+        """
+        return nullcontext()
+
     def wait_for(self, query_delay=None):
         """Wait for some time. Used by 'ask' to wait before reading.
 
@@ -382,9 +798,10 @@ class CommonBase:
         :param query_delay: Delay between writing and reading in seconds.
         :returns: String returned by the device without read_termination.
         """
-        self.write(command)
-        self.wait_for(query_delay)
-        return self.read()
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read()
 
     def values(self, command, separator=',', cast=float, preprocess_reply=None, maxsplit=-1,
                **kwargs):
@@ -403,7 +820,12 @@ class CommonBase:
         :param \\**kwargs: Keyword arguments to be passed to the :meth:`ask` method.
         :returns: A list of the desired type, or strings where the casting fails.
         """
-        results = self.ask(command, **kwargs).strip()
+        return self._parse_values(self.ask(command, **kwargs), separator=separator, cast=cast,
+                                  preprocess_reply=preprocess_reply, maxsplit=maxsplit)
+
+    def _parse_values(self, reply, separator=',', cast=float, preprocess_reply=None, maxsplit=-1):
+        """Return the list of values contained in the `reply` string, see :meth:`values`."""
+        results = reply.strip()
         if callable(preprocess_reply):
             results = preprocess_reply(results)
         elif callable(self.preprocess_reply):
@@ -429,9 +851,104 @@ class CommonBase:
         :param kwargs: Arguments for :meth:`~pymeasure.Adapter.read_binary_values`.
         :returns: NumPy array of values.
         """
-        self.write(command)
-        self.wait_for(query_delay)
-        return self.read_binary_values(**kwargs)
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read_binary_values(**kwargs)
+
+    # Asynchronous communication
+    async def awrite(self, command):
+        """Write a string command to the instrument without blocking the event loop.
+
+        With a :class:`~pymeasure.adapters.ThreadedAdapter` (the default for blocking
+        adapters, see `async_adapter`), :meth:`write` is called in the thread of the adapter.
+
+        :param command: Command string to be sent to the instrument.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            await adapter.run(self.write, command)
+        else:
+            await adapter.awrite(self._root_command(command))
+
+    async def aread(self):
+        """Read a string from the instrument without blocking the event loop.
+
+        :returns: String returned by the device without read_termination.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            return await adapter.run(self.read)
+        return await adapter.aread()
+
+    async def aask(self, command, query_delay=None):
+        """Write a command to the instrument and return the read response without blocking
+        the event loop.
+
+        :param command: Command string to be sent to the instrument.
+        :param query_delay: Delay between writing and reading in seconds.
+        :returns: String returned by the device without read_termination.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            if query_delay is None:
+                return await adapter.run(self.ask, command)
+            return await adapter.run(self.ask, command, query_delay)
+        async with adapter.lock:
+            await self.awrite(command)
+            if query_delay:
+                import asyncio
+                await asyncio.sleep(query_delay)
+            return await self.aread()
+
+    async def avalues(self, command, separator=',', cast=float, preprocess_reply=None,
+                      maxsplit=-1, **kwargs):
+        """Write a command to the instrument and return a list of formatted values from the
+        result without blocking the event loop. See :meth:`values` for the parameters.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            return await adapter.run(self.values, command, separator=separator, cast=cast,
+                                     preprocess_reply=preprocess_reply, maxsplit=maxsplit,
+                                     **kwargs)
+        return self._parse_values(await self.aask(command, **kwargs), separator=separator,
+                                  cast=cast, preprocess_reply=preprocess_reply,
+                                  maxsplit=maxsplit)
+
+    async def aget(self, name):
+        """Return the value of the property `name` without blocking the event loop.
+
+        .. code-block:: python
+
+            voltage, temperature = await asyncio.gather(
+                sourcemeter.aget("voltage"), controller.aget("temperature"))
+
+        With a :class:`~pymeasure.adapters.ThreadedAdapter`, the property is read in the
+        thread of the adapter. Otherwise, the command of a :meth:`control` property is sent via
+        a :class:`Batch` with the asynchronous adapter, and errors are checked with
+        :meth:`acheck_get_errors`.
+
+        :param name: Name of the property.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            return await adapter.run(getattr, self, name)
+        async with self.batch():
+            value = getattr(self, name)
+        return value.result() if isinstance(value, BatchFuture) else value
+
+    async def aset(self, name, value):
+        """Set the property `name` to `value` without blocking the event loop.
+
+        :param name: Name of the property.
+        :param value: Value to set.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            await adapter.run(setattr, self, name, value)
+            return
+        async with self.batch():
+            setattr(self, name, value)
 
     # Property creators
     @staticmethod
@@ -453,6 +970,7 @@ class CommonBase:
         maxsplit=-1,
         cast=float,
         values_kwargs=None,
+        cache=None,
         **kwargs
     ):
         """Return a property for the class based on the supplied
@@ -493,6 +1011,9 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Remember the value last set or read and return it instead of querying
+            the device. If None, the value is cached if :attr:`cache_properties` is True.
+            Use it only for values, which are changed by this property alone.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -550,8 +1071,59 @@ class CommonBase:
                  command_process=command_process,
                  check_get_errors=check_get_errors,
                  ):
+            caching = cache or (cache is None and CommonBase._cache_requested
+                                and self.cache_properties)
+            if caching:
+                property_cache = self._get_cache()
+                key = (self, fget)
+                if key in property_cache:
+                    value = property_cache[key]
+                    batch = self._get_batch()
+                    if batch is not None:
+                        future = BatchFuture(batch)
+                        future.set_result(value)
+                        return future
+                    return value
             if get_command is None:
                 raise LookupError("Property can not be read.")
+
+            def process(vals):
+                if len(vals) == 1:
+                    value = get_process(vals[0])
+                    if not map_values:
+                        return value
+                    elif isinstance(values, (list, tuple, range)):
+                        return values[int(value)]
+                    elif isinstance(values, dict):
+                        for k, v in values.items():
+                            if v == value:
+                                return k
+                        raise KeyError(f"Value {value} not found in mapped values")
+                    else:
+                        raise ValueError(
+                            'Values of type `{}` are not allowed '
+                            'for Instrument.control'.format(type(values))
+                        )
+                else:
+                    vals = get_process(vals)
+                    return vals
+
+            batch = self._get_batch()
+            if batch is not None:
+                if not values_kwargs or batch.asynchronous:
+                    future = batch.query(
+                        self, self._root_command(command_process(get_command)),
+                        lambda reply: process(self._parse_values(
+                            reply, separator=separator, cast=cast,
+                            preprocess_reply=preprocess_reply, maxsplit=maxsplit)),
+                        check_errors=check_get_errors,
+                        ask_kwargs=values_kwargs or None)
+                    if caching:
+                        future.add_done_callback(
+                            lambda f: f.cancelled() or f.exception() is not None
+                            or property_cache.__setitem__(key, f.result()))
+                    return future
+                batch.send()
             vals = self.values(command_process(get_command),
                                separator=separator,
                                cast=cast,
@@ -569,25 +1141,10 @@ class CommonBase:
                 if errors:
                     log.error("Error received after trying to get a property with the command "
                               f"""'{command_process(get_command)}': '{"', '".join(errors)}'.""")
-            if len(vals) == 1:
-                value = get_process(vals[0])
-                if not map_values:
-                    return value
-                elif isinstance(values, (list, tuple, range)):
-                    return values[int(value)]
-                elif isinstance(values, dict):
-                    for k, v in values.items():
-                        if v == value:
-                            return k
-                    raise KeyError(f"Value {value} not found in mapped values")
-                else:
-                    raise ValueError(
-                        'Values of type `{}` are not allowed '
-                        'for Instrument.control'.format(type(values))
-                    )
-            else:
-                vals = get_process(vals)
-                return vals
+            value = process(vals)
+            if caching:
+                property_cache[key] = value
+            return value
 
         def fset(self,
                  value,
@@ -603,7 +1160,8 @@ class CommonBase:
             if set_command is None:
                 raise LookupError("Property can not be set.")
 
-            value = set_process(validator(value, values))
+            validated = validator(value, values)
+            value = set_process(validated)
             if not map_values:
                 pass
             elif isinstance(values, (list, tuple, range)):
@@ -615,8 +1173,17 @@ class CommonBase:
                     'Values of type `{}` are not allowed '
                     'for CommonBase.control'.format(type(values))
                 )
-            self.write(command_process(set_command) % value)
-            if check_set_errors:
+            caching = cache or (cache is None and CommonBase._cache_requested
+                                and self.cache_properties)
+            batch = self._get_batch()
+            if batch is not None:
+                batch.write(self, self._root_command(command_process(set_command) % value),
+                            check_errors=check_set_errors)
+            else:
+                self.write(command_process(set_command) % value)
+            if caching:
+                self._get_cache()[(self, fget)] = validated
+            if batch is None and check_set_errors:
                 try:
                     error_list = self.check_set_errors()
                 except Exception as exc:
@@ -625,6 +1192,8 @@ class CommonBase:
                     raise
                 errors = [str(error) for error in error_list]
                 if errors:
+                    if caching:
+                        self._get_cache().pop((self, fget), None)
                     log.error(
                         "Error received after trying to set a property with the command "
                         f"""'{command_process(set_command) % value}': '{"', '".join(errors)}'."""
@@ -652,6 +1221,7 @@ class CommonBase:
                     maxsplit=-1,
                     cast=float,
                     values_kwargs=None,
+                    cache=False,
                     **kwargs):
         """ Return a property for the class based on the supplied
         commands. This is a measurement quantity that may only be
@@ -683,6 +1253,9 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Remember the value once read and return it instead of querying the
+            device, e.g. for constant device properties. If None, the value is cached if
+            :attr:`cache_properties` is True.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -710,6 +1283,7 @@ class CommonBase:
                                   maxsplit=maxsplit,
                                   cast=cast,
                                   values_kwargs=values_kwargs,
+                                  cache=cache,
                                   )
 
     @staticmethod
@@ -717,10 +1291,11 @@ class CommonBase:
                 validator=lambda x, y: x, values=(), map_values=False,
                 set_process=lambda v: v,
                 check_set_errors=False, dynamic=False,
+                cache=None,
                 ):
         """Return a property for the class based on the supplied
         commands. This property may be set, but raises an exception
-        when being read from the instrument.
+        when being read from the instrument, unless the set value is cached.
 
         :param set_command: A string command that writes the value
         :param docs: A docstring that will be included in the documentation
@@ -735,6 +1310,8 @@ class CommonBase:
         :param check_set_errors: Toggles checking errors after setting
         :param dynamic: Specify whether the property parameters are meant to be changed in
             instances or subclasses. See :meth:`control` for an usage example.
+        :param cache: Remember the value last set and return it, when the property is read.
+            If None, the value is cached if :attr:`cache_properties` is True.
         """
 
         return CommonBase.control(get_command=None,
@@ -746,6 +1323,7 @@ class CommonBase:
                                   set_process=set_process,
                                   check_set_errors=check_set_errors,
                                   dynamic=dynamic,
+                                  cache=cache,
                                   )
 
     def check_errors(self):
@@ -776,3 +1354,31 @@ class CommonBase:
         :return: List of error entries.
         """
         raise NotImplementedError("Implement it in a subclass.")
+
+    async def acheck_get_errors(self):
+        """Check for errors after having gotten a property in an asynchronous :class:`Batch`.
+
+        With a :class:`~pymeasure.adapters.ThreadedAdapter`, :meth:`check_get_errors` is called
+        in the thread of the adapter. For other asynchronous adapters, implement it in a
+        subclass with the coroutines like :meth:`aask`.
+
+        :return: List of error entries.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            return await adapter.run(self.check_get_errors)
+        raise NotImplementedError("Implement it in a subclass.")
+
+    async def acheck_set_errors(self):
+        """Check for errors after having set a property in an asynchronous :class:`Batch`.
+
+        With a :class:`~pymeasure.adapters.ThreadedAdapter`, :meth:`check_set_errors` is called
+        in the thread of the adapter. For other asynchronous adapters, implement it in a
+        subclass with the coroutines like :meth:`aask`.
+
+        :return: List of error entries.
+        """
+        adapter = self.async_adapter
+        if _threaded(adapter):
+            return await adapter.run(self.check_set_errors)
+        raise NotImplementedError("Implement it in a subclass.")
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .sm7045d import SM7045D
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "sm7045d": ["SM7045D"],
+})
@@ -21,4 +21,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
-from .eurotestHPP120256 import EurotestHPP120256
+
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "eurotestHPP120256": ["EurotestHPP120256"],
+})
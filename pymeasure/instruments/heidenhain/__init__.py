@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .nd287 import ND287
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "nd287": ["ND287"],
+})
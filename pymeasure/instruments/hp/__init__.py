@@ -22,18 +22,19 @@
 # THE SOFTWARE.
 #
 
-from .hp33120A import HP33120A
-from .hp34401A import HP34401A
-from .hp3478A import HP3478A
-from .hp3437A import HP3437A
-from .hp8116a import HP8116A
-from .hp8657b import HP8657B
-from .hp856Xx import HP8560A
-from .hp856Xx import HP8561B
-from .hp8753e import HP8753E
-from .hp11713a import HP11713A
-from .hp437b import HP437B
-from .hpsystempsu import HP6632A
-from .hpsystempsu import HP6633A
-from .hpsystempsu import HP6634A
-from .hplegacyinstrument import HPLegacyInstrument
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "hp33120A": ["HP33120A"],
+    "hp34401A": ["HP34401A"],
+    "hp3478A": ["HP3478A"],
+    "hp3437A": ["HP3437A"],
+    "hp8116a": ["HP8116A"],
+    "hp8657b": ["HP8657B"],
+    "hp856Xx": ["HP8560A", "HP8561B"],
+    "hp8753e": ["HP8753E"],
+    "hp11713a": ["HP11713A"],
+    "hp437b": ["HP437B"],
+    "hpsystempsu": ["HP6632A", "HP6633A", "HP6634A"],
+    "hplegacyinstrument": ["HPLegacyInstrument"],
+})
@@ -76,6 +76,8 @@ class Instrument(CommonBase):
         Discarded otherwise.
     """
 
+    _async_adapter = None
+
     # noinspection PyPep8Naming
     def __init__(self, adapter, name, includeSCPI=None,
                  preprocess_reply=None,
@@ -103,11 +105,33 @@ class Instrument(CommonBase):
 
         log.info("Initializing %s." % self.name)
 
+    @property
+    def async_adapter(self):
+        """Get the adapter for the asynchronous methods like :meth:`aask` and :meth:`aget`.
+
+        It is the adapter itself, if that is an :class:`~pymeasure.adapters.AsyncAdapter`.
+        Otherwise a :class:`~pymeasure.adapters.ThreadedAdapter` is created at first use,
+        which calls the blocking methods of the instrument in a thread of its own.
+        """
+        from ..adapters.asynchronous import AsyncAdapter, ThreadedAdapter
+        if isinstance(self.adapter, AsyncAdapter):
+            return self.adapter
+        if self._async_adapter is None:
+            self._async_adapter = ThreadedAdapter(self.adapter, close_adapter=False)
+        return self._async_adapter
+
+    def transaction(self):
+        """Return the context manager of the adapter to hold while a message is written and its
+        reply read, see :meth:`Adapter.transaction <pymeasure.adapters.Adapter.transaction>`.
+        """
+        return self.adapter.transaction()
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.shutdown()
+        self._close_async_adapter()  # if `shutdown` is overridden without calling it
 
     # SCPI default properties
     @property
@@ -223,8 +247,16 @@ class Instrument(CommonBase):
     def shutdown(self):
         """Brings the instrument to a safe and stable state"""
         self.isShutdown = True
+        self._close_async_adapter()
         log.info(f"Finished shutting down {self.name}")
 
+    def _close_async_adapter(self):
+        """Stop the worker thread of the :class:`~pymeasure.adapters.ThreadedAdapter` created by
+        :attr:`async_adapter`, if any."""
+        if self._async_adapter is not None:
+            self._async_adapter.close()
+            self._async_adapter = None
+
     def check_errors(self):
         """Read all errors from the instrument and log them.
 
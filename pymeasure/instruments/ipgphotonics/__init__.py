@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .yar import YAR
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "yar": ["YAR"],
+})
@@ -22,17 +22,21 @@
 # THE SOFTWARE.
 #
 
-from .keithley2000 import Keithley2000
-from .keithley2260B import Keithley2260B
-from .keithley2306 import Keithley2306
-from .keithley2400 import Keithley2400
-from .keithley2450 import Keithley2450
-from .keithley2600 import Keithley2600
-from .keithley2700 import Keithley2700
-from .keithley2750 import Keithley2750
-from .keithley6221 import Keithley6221
-from .keithley6517b import Keithley6517B
-from .keithley2200 import Keithley2200
-from .keithleyDMM6500 import KeithleyDMM6500
-from .keithley2182 import Keithley2182
-from .keithleyDAQ6510 import KeithleyDAQ6510
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "keithley2000": ["Keithley2000"],
+    "keithley2260B": ["Keithley2260B"],
+    "keithley2306": ["Keithley2306"],
+    "keithley2400": ["Keithley2400"],
+    "keithley2450": ["Keithley2450"],
+    "keithley2600": ["Keithley2600"],
+    "keithley2700": ["Keithley2700"],
+    "keithley2750": ["Keithley2750"],
+    "keithley6221": ["Keithley6221"],
+    "keithley6517b": ["Keithley6517B"],
+    "keithley2200": ["Keithley2200"],
+    "keithleyDMM6500": ["KeithleyDMM6500"],
+    "keithley2182": ["Keithley2182"],
+    "keithleyDAQ6510": ["KeithleyDAQ6510"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .kepcobop import KepcoBOP3612
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "kepcobop": ["KepcoBOP3612"],
+})
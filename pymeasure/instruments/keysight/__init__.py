@@ -22,8 +22,12 @@
 # THE SOFTWARE.
 #
 
-from .keysightDSOX1102G import KeysightDSOX1102G
-from .keysightN5767A import KeysightN5767A
-from .keysightN7776C import KeysightN7776C
-from .keysightE36312A import KeysightE36312A
-from .keysightE3631A import KeysightE3631A
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "keysightDSOX1102G": ["KeysightDSOX1102G"],
+    "keysightN5767A": ["KeysightN5767A"],
+    "keysightN7776C": ["KeysightN7776C"],
+    "keysightE36312A": ["KeysightE36312A"],
+    "keysightE3631A": ["KeysightE3631A"],
+})
@@ -484,7 +484,7 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         img = self.binary_values(query, header_bytes=10, dtype=np.uint8)
         return bytearray(img)
 
-    def download_data(self, source, points=62500):
+    def download_data(self, source, points=62500, waveform_format="ascii"):
         """ Get data from specified source of oscilloscope. Returned objects are a np.ndarray of
         data values (no temporal axis) and a dict of the waveform preamble, which can be used to
         build the corresponding time values for all data points.
@@ -492,22 +492,43 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         Multimeter will be stopped for proper acquisition.
 
         :param source: measurement source, can be "channel1", "channel2", "function", "fft",
-            "wmemory1", "wmemory2", or "ext".
+            "wmemory1", "wmemory2", or "ext". A list of sources downloads all of them.
         :param points: integer number of points to acquire. Note that oscilloscope may return fewer
             points than specified, this is not an issue of this library. Can be 100, 250, 500, 1000,
             2000, 5000, 10000, 20000, 50000, or 62500.
+        :param waveform_format: "ascii", "word" or "byte". The binary formats transfer the data
+            points as an IEEE 488.2 block of 16 or 8 bit integers, which is several times smaller
+            than ascii and is scaled with the preamble values.
 
         :return data_ndarray, waveform_preamble_dict: see waveform_preamble property for dict
-            format.
+            format. For a list of sources, dicts of the data and of the preambles keyed by source.
         """
-        # TODO: Consider downloading from multiple sources at the same time.
+        if not isinstance(source, str):
+            data, preambles = {}, {}
+            for src in source:
+                data[src], preambles[src] = self.download_data(src, points, waveform_format)
+            return data, preambles
+
         self.waveform_source = source
         self.waveform_points_mode = "normal"
         self.waveform_points = points
 
+        if waveform_format == "ascii":
+            preamble = self.waveform_preamble
+            data_bytes = self.waveform_data
+            return np.array(data_bytes), preamble
+
+        self.waveform_format = waveform_format
+        self.write(":waveform:unsigned 1")
+        self.write(":waveform:byteorder msbfirst")
         preamble = self.waveform_preamble
-        data_bytes = self.waveform_data
-        return np.array(data_bytes), preamble
+        self.write(":waveform:data?")
+        dtype = ">u2" if waveform_format == "word" else "u1"
+        # the block is followed by a line feed
+        values = self.read_binary_values(ieee_block=True, termination_bytes=1,
+                                         dtype=dtype).astype(np.float64)
+        data = (values - preamble["yreference"]) * preamble["yincrement"] + preamble["yorigin"]
+        return data, preamble
 
     def _timebase(self):
         """
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .kusg245_250a import Kusg245_250A
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "kusg245_250a": ["Kusg245_250A"],
+})
@@ -21,8 +21,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
-from .lakeshore211 import LakeShore211
-from .lakeshore224 import LakeShore224
-from .lakeshore331 import LakeShore331
-from .lakeshore421 import LakeShore421
-from .lakeshore425 import LakeShore425
+
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "lakeshore211": ["LakeShore211"],
+    "lakeshore224": ["LakeShore224"],
+    "lakeshore331": ["LakeShore331"],
+    "lakeshore421": ["LakeShore421"],
+    "lakeshore425": ["LakeShore425"],
+})
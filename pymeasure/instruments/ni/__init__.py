@@ -22,16 +22,10 @@
 # THE SOFTWARE.
 #
 
-try:
-    from .daqmx import DAQmx
-except OSError:
-    # Error Logging is handled within package
-    pass
+from pymeasure.lazy import attach
 
-try:
-    from .virtualbench import VirtualBench
-    # direct access to armstrap/pyvirtualbench wrapper:
-    # from .virtualbench import VirtualBench_Direct
-except ModuleNotFoundError:
-    # Error Logging is handled within package
-    pass
+# The drivers need optional libraries, which are only loaded when accessing them
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "daqmx": ["DAQmx"],
+    "virtualbench": ["VirtualBench"],
+}, optional=("daqmx", "virtualbench"))
@@ -22,7 +22,10 @@
 # THE SOFTWARE.
 #
 
+from pymeasure.lazy import attach
 
-from .itc503 import ITC503
-from .ips120_10 import IPS120_10
-from .ps120_10 import PS120_10
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "itc503": ["ITC503"],
+    "ips120_10": ["IPS120_10"],
+    "ps120_10": ["PS120_10"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .parkerGV6 import ParkerGV6
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "parkerGV6": ["ParkerGV6"],
+})
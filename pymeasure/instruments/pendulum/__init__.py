@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .cnt91 import CNT91
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "cnt91": ["CNT91"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .rod4 import ROD4
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "rod4": ["ROD4"],
+})
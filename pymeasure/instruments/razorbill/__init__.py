@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .razorbillRP100 import razorbillRP100
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "razorbillRP100": ["razorbillRP100"],
+})
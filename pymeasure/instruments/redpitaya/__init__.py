@@ -1 +1,7 @@
-from .redpitaya_scpi import RedPitayaScpi
+
+
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "redpitaya_scpi": ["RedPitayaScpi"],
+})
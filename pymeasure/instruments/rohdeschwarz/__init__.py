@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .sfm import SFM
-from .fsl import FSL
-from .hmp import HMP4040
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "sfm": ["SFM"],
+    "fsl": ["FSL"],
+    "hmp": ["HMP4040"],
+})
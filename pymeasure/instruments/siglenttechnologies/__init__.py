@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .siglent_spd1168x import SPD1168X
-from .siglent_spd1305x import SPD1305X
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "siglent_spd1168x": ["SPD1168X"],
+    "siglent_spd1305x": ["SPD1305X"],
+})
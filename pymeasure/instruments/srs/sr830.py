@@ -62,6 +62,8 @@ class SR830(Instrument):
         62.5e-3, 125e-3, 250e-3, 500e-3, 1, 2, 4, 8, 16,
         32, 64, 128, 256, 512
     ]
+    BUFFER_POLL_POINTS = 32  # points to be awaited between two polls of the buffer
+    BUFFER_POLL_INTERVAL = (1e-3, 1.0)  # limits of the buffer polling interval in s
     SENSITIVITIES = [
         2e-9, 5e-9, 10e-9, 20e-9, 50e-9, 100e-9, 200e-9,
         500e-9, 1e-6, 2e-6, 5e-6, 10e-6, 20e-6, 50e-6, 100e-6,
@@ -503,31 +505,78 @@ class SR830(Instrument):
         else:
             return int(query)
 
-    def fill_buffer(self, count: int, has_aborted=lambda: False, delay=0.001):
+    def buffer_poll_interval(self):
+        """ Get the interval in s between two polls of the buffer
+
+        The interval is chosen such that about :attr:`BUFFER_POLL_POINTS` new points are
+        recorded between two polls, limited to :attr:`BUFFER_POLL_INTERVAL`. If the buffer
+        is triggered externally, None is returned.
+        """
+        frequency = self.sample_frequency
+        if frequency is None:
+            return None
+        minimum, maximum = self.BUFFER_POLL_INTERVAL
+        return min(max(self.BUFFER_POLL_POINTS / frequency, minimum), maximum)
+
+    def iter_buffer(self, count=None, has_aborted=lambda: False, delay=None, start=0):
+        """ Iterate over the content of the buffer while it is recorded
+
+        Each iteration step yields a tuple of two numpy arrays with the points of channel 1
+        and 2 which have been recorded since the previous step. The buffer is paused, once
+        `count` points have been read or `has_aborted` returns True.
+
+        .. code-block:: python
+
+            lockin.start_buffer()
+            for ch1, ch2 in lockin.iter_buffer(1000):
+                procedure.emit('results', {'X': ch1, 'Y': ch2})
+
+        :param count: Number of points after which to stop, None to continue until aborted.
+        :param has_aborted: Callable returning True, if the acquisition should stop.
+        :param delay: Interval in s between two polls of the buffer. If None, it is adapted
+            to the sample frequency (see :meth:`buffer_poll_interval`), or, for triggered
+            acquisition, doubled with every poll without new points.
+        :param start: Index of the first point to read.
+        """
+        interval = self.buffer_poll_interval() if delay is None else delay
+        adaptive = interval is None
+        if adaptive:
+            interval = self.BUFFER_POLL_INTERVAL[0]
+        index = start
+        while count is None or index < count:
+            if has_aborted():
+                break
+            current = self.buffer_count
+            if count is not None:
+                current = min(current, count)
+            if current > index:
+                yield self.get_buffer(1, index, current), self.get_buffer(2, index, current)
+                index = current
+                if adaptive:
+                    interval = self.BUFFER_POLL_INTERVAL[0]
+                if index == count:
+                    break
+            elif adaptive:
+                interval = min(2 * interval, self.BUFFER_POLL_INTERVAL[1])
+            time.sleep(interval)
+        self.pause_buffer()
+
+    def fill_buffer(self, count: int, has_aborted=lambda: False, delay=None):
         """ Fill two numpy arrays with the content of the instrument buffer
 
-        Eventually waiting until the specified number of recording is done
+        Eventually waiting until the specified number of recording is done.
+        See :meth:`iter_buffer` for the parameters.
         """
         ch1 = np.empty(count, np.float32)
         ch2 = np.empty(count, np.float32)
-        currentCount = self.buffer_count
         index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.get_buffer(1, index, currentCount)
-                ch2[index:currentCount] = self.get_buffer(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if has_aborted():
-                self.pause_buffer()
-                return ch1, ch2
-        self.pause_buffer()
-        ch1[index: count + 1] = self.get_buffer(1, index, count)  # noqa: E203
-        ch2[index: count + 1] = self.get_buffer(2, index, count)  # noqa: E203
+        for block1, block2 in self.iter_buffer(count, has_aborted, delay):
+            ch1[index:index + len(block1)] = block1
+            ch2[index:index + len(block2)] = block2
+            index += len(block1)
         return ch1, ch2
 
-    def buffer_measure(self, count, stopRequest=None, delay=1e-3):
+    def buffer_measure(self, count, stopRequest=None, delay=None):
         """ Start a fast measurement mode and transfers data from buffer to extract mean
         and std measurements
 
@@ -536,21 +585,14 @@ class SR830(Instrument):
         self.write("FAST2;STRD")
         ch1 = np.empty(count, np.float64)
         ch2 = np.empty(count, np.float64)
-        currentCount = self.buffer_count
         index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.get_buffer(1, index, currentCount)
-                ch2[index:currentCount] = self.get_buffer(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if stopRequest is not None and stopRequest.isSet():
-                self.pause_buffer()
-                return (0, 0, 0, 0)
-        self.pause_buffer()
-        ch1[index:count] = self.get_buffer(1, index, count)
-        ch2[index:count] = self.get_buffer(2, index, count)
+        for block1, block2 in self.iter_buffer(
+                count, lambda: stopRequest is not None and stopRequest.is_set(), delay):
+            ch1[index:index + len(block1)] = block1
+            ch2[index:index + len(block2)] = block2
+            index += len(block1)
+        if index < count:
+            return (0, 0, 0, 0)
         return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
 
     def pause_buffer(self):
@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .tdk_gen40_38 import TDK_Gen40_38
-from .tdk_gen80_65 import TDK_Gen80_65
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "tdk_gen40_38": ["TDK_Gen40_38"],
+    "tdk_gen80_65": ["TDK_Gen80_65"],
+})
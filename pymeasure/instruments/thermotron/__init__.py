@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .thermotron3800 import Thermotron3800
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "thermotron3800": ["Thermotron3800"],
+})
@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .smartline_v1 import SmartlineV1
-from .smartline_v2 import SmartlineV2, VSH, VSM, VSP, VSR
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "smartline_v1": ["SmartlineV1"],
+    "smartline_v2": ["SmartlineV2", "VSH", "VSM", "VSP", "VSR"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .velleman_k8090 import VellemanK8090, VellemanK8090Switches
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "velleman_k8090": ["VellemanK8090", "VellemanK8090Switches"],
+})
@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .yokogawa7651 import Yokogawa7651
-from .yokogawags200 import YokogawaGS200
+from pymeasure.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "yokogawa7651": ["Yokogawa7651"],
+    "yokogawags200": ["YokogawaGS200"],
+})
@@ -0,0 +1,70 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import sys
+
+
+def attach(package, index, optional=()):
+    """Import the public names of a package from its modules at their first access.
+
+    A package defines the index of the names in its modules and uses the returned functions
+    as module level ``__getattr__`` and ``__dir__`` (:pep:`562`):
+
+    .. code-block:: python
+
+        __getattr__, __dir__, __all__ = attach(__name__, {
+            "keithley2000": ["Keithley2000"],
+            "keithley2400": ["Keithley2400"],
+        })
+
+    ``from package import Keithley2400`` imports only the module ``package.keithley2400``.
+    Errors of the import, for example missing optional dependencies, are raised at that
+    point. The names of the `optional` modules are left out of ``__all__``, such that
+    ``from package import *`` does not fail if their dependencies are missing.
+
+    :param package: Name of the package, i.e. its ``__name__``.
+    :param index: Dictionary of the names in the package by relative module name.
+    :param optional: Relative names of the modules which need optional dependencies.
+    :returns: Tuple of the ``__getattr__`` and ``__dir__`` functions of the package and its
+        ``__all__`` list.
+    """
+    modules = {name: module for module, names in index.items() for name in names}
+
+    def __getattr__(name):
+        try:
+            module = modules[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        # `__import__` instead of `importlib.import_module`, which `python -X importtime` misses
+        value = getattr(__import__(f"{package}.{module}", fromlist=[name]), name)
+        # Store the value, such that `__getattr__` is not called for the name anymore.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | modules.keys())
+
+    __all__ = [name for module, names in index.items() if module not in optional
+               for name in names]
+    return __getattr__, __dir__, __all__
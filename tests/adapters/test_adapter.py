@@ -25,6 +25,7 @@
 import logging
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.adapters import Adapter, FakeAdapter, ProtocolAdapter
@@ -118,6 +119,38 @@ def test_read_binary_values():
     assert list(a.read_binary_values(dtype=int, sep=" ")) == pytest.approx([1, 2])
 
 
+def test_read_binary_values_ieee_block():
+    a = ProtocolAdapter([(None, b"#212" + np.arange(3, dtype="<f4").tobytes() + b"\n")])
+    assert list(a.read_binary_values(dtype="<f4", ieee_block=True,
+                                     termination_bytes=-1)) == [0, 1, 2]
+    assert a._read_buffer is None  # termination consumed
+
+
+@pytest.mark.parametrize("reply, data, rest", (
+    (b"#15abcde\n", b"abcde", b"\n"),
+    (b"CURV #15abcde", b"abcde", None),
+    (b"#210" + bytes(range(10)) + b"XY", bytes(range(10)), b"XY"),
+))
+def test_read_ieee_block(reply, data, rest):
+    a = ProtocolAdapter([(None, reply)])
+    assert a.read_ieee_block() == data
+    assert a._read_buffer == rest
+
+
+def test_read_ieee_block_termination():
+    a = ProtocolAdapter([(None, b"#13abc\r\n")])
+    assert a.read_ieee_block(termination_bytes=2) == b"abc"
+    assert a._read_buffer is None
+
+
+@pytest.mark.parametrize("reply", (b"abc#13abc", b"#x12", b"#2a", b"#15abc"))
+def test_read_ieee_block_invalid(reply):
+    a = ProtocolAdapter([(None, reply)])
+    a.IEEE_BLOCK_MAX_PREFIX = 2
+    with pytest.raises(ValueError, match="IEEE 488.2"):
+        a.read_ieee_block()
+
+
 def test_write_binary_values():
     """Test write_binary_values in the ieee header format."""
     a = ProtocolAdapter([(b'CMD#212\x00\x00\x80?\x00\x00\x00@\x00\x00@@\n', None)])
@@ -139,7 +172,8 @@ def test_adapter_preprocess_reply():
 def test_binary_values_deprecation_warning():
     a = FakeAdapter()
     with pytest.warns(FutureWarning):
-        a.binary_values("abcdefgh")
+        values = a.binary_values("abcdefgh")
+    assert values.tolist() == np.frombuffer(b"abcdefgh", dtype=np.float32).tolist()
 
 
 class TestLoggingForTestGenerator:
@@ -0,0 +1,222 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pymeasure.adapters import AsyncSocketAdapter, ProtocolAdapter, ThreadedAdapter
+from pymeasure.instruments import Channel, Instrument
+
+
+class ServerChannel(Channel):
+    frequency = Channel.measurement("C{ch}:FREQ?", "docs")
+
+
+class ServerInstrument(Instrument):
+    def __init__(self, adapter, name="Server instrument", **kwargs):
+        super().__init__(adapter, name, includeSCPI=False, **kwargs)
+
+    voltage = Instrument.control("VOLT?", "VOLT %g", "docs")
+    mode = Instrument.control("MODE?", "MODE %d", "docs",
+                              values={"low": 0, "high": 1}, map_values=True)
+    delayed = Instrument.measurement("DEL?", "docs", values_kwargs={"query_delay": 0.01})
+    checked = Instrument.measurement("CHK?", "docs", check_get_errors=True)
+    ch_A = Instrument.ChannelCreator(ServerChannel, "A")
+
+    def check_get_errors(self):
+        return [self.ask("ERR?")]
+
+
+class CheckingServerInstrument(ServerInstrument):
+    async def acheck_get_errors(self):
+        return [await self.aask("ERR?")]
+
+
+async def start_server(replies, received):
+    """Start a server, which answers queries with `replies` and records the messages."""
+    async def handle(reader, writer):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = line.decode().strip()
+            received.append(message)
+            if "?" in message:
+                writer.write((replies[message] + "\n").encode())
+                await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+class TestAsyncSocketAdapter:
+    def test_resource_name(self):
+        adapter = AsyncSocketAdapter("TCPIP0::192.168.0.5::5025::SOCKET")
+        assert (adapter.host, adapter.port) == ("192.168.0.5", 5025)
+
+    def test_invalid_resource_name(self):
+        with pytest.raises(ValueError):
+            AsyncSocketAdapter("GPIB::5")
+
+    def test_write_read(self):
+        async def main():
+            received = []
+            server, port = await start_server({"*IDN?": "abc"}, received)
+            async with server:
+                adapter = AsyncSocketAdapter("127.0.0.1", port)
+                await adapter.awrite("VOLT 1")
+                await adapter.awrite("*IDN?")
+                assert await adapter.aread() == "abc"
+                await adapter.awrite_bytes(b"*IDN?\n")
+                assert await adapter.aread_bytes(4) == b"abc\n"
+                await adapter.aclose()
+            return received
+
+        assert asyncio.run(main()) == ["VOLT 1", "*IDN?", "*IDN?"]
+
+    def test_instrument(self):
+        async def main():
+            received = []
+            server, port = await start_server(
+                {"VOLT?": "1.5", "VOLT?;MODE?;CA:FREQ?": "2;1;50", "LIST?": "1,2,3"}, received)
+            async with server:
+                adapter = AsyncSocketAdapter("127.0.0.1", port)
+                inst = ServerInstrument(adapter)
+                assert await inst.aask("VOLT?") == "1.5"
+                assert await inst.avalues("LIST?") == [1, 2, 3]
+                assert await inst.aget("voltage") == 1.5
+                await inst.aset("mode", "high")
+                async with inst.batch():
+                    voltage = inst.voltage
+                    mode = inst.mode
+                    frequency = inst.ch_A.frequency
+                assert (voltage.result(), mode.result(), frequency.result()) == (2, "high", 50)
+                await adapter.aclose()
+            return received
+
+        assert asyncio.run(main()) == ["VOLT?", "LIST?", "VOLT?", "MODE 1",
+                                       "VOLT?;MODE?;CA:FREQ?"]
+
+    def test_values_kwargs(self):
+        async def main():
+            received = []
+            server, port = await start_server({"VOLT?": "1", "DEL?": "2"}, received)
+            async with server:
+                adapter = AsyncSocketAdapter("127.0.0.1", port)
+                inst = ServerInstrument(adapter)
+                assert await inst.aget("delayed") == 2
+                async with inst.batch():
+                    voltage = inst.voltage
+                    delayed = inst.delayed
+                assert (voltage.result(), delayed.result()) == (1, 2)
+                await adapter.aclose()
+            return received
+
+        assert asyncio.run(main()) == ["DEL?", "VOLT?", "DEL?"]
+
+    def test_check_errors(self):
+        async def main():
+            received = []
+            server, port = await start_server({"CHK?": "1", "ERR?": "0"}, received)
+            async with server:
+                adapter = AsyncSocketAdapter("127.0.0.1", port)
+                inst = CheckingServerInstrument(adapter)
+                assert await inst.aget("checked") == 1
+                await adapter.aclose()
+            return received
+
+        assert asyncio.run(main()) == ["CHK?", "ERR?"]
+
+    def test_check_errors_not_implemented(self):
+        async def main():
+            server, port = await start_server({"CHK?": "1"}, [])
+            async with server:
+                adapter = AsyncSocketAdapter("127.0.0.1", port)
+                inst = ServerInstrument(adapter)
+                with pytest.raises(NotImplementedError):
+                    async with inst.batch():
+                        checked = inst.checked
+                with pytest.raises(NotImplementedError):
+                    checked.result()
+                await adapter.aclose()
+
+        asyncio.run(main())
+
+
+class SlowAdapter(ProtocolAdapter):
+    """ProtocolAdapter, which takes some time to read and records the reading threads."""
+
+    def __init__(self, *args, delay=0.2, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+        self.threads = set()
+
+    def _read(self, **kwargs):
+        time.sleep(self.delay)
+        self.threads.add(threading.get_ident())
+        return super()._read(**kwargs)
+
+
+class TestThreadedAdapter:
+    def test_blocking_methods(self):
+        adapter = ThreadedAdapter(ProtocolAdapter([("VOLT?", "1")]))
+        adapter.write("VOLT?")
+        assert adapter.read() == "1"
+
+    def test_coroutines(self):
+        async def main():
+            adapter = ThreadedAdapter(ProtocolAdapter([("VOLT?", "1"), (b"A", b"BC")]))
+            await adapter.awrite("VOLT?")
+            assert await adapter.aread() == "1"
+            await adapter.awrite_bytes(b"A")
+            assert await adapter.aread_bytes(2) == b"BC"
+
+        asyncio.run(main())
+
+    def test_close(self):
+        wrapped = ProtocolAdapter()
+        wrapped.close = lambda: setattr(wrapped, "closed", True)
+        ThreadedAdapter(wrapped, close_adapter=False).close()
+        assert not hasattr(wrapped, "closed")
+        ThreadedAdapter(wrapped).close()
+        assert wrapped.closed
+
+    def test_instruments_are_read_concurrently(self):
+        adapters = [SlowAdapter([("VOLT?", "1"), ("MODE?", "0")]),
+                    SlowAdapter([("VOLT?", "2"), ("MODE?", "1")])]
+        instruments = [ServerInstrument(adapter) for adapter in adapters]
+
+        async def main():
+            return await asyncio.gather(*[inst.aget(name) for inst in instruments
+                                          for name in ("voltage", "mode")])
+
+        start = time.perf_counter()
+        assert asyncio.run(main()) == [1, "low", 2, "high"]
+        # Two reads per instrument in sequence, both instruments in parallel
+        assert time.perf_counter() - start < 3 * adapters[0].delay
+        assert adapters[0].threads.isdisjoint(adapters[1].threads)
@@ -22,9 +22,15 @@
 # THE SOFTWARE.
 #
 
+import threading
+import time
+
+import numpy as np
 import pytest
 
 from pymeasure.adapters import PrologixAdapter
+from pymeasure.adapters.prologix import escape, unescape
+from pymeasure.instruments import Instrument
 from pymeasure.test import expected_protocol
 
 
@@ -122,6 +128,37 @@ def test_write_binary_values(test_input, expected):
         adapter.write_binary_values("OUTP", test_input, datatype='B')
 
 
+def escape_bytewise(block):
+    """Reference implementation of the escaping, byte by byte."""
+    escaped = bytearray()
+    for b in block:
+        if b in b'\x0d\x0a\x1b\x2b':
+            escaped.append(0x1b)
+        escaped.append(b)
+    return bytes(escaped)
+
+
+@pytest.mark.parametrize("data", (b"", b"abc", bytes(range(256)), b"\x1b" * 10, b"++\r\n"))
+def test_escape(data):
+    assert escape(data) == escape_bytewise(data)
+    assert unescape(escape(data)) == data
+
+
+def test_escape_waveforms():
+    """Escaping arbitrary waveforms of realistic sizes is fast."""
+    rng = np.random.default_rng(1)
+    times = {}
+    for points in (1_000, 100_000, 500_000):
+        block = rng.integers(-2**15, 2**15, points, dtype=np.int16).tobytes()
+        start = time.perf_counter()
+        escaped = escape(block)
+        times[len(block)] = time.perf_counter() - start
+        assert unescape(escaped) == block
+        if points <= 100_000:
+            assert escaped == escape_bytewise(block)
+    assert times[1_000_000] < 1
+
+
 def test_wait_for_srq():
     with expected_protocol(
             PrologixAdapter,
@@ -129,3 +166,127 @@ def test_wait_for_srq():
              ("++srq", None), ("++read eoi", "0"), ("++srq", None), ("++read eoi", "1")]
     ) as adapter:
         adapter.wait_for_srq()
+
+
+def test_address_is_sent_once():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("first", None), ("second", None)],
+            address=5,
+    ) as adapter:
+        adapter.write("first")
+        adapter.write("second")
+
+
+def test_address_changes_between_shared_adapters():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("a", None), ("++addr 9", None), ("b", None),
+                         ("++read eoi", "B"), ("++addr 5", None), ("c", None)],
+            address=5,
+    ) as adapter:
+        other = adapter.gpib(9)
+        assert other.controller is adapter.controller
+        adapter.write("a")
+        other.write("b")
+        assert other.read() == "B"
+        adapter.write("c")
+
+
+def test_adapters_of_same_resource_share_controller():
+    pytest.importorskip("pyvisa_sim")
+    adapter = PrologixAdapter("ASRL1::INSTR", 5, visa_library="@sim")
+    other = PrologixAdapter("ASRL1::INSTR", 9, visa_library="@sim")
+    assert other.connection is adapter.connection
+    assert other.controller is adapter.controller
+    adapter.close()
+    other.close()
+
+
+def test_read_selects_address():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 9", None), ("b", None),
+                         ("++addr 5", None), ("++read eoi", "A")],
+            address=5,
+    ) as adapter:
+        adapter.gpib(9).write("b")
+        assert adapter.read() == "A"
+
+
+def test_manual_address_and_reset_are_tracked():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("a", None), ("++rst", None),
+                         ("++addr 5", None), ("b", None)],
+            address=5,
+    ) as adapter:
+        adapter.write("++addr 5")
+        adapter.write("a")
+        adapter.reset()
+        assert adapter.controller.address is None
+        adapter.write("b")
+
+
+def test_read_after_write_skips_read_command():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 1", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++addr 5", None), ("*IDN?", "id")],
+            address=5, auto=True,
+    ) as adapter:
+        adapter.write("*IDN?")
+        assert adapter.read() == "id"
+
+
+def test_read_after_other_address_writes_sends_read_command():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 1", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++addr 9", None), ("a", None), ("++addr 5", None), ("++read eoi", "id"),
+             ("++read eoi", "more")],
+            address=5, auto=True,
+    ) as adapter:
+        other = adapter.gpib(9)
+        other.write("a")
+        assert adapter.read() == "id"
+        assert adapter.read() == "more"
+
+
+def test_ask_is_one_transaction():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("*IDN?", None), ("++read eoi", "id")],
+            address=5,
+    ) as adapter:
+        instrument = Instrument(adapter, "test", includeSCPI=False)
+        acquired = []
+
+        def read():
+            # another thread may not use the connection during the transaction
+            thread = threading.Thread(
+                target=lambda: acquired.append(adapter.controller.lock.acquire(False)))
+            thread.start()
+            thread.join()
+            return original_read()
+
+        original_read, adapter.read = adapter.read, read
+        adapter.controller.reset_latencies()
+        assert instrument.ask("*IDN?") == "id"
+        assert acquired == [False]
+        latencies = adapter.controller.latencies()
+        assert latencies[5]["count"] == 1
+        assert latencies[5]["max"] >= latencies[5]["mean"] > 0
+
+
+def test_error_invalidates_address():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("a", None), ("++addr 5", None), ("b", None)],
+            address=5,
+    ) as adapter:
+        with pytest.raises(ValueError):
+            with adapter.transaction():
+                adapter.write("a")
+                raise ValueError("communication failed")
+        adapter.write("b")
@@ -22,6 +22,8 @@
 # THE SOFTWARE.
 #
 import importlib.util
+import time
+from unittest import mock
 
 import pytest
 import pyvisa
@@ -162,6 +164,23 @@ class TestReadBytes:
         # `break_on_termchar=False` is default value
         assert adapter.read_bytes(-1) == b"SCPI,MOCK,VERSION_1.0\nSCPI,MOCK,VERSION_1.0\n"
 
+    def test_read_all_bytes_returns_when_idle(self, adapterR):
+        adapterR.connection.timeout = 2000
+        start = time.perf_counter()
+        assert adapterR.read_bytes(-1) == b"SCPI,MOCK,VERSION_1.0\n"
+        assert time.perf_counter() - start < 1
+        assert adapterR.connection.timeout == 2000
+
+
+def test_read_all_bytes_in_chunks():
+    adapter = VISAAdapter("GPIB0::4::INSTR", visa_library='@sim', write_termination="\n")
+    adapter.write("*IDN?")
+    visalib = type(adapter.connection.visalib)
+    with mock.patch.object(visalib, "read", autospec=True, side_effect=visalib.read) as read:
+        assert adapter.read_bytes(-1) == b"SCPI,MOCK,VERSION_1.0\n"
+    assert read.call_count < 5  # instead of one call per byte
+    adapter.close()
+
 
 def test_visa_adapter(adapter):
     assert repr(adapter) == f"<VISAAdapter(resource='{SIM_RESOURCE}')>"
@@ -176,3 +195,84 @@ def test_visa_adapter(adapter):
 def test_visa_adapter_ask_values(adapter):
     with pytest.warns(FutureWarning):
         assert adapter.ask_values(":VOLT:IMM:AMPL?", separator=",") == [1.0]
+
+
+class TestSharedConnection:
+    def test_same_resource_shares_connection(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        assert a2.connection is a1.connection
+        assert a2.manager is a1.manager
+        assert a2.shared_connection.users == 2
+        assert a2.transaction() is a1.transaction()
+        a1.close()
+        assert a2.connection.session is not None
+        a2.close()
+        with pytest.raises(pyvisa.errors.InvalidSession, match="Invalid session"):
+            a2.connection.session
+
+    def test_close_twice_releases_once(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a1.close()
+        a1.close()
+        assert a2.shared_connection.users == 1
+        a2.close()
+
+    def test_nested_adapter_holds_reference(self):
+        a0 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a = VISAAdapter(a0)
+        a0.close()
+        assert a.connection.session is not None
+        a.close()
+        with pytest.raises(pyvisa.errors.InvalidSession, match="Invalid session"):
+            a.connection.session
+
+    def test_equivalent_resource_names(self):
+        a1 = VISAAdapter(4, visa_library='@sim')
+        a2 = VISAAdapter("GPIB::4", visa_library='@sim')
+        assert a2.connection is a1.connection
+        a1.close()
+        a2.close()
+
+    def test_matching_kwargs_of_open_connection(self, recwarn):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim', read_termination="\n")
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim', gpib={'timeout': 5},
+                         asrl={'read_termination': "\n"})
+        assert len(recwarn) == 0
+        a1.close()
+        a2.close()
+
+    def test_conflicting_kwargs_keep_open_connection_settings(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim', read_termination="\n")
+        with pytest.warns(UserWarning, match="read_termination='\\\\n' instead of '\\\\r'"):
+            a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim', asrl={'read_termination': "\r"})
+        assert a1.connection.read_termination == "\n"
+        a1.close()
+        a2.close()
+
+    def test_invalid_kwargs_of_open_connection(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        with pytest.raises(ValueError, match="'read_terminator' is not a valid attribute"):
+            VISAAdapter(SIM_RESOURCE, visa_library='@sim', read_terminator="\n")
+        assert a1.shared_connection.users == 1
+        a1.close()
+
+    def test_directly_closed_connection_is_reopened(self):
+        a1 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        a1.connection.close()
+        a2 = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        assert a2.connection is not a1.connection
+        assert a2.connection.session is not None
+        a2.close()
+
+    def test_each_resource_is_opened_once(self):
+        resources = ("ASRL1::INSTR", "ASRL2::INSTR", "GPIB0::4::INSTR")
+        with mock.patch.object(pyvisa.ResourceManager, "open_resource", autospec=True,
+                               side_effect=pyvisa.ResourceManager.open_resource) as open_resource:
+            adapters = [VISAAdapter(resources[index % 3], visa_library='@sim')
+                        for index in range(30)]
+        assert sorted(c.args[1] for c in open_resource.call_args_list) == sorted(resources)
+        assert len({id(adapter.connection) for adapter in adapters}) == 3
+        for adapter in adapters:
+            adapter.close()
@@ -0,0 +1,252 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import time
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import BufferCurve, MinMaxDecimator, ResultsCurve, ResultsImage
+
+
+class FakeResults:
+    class procedure:
+        x_start, x_end, x_step = 0., 1., 0.5
+        y_start, y_end, y_step = 0., 2., 1.
+
+    def __init__(self):
+        self.data = pd.DataFrame({'x': [], 'y': [], 'z': []})
+
+    def add(self, x, y, z):
+        row = pd.DataFrame({'x': [x], 'y': [y], 'z': [z]})
+        self.data = pd.concat([self.data, row], ignore_index=True)
+
+
+class TestResultsImage:
+    @pytest.fixture
+    def image(self, qapp):
+        return ResultsImage(FakeResults(), 'x', 'y', 'z')
+
+    def test_pixels(self, image):
+        image.results.add(0, 0, 1.)
+        image.results.add(0.5, 1, 3.)
+        image.results.add(1, 2, 2.)
+        image.update_data()
+        assert image.img_data.shape == (3, 3, 4)
+        assert image.img_data[0, 0] == pytest.approx(image.colormap(0.), abs=1e-2)
+        assert image.img_data[1, 1] == pytest.approx(image.colormap(1.), abs=1e-2)
+        assert image.img_data[2, 2] == pytest.approx(image.colormap(0.5), abs=1e-2)
+        assert not image.img_data[0, 1].any()
+
+    def test_indices(self, image):
+        xidx, yidx = image.find_img_indices(np.array([0.2, 0.25, 0.74, 5, np.nan]),
+                                            np.array([0.4, 0.5, 1.5, -1, 0]))
+        assert xidx.tolist() == [0, 1, 1, 2, 2]
+        assert yidx.tolist() == [0, 1, 2, 2, 0]
+        for x, y, i, j in zip([0.2, 0.25, 0.74, 5], [0.4, 0.5, 1.5, -1], xidx, yidx):
+            assert image.find_img_index(x, y) == [i, j]
+
+    def test_only_new_rows_are_binned(self, image):
+        image.results.add(0, 0, 1.)
+        image.update_data()
+        image.results.add(0.5, 0, 2.)
+        with mock.patch.object(image, 'find_img_indices',
+                               wraps=image.find_img_indices) as find:
+            image.update_data()
+            image.update_data()
+        find.assert_called_once()
+        assert find.call_args[0][0].tolist() == [0.5]
+
+    def test_recolor_on_range_change(self, image):
+        image.results.add(0, 0, 1.)
+        image.results.add(0.5, 0, 2.)
+        image.update_data()
+        assert image.img_data[0, 0] == pytest.approx(image.colormap(0.), abs=1e-2)
+        image.results.add(1, 0, 0.)
+        image.update_data()
+        assert image.img_data[0, 0] == pytest.approx(image.colormap(0.5), abs=1e-2)
+        with mock.patch.object(image, 'colormap_lut', wraps=image.colormap_lut) as colormap:
+            image.results.add(0, 1, 1.5)
+            image.update_data()
+        assert colormap.call_args[0][0].shape == (1,)
+
+    def test_nan_is_transparent(self, image):
+        image.results.add(0, 0, np.nan)
+        image.update_data()
+        assert not image.img_data.any()
+
+    def test_axis_change(self, image):
+        image.results.data = pd.DataFrame({'x': [0.], 'y': [0.], 'z': [1.], 'w': [np.nan]})
+        image.update_data()
+        assert image.img_data[0, 0].any()
+        image.z = 'w'
+        image.update_data()
+        assert not image.img_data.any()
+
+
+class TestMinMaxDecimator:
+    @pytest.fixture
+    def curve(self):
+        y = np.cumsum(np.random.default_rng(0).normal(size=100_003))
+        return np.arange(len(y), dtype=float), y
+
+    def test_short_curve_unchanged(self, curve):
+        x, y = curve
+        xs, ys = MinMaxDecimator(100).update(x[:150], y[:150])
+        assert np.array_equal(ys, y[:150])
+
+    @pytest.mark.parametrize("steps", ([100_003], [250, 1000, 5003, 33333, 100_003]))
+    def test_envelope(self, curve, steps):
+        x, y = curve
+        decimator = MinMaxDecimator(100)
+        for n in steps:
+            xs, ys = decimator.update(x[:n], y[:n])
+            assert len(xs) <= 4 * decimator.points + decimator.factor
+            assert ys.max() == y[:n].max() and ys.min() == y[:n].min()
+            assert np.all(np.diff(xs) > 0)
+            assert xs[-1] == x[n - 1]
+        assert decimator.bounds == (0, 100_002)
+
+    def test_only_new_rows_are_bucketed(self, curve):
+        x, y = curve
+        decimator = MinMaxDecimator(100)
+        decimator.update(x[:50_000], y[:50_000])
+        with mock.patch('numpy.argmin', wraps=np.argmin) as argmin:
+            decimator.update(x[:51_000], y[:51_000])
+        assert argmin.call_args[0][0].shape == (2, decimator.factor)
+
+    def test_decimate_range(self, curve):
+        x, y = curve
+        xs, ys = MinMaxDecimator(100).decimate(x, y, 1000, 2000)
+        assert xs.min() >= 1000 and xs.max() <= 2000
+        assert ys.max() == y[1000:2001].max() and ys.min() == y[1000:2001].min()
+        assert len(xs) <= 200
+
+
+class TestBufferCurve:
+    @pytest.fixture
+    def curve(self, qapp):
+        return BufferCurve()
+
+    def test_append(self, curve):
+        curve.prepare(3)
+        curve.append(1, 2)
+        curve.append(2, 4)
+        assert curve.getData()[1].tolist() == [2, 4]
+        curve.append(3, 6)
+        with pytest.raises(Exception, match="overflow"):
+            curve.append(4, 8)
+
+    def test_extend(self, curve):
+        curve.prepare(5)
+        curve.extend([1, 2], [3, 4])
+        curve.extend(np.array([3, 4]), np.array([5, 6]))
+        assert curve.getData()[0].tolist() == [1, 2, 3, 4]
+        with pytest.raises(Exception, match="overflow"):
+            curve.extend([5, 6], [7, 8])
+
+    def test_rolling(self, curve):
+        curve.prepare(4, rolling=True)
+        buffer = curve._buffer
+        for i in range(7):
+            curve.append(i, -i)
+        assert curve.getData()[0].tolist() == [3, 4, 5, 6]
+        assert curve.getData()[1].tolist() == [-3, -4, -5, -6]
+        curve.extend(np.arange(7, 10), np.arange(7, 10))
+        assert curve.getData()[0].tolist() == [6, 7, 8, 9]
+        curve.extend(np.arange(10, 20), np.arange(10, 20))
+        assert curve.getData()[0].tolist() == [16, 17, 18, 19]
+        assert curve.points == 4
+        assert curve._buffer is buffer
+
+    def test_rolling_lod(self, qapp):
+        curve = BufferCurve(lod=10)
+        curve.prepare(100, rolling=True)
+        curve.extend(np.arange(250), np.arange(250) % 7)
+        x, y = curve.getData()
+        assert len(x) <= 20 and x[0] >= 150 and x[-1] >= 240
+
+    def test_coalesced_redraws(self, qtbot):
+        curve = BufferCurve(refresh_time=0.05)
+        curve.prepare(1000)
+        with mock.patch.object(curve, 'setData', wraps=curve.setData) as set_data:
+            with qtbot.waitSignal(curve.data_updated, timeout=1000):
+                for i in range(100):
+                    curve.append(i, i)
+            assert set_data.call_count == 1
+        assert len(curve.getData()[0]) == 100
+
+
+class TestResultsCurve:
+    @pytest.fixture
+    def results(self):
+        results = FakeResults()
+        results.data = pd.DataFrame({'x': np.arange(10_000.), 'y': np.sin(np.arange(10_000.))})
+        return results
+
+    def test_full(self, qapp, results):
+        curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen())
+        curve.update_data()
+        assert len(curve.getData()[0]) == 10_000
+
+    def test_lod(self, qapp, results):
+        curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen(), lod=500)
+        curve.update_data()
+        assert len(curve.getData()[0]) <= 1000
+        with mock.patch.object(curve, 'setData') as set_data:
+            curve.update_data()
+        set_data.assert_not_called()
+
+    def test_lod_zoom(self, qapp, results):
+        plot = pg.PlotWidget()
+        curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen(), lod=500)
+        plot.addItem(curve)
+        curve.update_data()
+        plot.setXRange(100, 199, padding=0)
+        x, y = curve.getData()
+        assert len(x) == 100 and x[0] == 100
+        plot.autoRange()
+        assert curve._view_range is None
+        assert len(curve.getData()[0]) > 100
+
+    def test_frame_time(self, qapp):
+        """ Decimating the curve shortens the time per frame with 1000 new points """
+        times = {}
+        for lod in (None, 1000):
+            for count in (10_000, 100_000, 1_000_000):
+                results = FakeResults()
+                x = np.arange(count, dtype=float)
+                data = pd.DataFrame({'x': x, 'y': np.sin(x / 1000)})
+                curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen(), lod=lod)
+                results.data = data.iloc[:count - 2000]
+                curve.update_data()
+                start = time.perf_counter()
+                for stop in (count - 1000, count):
+                    results.data = data.iloc[:stop]
+                    curve.update_data()
+                times[lod, count] = (time.perf_counter() - start) / 2
+        assert times[1000, 1_000_000] < times[None, 1_000_000]
@@ -0,0 +1,49 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import tempfile
+from unittest.mock import MagicMock
+
+from pymeasure.display.manager import BaseManager, Experiment
+from pymeasure.experiment import Procedure, Results
+
+
+class CountingProcedure(Procedure):
+    DATA_COLUMNS = ['Iteration']
+
+    def execute(self):
+        for i in range(10):
+            self.emit('results', {'Iteration': i})
+
+
+def test_live_data_stopped_after_finish(qtbot):
+    results = Results(CountingProcedure(), tempfile.mktemp())
+    experiment = Experiment(results, browser_item=MagicMock())
+    manager = BaseManager(port=None)
+    manager.load(experiment)
+    with qtbot.waitSignal(manager.finished, timeout=10000):
+        manager.next()
+        assert results.live
+    assert not results.live
+    assert results.data['Iteration'].tolist() == list(range(10))
@@ -0,0 +1,171 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import time
+
+import pandas as pd
+import pytest
+
+from pymeasure.display.Qt import QtCore
+from pymeasure.display.refresh import RefreshCoordinator, RefreshGroup, Snapshot
+from pymeasure.display.widgets.plot_frame import PlotFrame
+from pymeasure.display.widgets.table_widget import Table
+
+
+class CountingResults:
+    def __init__(self, rows=0):
+        self.rows = rows
+        self.reads = 0
+        self.reloads = 0
+
+    @property
+    def data(self):
+        self.reads += 1
+        return pd.DataFrame({'x': range(self.rows)})
+
+    def reload(self):
+        self.reloads += 1
+
+
+@pytest.fixture
+def coordinator(qapp):
+    return RefreshCoordinator()
+
+
+def test_default_is_shared(qapp):
+    assert RefreshCoordinator.default() is RefreshCoordinator.default()
+
+
+def test_read_once_per_tick(coordinator):
+    results = CountingResults(3)
+    group = coordinator.group(0.2)
+    snapshots = []
+    group.tick.connect(lambda: snapshots.append(coordinator.snapshot(results)))
+    group.tick.connect(lambda: snapshots.append(coordinator.snapshot(results)))
+    group.dispatch()
+    assert results.reads == 1
+    assert snapshots[0] is snapshots[1]
+    assert (coordinator.requests, coordinator.reads, coordinator.saved_reads) == (2, 1, 1)
+    group.dispatch()
+    assert results.reads == 2
+
+
+def test_read_outside_of_ticks(coordinator):
+    results = CountingResults(3)
+    coordinator.snapshot(results)
+    coordinator.snapshot(results)
+    assert results.reads == 2
+
+
+def test_groups(coordinator):
+    assert coordinator.group(0.2) is coordinator.group(0.2)
+    assert coordinator.group(0.2) is not coordinator.group(0.5)
+    assert coordinator.group(0.5).timer.interval() == 500
+
+
+def test_versions(coordinator):
+    results = CountingResults(3)
+    assert coordinator.snapshot(results).version == 0
+    assert coordinator.snapshot(results).version == 0
+    results.rows = 5
+    snapshot = coordinator.snapshot(results)
+    assert snapshot.version == 1
+    assert snapshot.delta(3) == (3, 5)
+    assert coordinator.snapshot(results, reload=True).version == 2
+    assert results.reloads == 1
+
+
+def test_delta_after_shrinking():
+    snapshot = Snapshot(pd.DataFrame({'x': [1, 2]}), 0, 0)
+    assert snapshot.delta(2) == (2, 2)
+    assert snapshot.delta(5) == (0, 2)
+
+
+def test_unchanged_stamp_is_not_read(coordinator):
+    results = CountingResults(3)
+    results.data_stamp = 1
+    group = coordinator.group(0.2)
+    group.tick.connect(lambda: coordinator.snapshot(results))
+    group.dispatch()
+    group.dispatch()
+    assert results.reads == 1
+    assert group.skipped_ticks == 1
+    results.data_stamp = 2
+    results.rows = 4
+    group.dispatch()
+    assert results.reads == 2
+    assert len(group.frame_times) == 2
+
+
+def test_destroyed_widget_is_unregistered(coordinator):
+    group = coordinator.group(0.2)
+    widget = QtCore.QObject()
+    ticks = []
+    group.register(widget, lambda: ticks.append(1))
+    assert group.widgets == 1
+    assert group.timer.isActive()
+    group.dispatch()
+    widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+    group.dispatch()
+    assert ticks == [1]
+    assert group.widgets == 0
+    assert not group.timer.isActive()
+
+
+@pytest.mark.parametrize("widget_class", (PlotFrame, Table))
+def test_timer_is_deprecated(qapp, widget_class):
+    widget = widget_class(refresh_time=0.2)
+    with pytest.warns(FutureWarning, match="refresh_group"):
+        assert widget.timer is widget.refresh_group.timer
+
+
+class TestAdaptiveInterval:
+    def dispatch(self, coordinator, group, duration):
+        results = CountingResults(1)  # new data on every tick
+        group.tick.connect(lambda: (coordinator.snapshot(results), time.sleep(duration)))
+        group.dispatch()
+        group.tick.disconnect()
+
+    def test_back_off(self, coordinator):
+        group = coordinator.group(0.02)
+        self.dispatch(coordinator, group, 0.015)
+        assert group.interval == pytest.approx(0.04)
+        assert group.timer.interval() == 40
+        for _ in range(5):
+            self.dispatch(coordinator, group, 0.15)
+        assert group.interval == pytest.approx(0.02 * RefreshGroup.MAX_FACTOR)
+        assert min(group.frame_times) >= 0.015
+
+    def test_speed_up(self, coordinator):
+        group = coordinator.group(0.2)
+        for _ in range(20):
+            self.dispatch(coordinator, group, 0)
+        assert group.interval == pytest.approx(0.2 * RefreshGroup.MIN_FACTOR)
+
+    def test_not_adaptive(self, coordinator):
+        group = coordinator.group(0.02)
+        group.adaptive = False
+        self.dispatch(coordinator, group, 0.015)
+        assert group.interval == 0.02
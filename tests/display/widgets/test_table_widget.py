@@ -0,0 +1,134 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pandas as pd
+
+from pymeasure.display.Qt import QtCore
+from pymeasure.display.widgets.table_widget import (ResultsTable, PandasModelByRow,
+                                                    PandasModelByColumn, SORT_ROLE)
+
+DISPLAY = QtCore.Qt.ItemDataRole.DisplayRole
+
+
+class FakeResults:
+    def __init__(self, data):
+        self.data = data
+
+    def add(self, **columns):
+        self.data = pd.concat([self.data, pd.DataFrame(columns)], ignore_index=True)
+
+    def reload(self):
+        pass
+
+
+def table(x, y, column_index=None):
+    results = FakeResults(pd.DataFrame({'x': x, 'y': y, 'label': [f"r{i}" for i in x]}))
+    return ResultsTable(results, color=None, column_index=column_index)
+
+
+def text(model, row, col, role=DISPLAY):
+    return model.data(model.index(row, col), role)
+
+
+class TestByRow:
+    def test_cells(self, qapp):
+        model = PandasModelByRow(results_list=[])
+        model.add_results(table([1, 2], [0.1234567891, 2.5]))
+        model.add_results(table([3], [np.nan]))
+        assert (model.rowCount(), model.columnCount()) == (3, 3)
+        assert list(model.horizontal_header) == ['x', 'y', 'label']
+        assert [text(model, row, 1) for row in range(3)] == ['0.123457', '2.5', 'nan']
+        assert text(model, 2, 2) == 'r3'
+        assert text(model, 1, 1, SORT_ROLE) == 2.5
+        assert text(model, 0, 2, SORT_ROLE) == 'r1'
+
+    def test_append(self, qapp):
+        model = PandasModelByRow(results_list=[])
+        first, second = table([1, 2], [1., 2.]), table([10], [10.])
+        model.add_results(first)
+        model.add_results(second)
+        first.results.add(x=[3], y=[3.], label=['r3'])
+        first.update_data()
+        assert model.rowCount() == 4
+        assert [text(model, row, 0) for row in range(4)] == ['1', '2', '3', '10']
+
+    def test_index(self, qapp):
+        model = PandasModelByRow(column_index='x', results_list=[])
+        model.add_results(table([5, 6], [1., 2.], column_index='x'))
+        assert model.columnCount() == 2
+        assert model.headerData(1, QtCore.Qt.Orientation.Vertical, DISPLAY) == '6'
+        assert list(model.export_df().index) == [5, 6]
+
+
+class TestByColumn:
+    def test_index_union(self, qapp):
+        model = PandasModelByColumn(column_index='x', results_list=[])
+        first, second = table([1, 3], [1., 3.], 'x'), table([2, 3], [20., 30.], 'x')
+        model.add_results(first)
+        model.add_results(second)
+        assert model.vertical_header == [1, 2, 3]
+        assert (model.rowCount(), model.columnCount()) == (3, 4)
+        assert [text(model, row, 0) for row in range(3)] == ['1', '', '3']
+        assert [text(model, row, 2) for row in range(3)] == ['', '20', '30']
+        first.results.add(x=[0], y=[0.], label=['r0'])
+        first.update_data()
+        assert model.vertical_header == [0, 1, 2, 3]
+        assert model.rowCount() == 4
+
+    def test_set_index(self, qapp):
+        model = PandasModelByColumn(results_list=[])
+        model.add_results(table([4, 5], [1., 2.]))
+        assert model.columnCount() == 3
+        model.set_index('x')
+        assert model.vertical_header == [4, 5]
+        assert model.columnCount() == 2
+
+
+class TestResultsTable:
+    def test_only_new_rows_are_indexed(self, qapp):
+        results_table = table(list(range(1000)), np.arange(1000.), 'x')
+        results_table.start()
+        results_table.cell(0, 0)
+        results_table.results.add(x=[1000], y=[0.], label=['new'])
+        results_table.update_data()
+        assert results_table.row_of(1000) == 1000
+        assert len(results_table._cells) == 1  # not invalidated by appended rows
+
+    def test_cell_cache_size(self, qapp, monkeypatch):
+        monkeypatch.setattr(ResultsTable, 'CELL_CACHE_SIZE', 10)
+        results_table = table(list(range(100)), list(range(100)))
+        for row in range(100):
+            results_table.cell(row, 0)
+        assert len(results_table._cells) == 10
+        assert results_table.cell(99, 1) == ('99', 99.)
+
+    def test_dtype_change_clears_cache(self, qapp):
+        results_table = table([1], [1.])
+        results_table.start()
+        assert results_table.cell(0, 0) == ('1', 1.)
+        results_table.results.add(x=[2.5], y=[1.], label=['a'])
+        results_table.update_data()
+        assert results_table.cell(1, 0) == ('2.5', 2.5)
+        assert results_table._dtypes[0] == np.float64
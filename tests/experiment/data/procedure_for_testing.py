@@ -27,7 +27,7 @@ from pymeasure.experiment import (
     Parameter, FloatParameter
 )
 import random
-from time import sleep
+from time import sleep, time
 
 
 class RandomProcedure(Procedure):
@@ -52,3 +52,18 @@ class RandomProcedure(Procedure):
             sleep(self.delay)
             if self.should_stop():
                 break
+
+
+class SharedResourceProcedure(RandomProcedure):
+    """ Random procedure which records its execution period in a shared file. """
+
+    RESOURCES = ('GPIB0::5::INSTR',)
+
+    log_file = Parameter('Log File', default='')
+
+    def execute(self):
+        with open(self.log_file, 'a') as f:
+            f.write(f"start {time()}\n")
+        super().execute()
+        with open(self.log_file, 'a') as f:
+            f.write(f"stop {time()}\n")
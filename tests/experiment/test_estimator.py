@@ -0,0 +1,157 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import json
+import tempfile
+import time
+
+import pytest
+
+from pymeasure.experiment import Results, Worker
+from pymeasure.experiment.estimator import (DurationEstimator, DurationStore, RunTimer,
+                                            parameters_key, procedure_key)
+from data.procedure_for_testing import RandomProcedure
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DurationStore(str(tmp_path / "durations.json"))
+
+
+def random_procedure(**parameters):
+    procedure = RandomProcedure()
+    procedure.set_parameters(parameters)
+    return procedure
+
+
+class TestRunTimer:
+    def test_records_results(self):
+        timer = RunTimer()
+        timer.start()
+        timer.record('results', {'Iteration': 0, 'Random Number': 0.5})
+        timer.record('results', {'Iteration': [1, 2, 3], 'Random Number': [0, 0, 0]})
+        timer.record('status', 0)
+        assert timer.rows == 4
+        assert timer.emits == 2
+        assert timer.row_rate > 0
+
+    def test_remaining_from_progress(self):
+        timer = RunTimer()
+        assert timer.remaining() is None
+        timer.started = time.perf_counter() - 10
+        now = time.perf_counter()
+        for i in range(5):
+            timer.progress.append((now - 8 + 2 * i, 10. * (i + 1)))  # 5 %/s
+        assert timer.remaining() == pytest.approx(10., abs=0.1)
+        timer.stop()
+        assert timer.remaining() == 0
+
+    def test_remaining_without_progress(self):
+        timer = RunTimer()
+        timer.start()
+        timer.record('progress', 0.)
+        assert timer.remaining() is None
+
+
+class TestDurationStore:
+    def test_record_and_reload(self, store):
+        store.record(random_procedure(iterations=10), 2.)
+        store.record(random_procedure(iterations=10), 4.)
+        runs = store.runs(RandomProcedure)
+        assert len(runs) == 1
+        (entry,) = runs.values()
+        assert entry["duration"] == 3.
+        assert entry["runs"] == 2
+
+        reloaded = DurationStore(store.path)
+        assert reloaded.runs(RandomProcedure) == runs
+        with open(store.path) as f:
+            assert procedure_key(RandomProcedure) in json.load(f)
+
+    def test_least_recent_runs_are_dropped(self, store, monkeypatch):
+        monkeypatch.setattr(DurationStore, "MAX_RUNS", 3)
+        for iterations in range(5):
+            store.record(random_procedure(iterations=iterations + 1), 1.)
+        keys = list(store.runs(RandomProcedure))
+        expected = [parameters_key(random_procedure(iterations=i).parameter_values())
+                    for i in (3, 4, 5)]
+        assert keys == expected
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text("not json")
+        assert DurationStore(str(path)).runs(RandomProcedure) == {}
+
+
+class TestDurationEstimator:
+    def test_no_history(self, store):
+        assert DurationEstimator(store).predict(random_procedure()) is None
+
+    def test_recorded_parameters(self, store):
+        store.record(random_procedure(iterations=10), 2.)
+        estimator = DurationEstimator(store)
+        assert estimator.predict(random_procedure(iterations=10)) == 2.
+        # a single run is the best guess for other parameters
+        assert estimator.predict(random_procedure(iterations=20)) == 2.
+
+    def test_power_law_extrapolation(self, store):
+        for iterations, delay in ((10, 0.1), (20, 0.1), (10, 0.2)):
+            store.record(random_procedure(iterations=iterations, delay=delay),
+                         iterations * delay)
+        estimator = DurationEstimator(store)
+        assert estimator.predict(random_procedure(iterations=100, delay=0.5)) == \
+            pytest.approx(50.)
+
+    def test_model_follows_store(self, store):
+        estimator = DurationEstimator(store)
+        store.record(random_procedure(iterations=10), 1.)
+        assert estimator.predict(random_procedure(iterations=10)) == 1.
+        store.record(random_procedure(iterations=20), 2.)
+        assert estimator.predict(random_procedure(iterations=40)) == pytest.approx(4.)
+
+    def test_predict_sequence(self, store):
+        store.record(random_procedure(iterations=10), 1.)
+        store.record(random_procedure(iterations=20), 2.)
+        estimator = DurationEstimator(store)
+        sequence = [{'iterations': n} for n in (10, 20, 30)]
+        assert estimator.predict_sequence(RandomProcedure, sequence) == pytest.approx(6.)
+        # longer sequences are extrapolated from their first samples
+        assert estimator.predict_sequence(RandomProcedure, iter(sequence), length=30,
+                                          samples=2) == pytest.approx(45.)
+        assert DurationEstimator(DurationStore(store.path + "2")).predict_sequence(
+            RandomProcedure, sequence) is None
+
+
+def test_worker_records_duration(store):
+    procedure = random_procedure(iterations=20, delay=0.001)
+    results = Results(procedure, tempfile.mktemp())
+    worker = Worker(results, duration_store=store)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert worker.timer.rows == 20
+    (entry,) = store.runs(RandomProcedure).values()
+    assert entry["rows"] == 20
+    assert entry["duration"] == pytest.approx(worker.timer.elapsed)
+    assert DurationEstimator(store).predict(procedure) == entry["duration"]
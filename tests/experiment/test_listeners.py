@@ -38,3 +38,59 @@ def test_recorder_stop():
     r = Recorder(d, q)
     r.
 """
+import os
+from queue import Queue
+from time import sleep
+
+import pytest
+
+from pymeasure.experiment import Procedure, Recorder, Results
+
+
+class RecorderProcedure(Procedure):
+    DATA_COLUMNS = ['x', 'y']
+
+
+@pytest.fixture(params=["csv", "binary"])
+def results(request, tmpdir):
+    return Results(RecorderProcedure(), os.path.join(str(tmpdir), 'recorder.dat'),
+                   data_format=request.param)
+
+
+def test_recorder_stop_flushes(results):
+    recorder = Recorder(results, Queue(), flush_interval=60, flush_rows=10 ** 6)
+    recorder.start()
+    for i in range(1000):
+        recorder.handle({'x': i, 'y': 2 * i})
+    recorder.stop()
+    assert not recorder.is_alive()
+    assert results.data['y'].tolist() == [2 * i for i in range(1000)]
+
+
+def test_recorder_flushes_after_interval(results):
+    recorder = Recorder(results, Queue(), flush_interval=0.05, flush_rows=10 ** 6)
+    recorder.start()
+    recorder.handle({'x': 1, 'y': 2})
+    sleep(0.5)
+    assert len(results.data) == 1
+    recorder.stop()
+
+
+def test_recorder_flushes_after_rows(results):
+    recorder = Recorder(results, Queue(), flush_interval=60, flush_rows=10)
+    recorder.start()
+    recorder.handle({'x': range(10), 'y': range(10)})
+    sleep(0.5)
+    assert len(results.data) == 10
+    recorder.stop()
+
+
+def test_recorder_stops_on_sentinel(results):
+    queue = Queue()
+    recorder = Recorder(results, queue)
+    recorder.start()
+    recorder.handle({'x': 1, 'y': 2})
+    queue.put(None)
+    recorder.join(5)
+    assert not recorder.is_alive()
+    assert len(results.data) == 1
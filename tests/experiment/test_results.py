@@ -32,9 +32,10 @@ import pytest
 import numpy as np
 
 from pymeasure.units import ureg
-from pymeasure.experiment.results import Results, CSVFormatter
+from pymeasure.experiment.results import (Results, CSVFormatter, BinaryFormatter,
+                                          ColumnBuffer, block_size)
 from pymeasure.experiment.procedure import Procedure, Parameter
-from pymeasure.experiment import BooleanParameter
+from pymeasure.experiment import BooleanParameter, Metadata
 from data.procedure_for_testing import RandomProcedure
 
 
@@ -98,6 +99,44 @@ class Test_csv_formatter_format:
         assert formatter.format(data) == "nan,nan,nan"
 
 
+class TestBlockFormat:
+    columns = ['t', 'x (V)', 'label']
+
+    def test_block_size(self):
+        assert block_size({'t': 1, 'label': 'abc'}) is None
+        assert block_size({'t': np.arange(3), 'label': 'abc'}) == 3
+        assert block_size(pd.DataFrame({'t': [1, 2]})) == 2
+        with pytest.raises(ValueError):
+            block_size({'t': [1, 2], 'x (V)': [1, 2, 3]})
+
+    @pytest.mark.parametrize("block", (
+        {'t': np.array([1, 2]), 'x (V)': np.array([0.5, 1.5]), 'label': ['a', 'b']},
+        {'t': [1, 2], 'x (V)': ureg.Quantity([500, 1500], ureg.mV), 'label': ['a', 'b']},
+        pd.DataFrame({'t': [1, 2], 'x (V)': [0.5, 1.5], 'label': ['a', 'b']}),
+    ))
+    def test_block_equals_rows(self, block):
+        formatter = CSVFormatter(columns=self.columns)
+        rows = [formatter.format({'t': 1, 'x (V)': 0.5, 'label': 'a'}),
+                formatter.format({'t': 2, 'x (V)': 1.5, 'label': 'b'})]
+        assert formatter.format(block) == "\n".join(rows)
+
+    def test_block_scalars_and_missing_columns(self):
+        formatter = CSVFormatter(columns=self.columns)
+        assert formatter.format({'t': [1, 2], 'label': 'c'}) == "1,nan,c\n2,nan,c"
+
+    def test_block_wrong_units(self):
+        formatter = CSVFormatter(columns=self.columns)
+        block = {'t': [1, 2], 'x (V)': ureg.Quantity([1, 2], ureg.m)}
+        assert formatter.format(block) == "1,nan,nan\n2,nan,nan"
+
+    def test_binary_block_equals_rows(self):
+        formatter = BinaryFormatter(columns=self.columns)
+        rows = (formatter.format({'t': 1, 'x (V)': "500 mV", 'label': 'a'}) +
+                formatter.format({'t': 2, 'x (V)': "1500 mV", 'label': 'b'}))
+        block = {'t': [1, 2], 'x (V)': ureg.Quantity([500, 1500], ureg.mV), 'label': ['a', 'b']}
+        assert formatter.format(block) == rows
+
+
 def test_procedure_filestorage():
     assert RandomProcedure.iterations.value == 100
     procedure = RandomProcedure()
@@ -114,25 +153,16 @@ def test_procedure_filestorage():
 class TestResults:
     # TODO: add a full set of Results tests
 
-    @mock.patch('pymeasure.experiment.results.open', mock.mock_open(), create=True)
-    @mock.patch('os.path.exists', return_value=True)
-    @mock.patch('pymeasure.experiment.results.pd.read_csv')
-    def test_regression_attr_data_when_up_to_date_should_retain_dtype(self,
-                                                                      read_csv_mock,
-                                                                      path_exists_mock):
-        procedure_mock = mock.MagicMock(spec=Procedure)
-        result = Results(procedure_mock, 'test.csv')
-
-        read_csv_mock.return_value = [pd.DataFrame(data={
-            'A': [1, 2, 3, 4, 5, 6, 7],
-            'B': [2, 3, 4, 5, 6, 7, 8]
-        })]
+    def test_regression_attr_data_when_up_to_date_should_retain_dtype(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['A', 'B']
+        filename = os.path.join(str(tmpdir), 'dtype_test.csv')
+        result = Results(DummyProcedure(), filename)
+        with open(filename, 'a') as f:
+            f.writelines(f"{i},{i + 1}\n" for i in range(1, 8))
         first_data = result.data
 
-        # if no updates, read_csv returns a zero-row dataframe
-        read_csv_mock.return_value = [pd.DataFrame(data={
-            'A': [], 'B': []
-        }, dtype=object)]
+        # no updates in the file
         second_data = result.data
 
         assert second_data.iloc[:, 0].dtype is not object
@@ -151,6 +181,231 @@ class TestResults:
         assert (result.parameters['par'].value == np.linspace(1, 100, 17)).all()
 
 
+class TestIncrementalData:
+    @pytest.fixture
+    def results(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['x', 'y', 'label']
+        return Results(DummyProcedure(), os.path.join(str(tmpdir), 'incremental.csv'))
+
+    def append(self, results, text):
+        with open(results.data_filename, 'a', encoding=Results.ENCODING) as f:
+            f.write(text)
+
+    def test_empty(self, results):
+        assert results.data.shape == (0, 3)
+        assert list(results.data.columns) == ['x', 'y', 'label']
+
+    def test_appended_rows(self, results):
+        self.append(results, "1,0.5,a\n2,1.5,b\n")
+        assert results.data.shape == (2, 3)
+        self.append(results, "3,2.5,c\n")
+        data = results.data
+        assert data['x'].tolist() == [1, 2, 3]
+        assert data['y'].tolist() == [0.5, 1.5, 2.5]
+        assert data['label'].tolist() == ['a', 'b', 'c']
+
+    def test_only_new_bytes_are_parsed(self, results):
+        self.append(results, "1,0.5,a\n")
+        results.data
+        offset = results._data_offset
+        assert offset == os.path.getsize(results.data_filename)
+        self.append(results, "2,1.5,b\n")
+        with mock.patch('pymeasure.experiment.results.pd.read_csv',
+                        wraps=pd.read_csv) as read_csv:
+            results.data
+        assert read_csv.call_args[0][0].getvalue() == b"2,1.5,b\n"
+
+    def test_incomplete_line_is_postponed(self, results):
+        self.append(results, "1,0.5,a\n2,1.")
+        assert len(results.data) == 1
+        self.append(results, "5,b\n")
+        assert results.data['y'].tolist() == [0.5, 1.5]
+
+    def test_dtype_promotion(self, results):
+        self.append(results, "1,0.5,a\n")
+        assert results.data['x'].dtype == np.int64
+        self.append(results, "nan,1.5,b\n")
+        data = results.data
+        assert data['x'].dtype == np.float64
+        assert data['x'].iloc[0] == 1 and np.isnan(data['x'].iloc[1])
+
+    def test_previous_snapshot_unchanged(self, results):
+        self.append(results, "1,0.5,a\n")
+        first = results.data
+        self.append(results, "2,1.5,b\n")
+        results.data
+        assert first['x'].tolist() == [1]
+
+    def test_reload(self, results):
+        self.append(results, "1,0.5,a\n2,1.5,b\n")
+        results.data
+        results.reload()
+        assert results.data['x'].tolist() == [1, 2]
+
+    def test_metadata_inserted_after_reading(self, tmpdir):
+        class DummyProcedure(Procedure):
+            foo = Metadata('Foo', default=5)
+            DATA_COLUMNS = ['x']
+        results = Results(DummyProcedure(), os.path.join(str(tmpdir), 'metadata.csv'))
+        results.data
+        results.procedure.evaluate_metadata()
+        results.store_metadata()
+        self.append(results, "1\n")
+        assert results.data['x'].tolist() == [1]
+
+
+class TestLiveData:
+    @pytest.fixture
+    def results(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['x', 'y (V)', 'label']
+        return Results(DummyProcedure(), os.path.join(str(tmpdir), 'live.csv'))
+
+    def test_not_live_by_default(self, results):
+        assert not results.live
+        results.append_data({'x': 1})
+        assert results.data.shape == (0, 3)
+
+    def test_records_and_blocks(self, results):
+        results.start_live_data()
+        results.append_data({'x': 1, 'y (V)': ureg.Quantity(500, ureg.mV), 'label': 'a'})
+        results.append_data({'x': np.arange(2, 4), 'y (V)': [1.5, 2.5], 'label': 'b'})
+        data = results.data
+        assert data['x'].tolist() == [1, 2, 3]
+        assert data['y (V)'].tolist() == [0.5, 1.5, 2.5]
+        assert data['label'].tolist() == ['a', 'b', 'b']
+
+    def test_file_is_not_read(self, results):
+        results.start_live_data()
+        results.append_data({'x': 1})
+        with mock.patch.object(results, '_read_new_data') as read:
+            assert len(results.data) == 1
+        read.assert_not_called()
+
+    def test_takes_over_file_data(self, results):
+        with open(results.data_filename, 'a', encoding=Results.ENCODING) as f:
+            f.write("1,0.5,a\n")
+        results.start_live_data()
+        results.append_data({'x': 2, 'y (V)': 1.5, 'label': 'b'})
+        assert results.data['x'].tolist() == [1, 2]
+
+    def test_start_after_records_raises(self, results):
+        results.append_data({'x': 1})
+        with pytest.raises(RuntimeError):
+            results.start_live_data()
+        assert not results.live
+
+    def test_data_stamp(self, results):
+        stamp = results.data_stamp
+        with open(results.data_filename, 'a', encoding=Results.ENCODING) as f:
+            f.write("1,0.5,a\n")
+        assert results.data_stamp != stamp
+        results.start_live_data()
+        stamp = results.data_stamp
+        results.append_data({'x': 2})
+        assert results.data_stamp != stamp
+
+    def test_stop(self, results):
+        results.start_live_data()
+        results.append_data({'x': 1})
+        results.stop_live_data()
+        assert not results.live
+        assert results.data.shape == (0, 3)
+
+    def test_pickle(self):
+        results = Results(RandomProcedure(), tempfile.mktemp())
+        results.start_live_data()
+        new_results = pickle.loads(pickle.dumps(results))
+        assert not new_results.live
+        new_results.start_live_data()
+        new_results.append_data({'Iteration': 1})
+        assert len(new_results.data) == 1
+
+
+class TestColumnBuffer:
+    def test_growth(self):
+        buffer = ColumnBuffer(['a'], capacity=2)
+        for i in range(5):
+            buffer.append(pd.DataFrame({'a': [i, i]}))
+        assert len(buffer) == 10
+        assert buffer.frame()['a'].tolist() == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+
+    def test_missing_column(self):
+        buffer = ColumnBuffer(['a', 'b'])
+        buffer.append(pd.DataFrame({'a': [1.0]}))
+        assert np.isnan(buffer.frame()['b'].iloc[0])
+
+    def test_append_columns(self):
+        buffer = ColumnBuffer(['a', 'b'], capacity=1)
+        buffer.append_columns([np.arange(3), 'x'], 3)
+        buffer.append_columns([0.5, np.nan], 1)
+        frame = buffer.frame()
+        assert frame['a'].tolist() == [0, 1, 2, 0.5]
+        assert frame['b'].tolist()[:3] == ['x'] * 3
+
+    def test_object_promotion(self):
+        buffer = ColumnBuffer(['a'])
+        buffer.append(pd.DataFrame({'a': [1.0]}))
+        buffer.append(pd.DataFrame({'a': ['x']}))
+        assert buffer.frame()['a'].tolist() == [1.0, 'x']
+
+
+class TestBinaryResults:
+    class BinaryProcedure(RandomProcedure):
+        foo = Metadata('Foo', default=5)
+        DATA_FORMAT = "binary"
+        DATA_COLUMNS = ['x', 'length (m)', 'label']
+
+    @pytest.fixture
+    def results(self, tmpdir):
+        return Results(self.BinaryProcedure(), os.path.join(str(tmpdir), 'binary.dat'))
+
+    def append(self, results, *records):
+        with open(results.data_filename, 'ab') as f:
+            for record in records:
+                f.write(results.format(record))
+
+    def test_binary_formatter(self):
+        formatter = BinaryFormatter(columns=['x', 'length (m)', 'label'])
+        row = formatter.format({'x': 1, 'length (m)': "50 cm", 'label': 'abc'})
+        assert np.frombuffer(row, dtype='<f8')[:2].tolist() == [1.0, 0.5]
+        assert np.isnan(np.frombuffer(row, dtype='<f8')[2])
+
+    def test_data_format_from_procedure(self, results):
+        assert results.data_format == "binary"
+        assert results.data.shape == (0, 3)
+
+    def test_invalid_data_format(self, tmpdir):
+        with pytest.raises(ValueError):
+            Results(RandomProcedure(), os.path.join(str(tmpdir), 'x.dat'), data_format="xyz")
+
+    def test_appended_rows(self, results):
+        self.append(results, {'x': 1, 'length (m)': 2.5})
+        assert results.data['x'].tolist() == [1.0]
+        self.append(results, {'x': 2, 'length (m)': 3.5}, {'x': 3, 'length (m)': 4.5})
+        assert results.data['length (m)'].tolist() == [2.5, 3.5, 4.5]
+
+    def test_incomplete_row_is_postponed(self, results):
+        row = results.format({'x': 1, 'length (m)': 2.5})
+        with open(results.data_filename, 'ab') as f:
+            f.write(row[:10])
+        assert len(results.data) == 0
+        with open(results.data_filename, 'ab') as f:
+            f.write(row[10:])
+        assert results.data['x'].tolist() == [1.0]
+
+    def test_load(self, results):
+        results.procedure.evaluate_metadata()
+        results.store_metadata()
+        self.append(results, {'x': 1, 'length (m)': 2.5})
+        loaded = Results.load(results.data_filename, procedure_class=self.BinaryProcedure)
+        assert loaded.data_format == "binary"
+        assert loaded.procedure.iterations == 100
+        assert loaded.procedure.foo == '5'
+        assert loaded.data['length (m)'].tolist() == [2.5]
+
+
 def test_parameter_reading():
     data_path = os.path.join(os.path.dirname(__file__), "data/results_for_testing_parameters.csv")
     test_string = "/test directory with space/test_filename.csv"
@@ -0,0 +1,105 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+
+import pytest
+
+from pymeasure.experiment import BatchRunner, Procedure, Results
+from pymeasure.experiment.runner import BatchReport, RunReport, resource_lock, run_results
+from data.procedure_for_testing import RandomProcedure, SharedResourceProcedure
+
+
+@pytest.fixture(scope="module")
+def random_batch(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("batch")
+    runner = BatchRunner(RandomProcedure, directory=directory, max_workers=2)
+    parameters = [{'iterations': n, 'delay': 0.001, 'seed': str(n)} for n in (10, 20, 30)]
+    return runner.run(parameters)
+
+
+def test_batch_runs_every_parameter_set(random_batch):
+    assert [run.rows for run in random_batch.runs] == [10, 20, 30]
+    assert random_batch.failed == []
+    assert random_batch.rows == 60
+    assert random_batch.throughput > 0
+
+
+def test_batch_writes_one_file_per_run(random_batch):
+    filenames = [run.filename for run in random_batch.runs]
+    assert len(set(filenames)) == 3
+    for run in random_batch.runs:
+        results = Results.load(run.filename, procedure_class=RandomProcedure)
+        assert len(results.data) == run.rows
+        assert results.procedure.iterations == run.rows
+
+
+def test_batch_report_summary():
+    runs = [RunReport("a.csv", Procedure.FINISHED, 10, 1.),
+            RunReport("b.csv", Procedure.FAILED, 0, 1.)]
+    report = BatchReport(runs, 1.)
+    assert report.failed == runs[1:]
+    assert report.throughput == 2
+    assert report.row_rate == 10
+    assert report.speedup == 2
+    assert str(report).startswith("2 runs (1 failed)")
+
+
+def test_batch_reports_failed_run(tmp_path):
+    runner = BatchRunner(RandomProcedure, directory=tmp_path, max_workers=1)
+    # sleeping for a negative delay raises an error in the procedure
+    report = runner.run([{'iterations': 5, 'delay': -1}])
+    assert report.runs[0].status == Procedure.FAILED
+    assert len(report.failed) == 1
+
+
+def test_batch_serializes_runs_with_resources(tmp_path):
+    log_file = str(tmp_path / "periods.txt")
+    runner = BatchRunner(SharedResourceProcedure, directory=tmp_path, max_workers=4)
+    assert runner.serialized
+    report = runner.run([{'iterations': 5, 'delay': 0.01, 'log_file': log_file}] * 3)
+    assert report.failed == []
+    with open(log_file) as f:
+        events = [line.split() for line in f]
+    # runs do not overlap: start and stop alternate
+    assert [event for event, _ in events] == ["start", "stop"] * 3
+    stamps = [float(stamp) for _, stamp in events]
+    assert stamps == sorted(stamps)
+    assert not resource_lock('GPIB0::5::INSTR').locked()
+
+
+def test_batch_filenames_use_placeholders(tmp_path):
+    runner = BatchRunner(RandomProcedure, directory=tmp_path, prefix="N{Loop Iterations}_")
+    report = runner.run([{'iterations': 3}, {'iterations': 4}])
+    assert [os.path.basename(run.filename)[:3] for run in report.runs] == ["N3_", "N4_"]
+
+
+def test_run_results_counts_rows_without_live_data(tmp_path):
+    procedure = RandomProcedure()
+    procedure.iterations = 5
+    procedure.delay = 0.001
+    results = Results(procedure, str(tmp_path / "data.csv"))
+    report = run_results(results)
+    assert report.rows == 5
+    assert not results.live
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 
 from io import StringIO
@@ -124,3 +125,85 @@ def test_sequencer_errors(seq_file_text_err):
     with pytest.raises(exception, match=exc_text):
         seq = SequenceHandler(file_obj=fd)
         seq.parameters_sequence()
+
+
+seq_file_text_4 = """
+- "P1", "[1, 2]"
+-- "P2", "[3, 4]"
+-- "P3", "[5]"
+--- "P2", "[6, 7]"
+- "P4", "range(2)"
+"""
+
+expected_4 = [
+    ({"P1": 1}, {"P2": 3}), ({"P1": 1}, {"P2": 4}), ({"P1": 1}, {"P3": 5}, {"P2": 6}),
+    ({"P1": 1}, {"P3": 5}, {"P2": 7}),
+    ({"P1": 2}, {"P2": 3}), ({"P1": 2}, {"P2": 4}), ({"P1": 2}, {"P3": 5}, {"P2": 6}),
+    ({"P1": 2}, {"P3": 5}, {"P2": 7}),
+    ({"P4": 0},), ({"P4": 1},),
+]
+
+
+def test_parameters_sequence():
+    seq = SequenceHandler(file_obj=StringIO(seq_file_text_4))
+    assert seq.parameters_sequence() == expected_4
+
+
+def test_parameters_sequence_names_map():
+    seq = SequenceHandler(file_obj=StringIO(seq_file_text_1))
+    names_map = {"P1": "p1", "P2": "p2"}
+    assert seq.parameters_sequence(names_map)[0] == ({"p1": 1}, {"p2": 3})
+
+
+class TestLazyParametersSequence:
+    @pytest.fixture
+    def lazy(self):
+        return SequenceHandler(file_obj=StringIO(seq_file_text_4)).parameters_sequence(lazy=True)
+
+    def test_iteration_matches_list(self, lazy):
+        assert list(lazy) == expected_4
+        assert len(lazy) == len(expected_4)
+
+    def test_indexing(self, lazy):
+        assert [lazy[i] for i in range(len(lazy))] == expected_4
+        assert lazy[-1] == expected_4[-1]
+        assert lazy[2:5] == expected_4[2:5]
+        with pytest.raises(IndexError):
+            lazy[len(expected_4)]
+
+    def test_names_and_shape(self, lazy):
+        assert lazy.names == ["P1", "P2", "P3", "P4"]
+        assert lazy.shape == (10, 4)
+
+    def test_parameters(self, lazy):
+        parameters = list(lazy.parameters())
+        assert parameters[2] == {"P1": 1, "P3": 5, "P2": 6}
+        assert parameters[-1] == {"P4": 1}
+
+    def test_to_array(self, lazy):
+        array = lazy.to_array()
+        assert array.dtype.names == ("P1", "P2", "P3", "P4")
+        assert array.shape == (10,)
+        for row, parameters in zip(array, lazy.parameters()):
+            for name in array.dtype.names:
+                if name in parameters:
+                    assert row[name] == parameters[name]
+                else:
+                    assert np.isnan(row[name])
+
+    def test_large_sweep_is_not_expanded(self):
+        text = "\n".join('%s "P%d", "arange(200)"' % ("-" * (level + 1), level)
+                         for level in range(4))
+        lazy = SequenceHandler(file_obj=StringIO(text)).parameters_sequence(lazy=True)
+        assert len(lazy) == 200 ** 4
+        assert lazy.shape == (200 ** 4, 4)
+        assert lazy[-1] == ({"P0": 199}, {"P1": 199}, {"P2": 199}, {"P3": 199})
+        first = next(iter(lazy))
+        assert first == ({"P0": 0}, {"P1": 0}, {"P2": 0}, {"P3": 0})
+
+    def test_to_array_nested_precedence(self):
+        text = '- "P1", "[1, 2]"\n-- "P1", "[3.5]"\n-- "P2", "[4]"'
+        array = SequenceHandler(file_obj=StringIO(text)).parameters_sequence(
+            lazy=True).to_array()
+        assert array["P1"].tolist() == [3.5, 1, 3.5, 2]
+        assert np.isnan(array["P2"][0]) and array["P2"][1] == 4
@@ -24,12 +24,13 @@
 import importlib
 import logging
 
+import numpy as np
 import pytest
 import os
 import tempfile
 from time import sleep
 
-from pymeasure.experiment import Listener, Procedure
+from pymeasure.experiment import Listener, Metadata, Procedure
 from pymeasure.experiment.workers import Worker
 from pymeasure.experiment.results import Results
 from data.procedure_for_testing import RandomProcedure
@@ -65,6 +66,119 @@ def test_worker_finish():
     assert new_results.data.shape == (100, 2)
 
 
+def test_worker_finish_binary():
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0.001
+    file = tempfile.mktemp()
+    results = Results(procedure, file, data_format="binary")
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert not worker.is_alive()
+
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    assert new_results.data_format == "binary"
+    assert new_results.data.shape == (100, 2)
+    assert new_results.data['Iteration'].tolist() == list(range(100))
+
+
+@pytest.mark.parametrize("data_format", ("csv", "binary"))
+def test_worker_block_emission(data_format):
+    class BlockProcedure(Procedure):
+        DATA_COLUMNS = ['Iteration', 'Random Number']
+
+        def execute(self):
+            self.emit('results', {'Iteration': 0, 'Random Number': 0.5})
+            self.emit('results', {'Iteration': np.arange(1, 1001),
+                                  'Random Number': np.linspace(0, 1, 1000)})
+            self.emit('results', {'Iteration': [], 'Random Number': []})
+
+    file = tempfile.mktemp()
+    results = Results(BlockProcedure(), file, data_format=data_format)
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    data = Results.load(file, procedure_class=BlockProcedure).data
+    assert data.shape == (1001, 2)
+    assert data['Iteration'].tolist() == list(range(1001))
+    assert data['Random Number'].iloc[-1] == 1
+
+
+@pytest.mark.parametrize("data_format", ("csv", "binary"))
+def test_worker_live_data_matches_file(data_format):
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0.001
+    file = tempfile.mktemp()
+    results = Results(procedure, file, data_format=data_format)
+    results.start_live_data()
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    live = results.data
+    assert live.shape == (100, 2)
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    # the csv parser may differ from the written values in the last digit
+    assert np.allclose(live.to_numpy(), new_results.data.to_numpy(), rtol=1e-15)
+
+
+@pytest.mark.parametrize("data_format", ("csv", "binary"))
+def test_worker_startup_data_and_metadata(data_format):
+    class StartupProcedure(Procedure):
+        DATA_COLUMNS = ['Iteration', 'Random Number']
+        started = Metadata('Started', fget=lambda: 'yes')
+
+        def startup(self):
+            for i in range(5):
+                self.emit('results', {'Iteration': i, 'Random Number': 0.5})
+            sleep(0.2)  # longer than the flush interval of the recorder
+
+        def execute(self):
+            for i in range(5, 10):
+                self.emit('results', {'Iteration': i, 'Random Number': 0.5})
+
+    file = tempfile.mktemp()
+    results = Results(StartupProcedure(), file, data_format=data_format)
+    worker = Worker(results)
+    store_metadata = results.store_metadata
+    recording = []
+
+    def checked_store_metadata():
+        # the recorder must not append to the files while they are rewritten
+        recording.append(worker.recorder.is_alive())
+        store_metadata()
+
+    results.store_metadata = checked_store_metadata
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert recording == [False]
+    new_results = Results.load(file, procedure_class=StartupProcedure)
+    assert new_results.procedure.started == 'yes'
+    assert new_results.data['Iteration'].tolist() == list(range(10))
+
+
+def test_worker_converts_records_once(caplog):
+    class UnitsProcedure(Procedure):
+        DATA_COLUMNS = ['Voltage (V)']
+
+        def execute(self):
+            self.emit('results', {'Voltage (V)': "5 A"})
+
+    file = tempfile.mktemp()
+    results = Results(UnitsProcedure(), file)
+    results.start_live_data()
+    worker = Worker(results)
+    with caplog.at_level(logging.WARNING):
+        worker.start()
+        worker.join(timeout=20.0)
+    assert len([r for r in caplog.records if "right unit" in r.getMessage()]) == 1
+
+
 def test_worker_closes_file_after_finishing():
     procedure = RandomProcedure()
     procedure.iterations = 100
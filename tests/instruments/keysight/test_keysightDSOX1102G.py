@@ -0,0 +1,97 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.keysight.keysightDSOX1102G import KeysightDSOX1102G
+
+PREAMBLE_BYTE = b"+0,+0,+4,+1,+1.6E-08,-5.0E-04,+0,+5.0E-02,+0.0E+00,+128"
+PREAMBLE_WORD = b"+1,+0,+2,+1,+1.6E-08,-5.0E-04,+0,+2.5E-04,+1.0E+00,+32768"
+SETUP = [(b":waveform:source CHAN1", None),
+         (b":waveform:points:mode NORM", None),
+         (b":waveform:points 100", None)]
+
+
+def test_download_data_ascii():
+    with expected_protocol(
+            KeysightDSOX1102G,
+            SETUP + [(b":waveform:preamble?", PREAMBLE_BYTE.replace(b"+0,", b"+4,", 1)),
+                     (b":waveform:format ASC", None),
+                     (b":waveform:data?", b"#800000027-1.00000E-01,+2.50000E-01\n")],
+    ) as instr:
+        data, preamble = instr.download_data("channel1", points=100)
+        assert data.tolist() == [-0.1, 0.25]
+        assert preamble["format"] == "ASCII"
+
+
+@pytest.mark.parametrize("waveform_format, preamble, block, expected", [
+    ("byte", PREAMBLE_BYTE, b"#800000004\x80\x82\x00\xff\n", [0, 0.1, -6.4, 6.35]),
+    ("word", PREAMBLE_WORD, b"#800000004\x80\x00\x80\x04\n", [1, 1.001]),
+])
+def test_download_data_binary(waveform_format, preamble, block, expected):
+    with expected_protocol(
+            KeysightDSOX1102G,
+            SETUP + [(f":waveform:format {waveform_format.upper()}".encode(), None),
+                     (b":waveform:unsigned 1", None),
+                     (b":waveform:byteorder msbfirst", None),
+                     (b":waveform:preamble?", preamble),
+                     (b":waveform:data?", None),
+                     (None, block)],
+    ) as instr:
+        data, preamble = instr.download_data("channel1", points=100,
+                                             waveform_format=waveform_format)
+        np.testing.assert_allclose(data, expected)
+        assert preamble["format"] == waveform_format.upper()
+
+
+def test_download_data_multiple_sources():
+    block = b"#800000002\x80\x81\n"
+    with expected_protocol(
+            KeysightDSOX1102G,
+            [(b":waveform:source CHAN1", None),
+             (b":waveform:points:mode NORM", None),
+             (b":waveform:points 100", None),
+             (b":waveform:format BYTE", None),
+             (b":waveform:unsigned 1", None),
+             (b":waveform:byteorder msbfirst", None),
+             (b":waveform:preamble?", PREAMBLE_BYTE),
+             (b":waveform:data?", None),
+             (None, block),
+             (b":waveform:source CHAN2", None),
+             (b":waveform:points:mode NORM", None),
+             (b":waveform:points 100", None),
+             (b":waveform:format BYTE", None),
+             (b":waveform:unsigned 1", None),
+             (b":waveform:byteorder msbfirst", None),
+             (b":waveform:preamble?", PREAMBLE_BYTE),
+             (b":waveform:data?", None),
+             (None, block)],
+    ) as instr:
+        data, preambles = instr.download_data(["channel1", "channel2"], points=100,
+                                              waveform_format="byte")
+        assert list(data) == ["channel1", "channel2"]
+        np.testing.assert_allclose(data["channel2"], [0, 0.05])
+        assert preambles["channel1"]["points"] == 4
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+from decimal import Decimal
+
+import numpy as np
 import pytest
 
 from pymeasure.instruments.teledyne.teledyne_oscilloscope import sanitize_source
@@ -341,6 +344,28 @@ def test_download_two_points():
         assert y[1] == y[0]
 
 
+@pytest.mark.parametrize("source", ["C1", "MATH"])
+@pytest.mark.parametrize("sparsing", [1, 7])
+def test_process_data(source, sparsing):
+    """Compare the vectorized conversion with a per-sample reference implementation."""
+    preamble = {"source": source, "sparsing": sparsing, "sampling_rate": 1e9, "xdiv": 5e-4,
+                "ydiv": 0.05, "yoffset": -0.150}
+    ydata = np.random.default_rng(1).integers(0, 256, 1000, dtype=np.uint8)
+    with expected_protocol(LeCroyT3DSO1204, [(b"CHDR OFF", None)]) as instr:
+        y, x, _ = instr._process_data(ydata, preamble)
+
+    signed = source != "MATH"
+    y_ref = [int.from_bytes([v], byteorder='big', signed=signed) * 0.05 / 25. for v in ydata]
+    if signed:
+        y_ref = [v + 0.150 for v in y_ref]
+    else:
+        y_ref = [v - 0.05 * (-0.150 + 255) / 50. for v in y_ref]
+    x_ref = [float(Decimal(-5e-4 * 14 / 2.) + Decimal(float(i * sparsing)) / Decimal(1e9))
+             for i in range(len(ydata))]
+    assert y.tolist() == y_ref
+    np.testing.assert_array_max_ulp(x, np.array(x_ref), maxulp=1)
+
+
 def test_trigger():
     with expected_protocol(
             LeCroyT3DSO1204,
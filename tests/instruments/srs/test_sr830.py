@@ -21,6 +21,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import time
+
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -93,3 +96,79 @@ def test_output_conversion():
     ) as inst:
         conv = inst.output_conversion("X")
         assert conv(inst.x) == pytest.approx(-2.66e-7)
+
+
+def _block(*values):
+    return np.array(values, dtype=np.float32).tobytes()
+
+
+def test_iter_buffer(monkeypatch):
+    """Verify that the buffer is streamed in blocks with an adapted polling interval."""
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "13"),
+         ("SPTS?", "0"),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", _block(1, 2)),
+         ("TRCB?2,0,2", _block(3, 4)),
+         ("SPTS?", "5"),
+         ("TRCB?1,2,2", _block(5, 6)),
+         ("TRCB?2,2,2", _block(7, 8)),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        blocks = list(inst.iter_buffer(4))
+    assert [(list(ch1), list(ch2)) for ch1, ch2 in blocks] == [([1, 2], [3, 4]),
+                                                               ([5, 6], [7, 8])]
+    assert sleeps == [pytest.approx(32 / 512)] * 2
+
+
+def test_iter_buffer_triggered_backs_off(monkeypatch):
+    """Verify that the polling interval grows while a triggered buffer stays empty."""
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "14"),
+         ("SPTS?", "0"),
+         ("SPTS?", "0"),
+         ("SPTS?", "1"),
+         ("TRCB?1,0,1", _block(1)),
+         ("TRCB?2,0,1", _block(2)),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        assert len(list(inst.iter_buffer(1))) == 1
+    assert sleeps == [2e-3, 4e-3]
+
+
+def test_fill_buffer_aborted():
+    """Verify that an aborted acquisition pauses the buffer and keeps the data read."""
+    aborted = iter([False, True])
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "2"),
+         ("TRCB?1,0,2", _block(1, 2)),
+         ("TRCB?2,0,2", _block(3, 4)),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        ch1, ch2 = inst.fill_buffer(4, lambda: next(aborted), delay=0)
+    assert list(ch1[:2]) == [1, 2]
+    assert list(ch2[:2]) == [3, 4]
+
+
+def test_buffer_measure():
+    """Verify mean and standard deviation of a fast buffer measurement."""
+    with expected_protocol(
+        SR830,
+        [("FAST2;STRD", None),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", _block(1, 3)),
+         ("TRCB?2,0,2", _block(2, 2)),
+         ("PAUS", None),
+         ],
+    ) as inst:
+        assert inst.buffer_measure(2, delay=0) == pytest.approx((2, 1, 2, 0))
@@ -23,11 +23,14 @@
 #
 
 import logging
+import threading
+from concurrent.futures import InvalidStateError
 
 import pytest
 
 from pymeasure.units import ureg
 from pymeasure.test import expected_protocol
+from pymeasure.instruments import Channel, Instrument, SCPIMixin
 from pymeasure.instruments.common_base import DynamicProperty, CommonBase
 from pymeasure.adapters import FakeAdapter, ProtocolAdapter
 from pymeasure.instruments.validators import strict_discrete_set, strict_range, truncated_range
@@ -1012,3 +1015,338 @@ def test_dynamic_property_values_defined_at_superclass_level():
     inst.fake_ctrl2 = 17  # should raise an error if change unsuccessful
     with pytest.raises(ValueError):
         inst.fake_ctrl2 = 2  # should not raise an error if change unsuccessful
+
+
+class BatchChannel(Channel):
+    frequency = Channel.control("C{ch}:FREQ?", "C{ch}:FREQ %g", "docs")
+
+
+class BatchInstrument(Instrument):
+    def __init__(self, adapter, name="Batch", **kwargs):
+        kwargs.setdefault("includeSCPI", False)
+        super().__init__(adapter, name, **kwargs)
+
+    voltage = Instrument.control("VOLT?", "VOLT %g", "docs")
+    mode = Instrument.control("MODE?", "MODE %d", "docs",
+                              values={"low": 0, "high": 1}, map_values=True)
+    level = Instrument.measurement("LEV?", "docs", get_process=lambda v: 2 * v)
+    limits = Instrument.measurement("LIM?", "docs")
+    delayed = Instrument.measurement("DEL?", "docs", values_kwargs={"query_delay": 0})
+    checked = Instrument.control("CHK?", "CHK %d", "docs",
+                                 check_get_errors=True, check_set_errors=True)
+    ch_A = Instrument.ChannelCreator(BatchChannel, "A")
+
+    def check_get_errors(self):
+        return [self.ask("ERR?")]
+
+    check_set_errors = check_get_errors
+
+
+class SCPIBatchInstrument(SCPIMixin, BatchInstrument):
+    pass
+
+
+class TestBatch:
+    def test_queries(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT?;MODE?;LEV?;C1:FREQ?", "1.5;1;3;100")],
+        ) as inst:
+            inst.ch_A.id = 1
+            with inst.batch():
+                voltage = inst.voltage
+                mode = inst.mode
+                level = inst.level
+                frequency = inst.ch_A.frequency
+                assert not voltage.done()
+            assert voltage.result() == 1.5
+            assert mode.result() == "high"
+            assert level.result() == 6
+            assert frequency.result() == 100
+
+    def test_multiple_values(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("LIM?;VOLT?", "1,2,3;4")],
+        ) as inst:
+            with inst.batch():
+                limits = inst.limits
+                voltage = inst.voltage
+            assert limits.result() == [1, 2, 3]
+            assert voltage.result() == 4
+
+    def test_setters_only_write(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT 2;MODE 0;CA:FREQ 50", None)],
+        ) as inst:
+            with inst.ch_A.batch():
+                inst.voltage = 2
+                inst.mode = "low"
+                inst.ch_A.frequency = 50
+
+    def test_mixed(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT 2;VOLT?", "2")],
+        ) as inst:
+            with inst.batch():
+                inst.voltage = 2
+                voltage = inst.voltage
+            assert voltage.result() == 2
+
+    def test_scpi_commands_are_rooted(self):
+        with expected_protocol(
+            SCPIBatchInstrument,
+            [("*IDN?;:VOLT?;:MODE?", "id;1;0")],
+        ) as inst:
+            with inst.batch():
+                idn = inst.id
+                voltage = inst.voltage
+                mode = inst.mode
+            assert idn.result() == "id"
+            assert voltage.result() == 1
+            assert mode.result() == "low"
+
+    def test_max_commands(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT?;MODE?", "1;0"), ("LEV?", "2")],
+        ) as inst:
+            with inst.batch(max_commands=2):
+                voltage = inst.voltage
+                mode = inst.mode
+                level = inst.level
+            assert (voltage.result(), mode.result(), level.result()) == (1, "low", 4)
+
+    def test_failing_message_cancels_later_messages(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT?", "1"), ("MODE?", "1;2")],
+        ) as inst:
+            with pytest.raises(ValueError, match="Expected 1 replies"):
+                with inst.batch(max_commands=1):
+                    voltage = inst.voltage
+                    mode = inst.mode
+                    level = inst.level
+            assert voltage.result() == 1
+            with pytest.raises(ValueError):
+                mode.result()
+            assert level.cancelled()
+
+    def test_result_of_discarded_future_raises(self):
+        with expected_protocol(BatchInstrument, []) as inst:
+            with inst.batch() as batch:
+                voltage = inst.voltage
+                batch._entries.clear()
+                with pytest.raises(InvalidStateError):
+                    voltage.result()
+
+    def test_result_sends_pending_commands(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT?", "1"), ("MODE?", "1")],
+        ) as inst:
+            with inst.batch() as batch:
+                assert inst.voltage.result() == 1
+                mode = inst.mode
+                assert len(batch) == 1
+            assert mode.result() == "high"
+
+    def test_values_kwargs_not_batched(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT?", "1"), ("DEL?", "5")],
+        ) as inst:
+            with inst.batch():
+                voltage = inst.voltage
+                assert inst.delayed == 5
+            assert voltage.result() == 1
+
+    def test_check_errors_after_message(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("CHK 1;CHK?", "1"), ("ERR?", "0")],
+        ) as inst:
+            with inst.batch():
+                inst.checked = 1
+                checked = inst.checked
+            assert checked.result() == 1
+
+    def test_wrong_number_of_replies(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("VOLT?;LEV?", "1")],
+        ) as inst:
+            with pytest.raises(ValueError, match="Expected 2 replies"):
+                with inst.batch():
+                    voltage = inst.voltage
+                    inst.level
+            with pytest.raises(ValueError):
+                voltage.result()
+
+    def test_processing_error_is_set_on_future(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("MODE?;VOLT?", "5;1")],
+        ) as inst:
+            with inst.batch():
+                mode = inst.mode
+                voltage = inst.voltage
+            with pytest.raises(KeyError):
+                mode.result()
+            assert voltage.result() == 1
+
+    def test_exception_cancels_batch(self):
+        with expected_protocol(BatchInstrument, []) as inst:
+            with pytest.raises(ZeroDivisionError):
+                with inst.batch():
+                    inst.voltage = 1
+                    voltage = inst.voltage
+                    1 / 0
+            assert voltage.cancelled()
+            assert inst._get_batch() is None
+
+    def test_other_threads_are_not_batched(self):
+        with expected_protocol(
+            BatchInstrument,
+            [("MODE?", "0"), ("VOLT?", "1.5")],
+        ) as inst:
+            values = []
+            with inst.batch():
+                voltage = inst.voltage
+                thread = threading.Thread(target=lambda: values.append(inst.mode))
+                thread.start()
+                thread.join()
+            assert values == ["low"]
+            assert voltage.result() == 1.5
+
+
+class CacheChannel(Channel):
+    frequency = Channel.control("C{ch}:FREQ?", "C{ch}:FREQ %g", "docs", cache=True)
+
+
+class CacheInstrument(SCPIMixin, Instrument):
+    def __init__(self, adapter, name="Cache", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+
+    voltage = Instrument.control("VOLT?", "VOLT %g", "docs", cache=True,
+                                 validator=truncated_range, values=(0, 10))
+    mode = Instrument.control("MODE?", "MODE %d", "docs", cache=True,
+                              values={"low": 0, "high": 1}, map_values=True)
+    current = Instrument.control("CURR?", "CURR %g", "docs")
+    range = Instrument.setting("RANG %g", "docs", cache=True)
+    level = Instrument.measurement("LEV?", "docs")
+    serial = Instrument.measurement("SER?", "docs", cache=True, cast=str)
+    checked = Instrument.control("CHK?", "CHK %d", "docs", cache=True, check_set_errors=True)
+    ch_A = Instrument.ChannelCreator(CacheChannel, "A")
+
+    def check_set_errors(self):
+        return [e for e in [self.ask("ERR?")] if e != "0"]
+
+
+class TestCache:
+    def test_get_is_cached(self):
+        with expected_protocol(CacheInstrument, [("VOLT?", "1.5")]) as inst:
+            assert inst.voltage == 1.5
+            assert inst.voltage == 1.5
+
+    def test_set_value_is_cached(self):
+        with expected_protocol(CacheInstrument, [("VOLT 10", None), ("MODE 1", None)]) as inst:
+            inst.voltage = 20  # truncated
+            inst.mode = "high"
+            assert inst.voltage == 10
+            assert inst.mode == "high"
+
+    def test_setting_returns_cached_value(self):
+        with expected_protocol(CacheInstrument, [("RANG 2", None)]) as inst:
+            with pytest.raises(LookupError):
+                inst.range
+            inst.range = 2
+            assert inst.range == 2
+
+    def test_uncached_properties(self):
+        with expected_protocol(
+            CacheInstrument,
+            [("CURR?", "1"), ("CURR?", "2"), ("LEV?", "3"), ("LEV?", "4")],
+        ) as inst:
+            assert [inst.current, inst.current, inst.level, inst.level] == [1, 2, 3, 4]
+
+    def test_instance_wide_enable(self):
+        with expected_protocol(
+            CacheInstrument,
+            [("CURR?", "1"), ("LEV?", "3"), ("LEV?", "4")],
+        ) as inst:
+            inst.cache_properties = True
+            assert [inst.current, inst.current] == [1, 1]
+            # Measurements are not cached unless requested explicitly
+            assert [inst.level, inst.level] == [3, 4]
+
+    def test_measurement_cache(self):
+        with expected_protocol(CacheInstrument, [("SER?", "123")]) as inst:
+            assert inst.serial == inst.serial == "123"
+
+    @pytest.mark.parametrize("method, command", (("reset", "*RST"), ("clear", "*CLS")))
+    def test_invalidated_by_reset_and_clear(self, method, command):
+        with expected_protocol(
+            CacheInstrument,
+            [("VOLT?", "1"), ("C1:FREQ?", "5"), (command, None), ("VOLT?", "0"),
+             ("C1:FREQ?", "6")],
+        ) as inst:
+            inst.ch_A.id = 1
+            assert inst.voltage == 1
+            assert inst.ch_A.frequency == 5
+            getattr(inst, method)()
+            assert inst.voltage == 0
+            assert inst.ch_A.frequency == 6
+
+    def test_invalidate_cache(self):
+        with expected_protocol(
+            CacheInstrument,
+            [("VOLT?", "1"), ("MODE?", "0"), ("VOLT?", "2")],
+        ) as inst:
+            assert inst.voltage == 1
+            assert inst.mode == "low"
+            inst.invalidate_cache("voltage")
+            assert inst.voltage == 2
+            assert inst.mode == "low"
+
+    def test_invalidate_channel_cache(self):
+        with expected_protocol(
+            CacheInstrument,
+            [("VOLT?", "1"), ("CA:FREQ?", "5"), ("CA:FREQ?", "6")],
+        ) as inst:
+            assert inst.voltage == 1
+            assert inst.ch_A.frequency == 5
+            inst.ch_A.invalidate_cache()
+            assert inst.ch_A.frequency == 6
+            assert inst.voltage == 1
+
+    def test_set_errors_invalidate(self):
+        with expected_protocol(
+            CacheInstrument,
+            [("CHK 3", None), ("ERR?", "-222"), ("CHK?", "1")],
+        ) as inst:
+            inst.checked = 3
+            assert inst.checked == 1
+
+    def test_batch(self):
+        with expected_protocol(
+            CacheInstrument,
+            [("VOLT 2;:MODE?", "1")],
+        ) as inst:
+            with inst.batch():
+                inst.voltage = 2
+                voltage = inst.voltage
+                mode = inst.mode
+            assert voltage.result() == 2
+            assert mode.result() == "high"
+            assert inst.mode == "high"
+
+    def test_cancelled_batch_invalidates(self):
+        with expected_protocol(CacheInstrument, [("VOLT?", "1")]) as inst:
+            with pytest.raises(ZeroDivisionError):
+                with inst.batch():
+                    inst.voltage = 2
+                    1 / 0
+            assert inst.voltage == 1
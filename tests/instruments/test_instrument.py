@@ -23,6 +23,7 @@
 #
 
 
+import asyncio
 import time
 from unittest import mock
 
@@ -30,7 +31,7 @@ import pytest
 
 from pymeasure.test import expected_protocol
 from pymeasure.instruments import Instrument, Channel
-from pymeasure.adapters import FakeAdapter, ProtocolAdapter
+from pymeasure.adapters import FakeAdapter, ProtocolAdapter, ThreadedAdapter
 from pymeasure.instruments.fakes import FakeInstrument
 from pymeasure.instruments.validators import truncated_range
 
@@ -191,6 +192,63 @@ class TestInstrumentCommunication:
         assert instr.adapter.method_calls == [mock.call.write_binary_values("abc", [5, 6, 7])]
 
 
+class TestAsynchronousCommunication:
+    """Test the asynchronous methods with the default ThreadedAdapter."""
+
+    def test_async_adapter(self):
+        with expected_protocol(Instrument, [], name="Test", includeSCPI=False) as instr:
+            assert isinstance(instr.async_adapter, ThreadedAdapter)
+            assert instr.async_adapter.adapter is instr.adapter
+            assert instr.async_adapter is instr.async_adapter
+
+    def test_shutdown_closes_async_adapter(self):
+        with expected_protocol(Instrument, [], name="Test", includeSCPI=False) as instr:
+            adapter = instr.async_adapter
+            with mock.patch.object(adapter, "close", wraps=adapter.close) as close:
+                instr.shutdown()
+            close.assert_called_once_with()
+            assert instr.async_adapter is not adapter
+
+    def test_awrite_aread(self):
+        async def main(instr):
+            await instr.awrite("*IDN?")
+            return await instr.aread()
+
+        with expected_protocol(Instrument, [("*IDN?", "xyz")], name="Test",
+                               includeSCPI=False) as instr:
+            assert asyncio.run(main(instr)) == "xyz"
+
+    def test_aask_avalues(self):
+        async def main(instr):
+            return await instr.aask("A?"), await instr.avalues("B?", cast=int)
+
+        with expected_protocol(Instrument, [("A?", "1"), ("B?", "2,3")], name="Test",
+                               includeSCPI=False) as instr:
+            assert asyncio.run(main(instr)) == ("1", [2, 3])
+
+    def test_channel_properties(self):
+        async def main(instr):
+            await instr.ch_A.aset("fake_ctrl", 4)
+            return await instr.ch_B.aget("fake_measurement")
+
+        with expected_protocol(ChannelInstrument,
+                               [("CA:control 4", None), ("CB:measurement?", "2")],
+                               includeSCPI=False) as instr:
+            assert asyncio.run(main(instr)) == "Y"
+
+    def test_async_batch(self):
+        async def main(instr):
+            async with instr.batch():
+                instr.ch_A.fake_ctrl = 2
+                value = instr.ch_B.fake_ctrl
+            return value.result()
+
+        with expected_protocol(ChannelInstrument,
+                               [("CA:control 2;CB:control?", "3")],
+                               includeSCPI=False) as instr:
+            assert asyncio.run(main(instr)) == 3
+
+
 class TestWaiting:
     @pytest.fixture()
     def instr(self):
@@ -0,0 +1,107 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import importlib
+import os
+import pkgutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pymeasure
+from pymeasure import adapters, instruments
+from pymeasure.instruments import keithley
+
+
+vendor_packages = sorted(module.name for module in pkgutil.iter_modules(instruments.__path__)
+                         if module.ispkg)
+
+
+def import_times(statement):
+    """Return the cumulative import times in µs by module of `statement` in a new interpreter."""
+    env = dict(os.environ, PYTHONPATH=str(Path(pymeasure.__file__).parents[1]))
+    process = subprocess.run([sys.executable, "-X", "importtime", "-W", "ignore", "-c", statement],
+                             env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line[12:].split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("vendor", vendor_packages)
+def test_indexed_names(vendor):
+    package = importlib.import_module(f"pymeasure.instruments.{vendor}")
+    assert set(package.__all__) <= set(dir(package))
+    for name in dir(package):
+        if name.startswith("_"):
+            continue
+        try:
+            getattr(package, name)
+        except (ImportError, OSError):
+            # Some non-required driver dependencies may not be installed on test computer
+            continue
+        assert name in vars(package)  # stored after the first access
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError, match="has no attribute 'Keithley0'"):
+        keithley.Keithley0
+    with pytest.raises(ImportError):
+        from pymeasure.instruments.keithley import Keithley0  # noqa: F401
+
+
+def test_optional_adapters():
+    from pymeasure.adapters import VISAAdapter
+    assert VISAAdapter is adapters.visa.VISAAdapter
+    assert "SerialAdapter" in dir(adapters)
+
+
+def test_star_import_of_adapters():
+    namespace = {}
+    exec("from pymeasure.adapters import *", namespace)
+    for name in ("Adapter", "VISAAdapter", "SerialAdapter", "PrologixAdapter"):
+        assert name in namespace
+
+
+def test_star_import_skips_optional_drivers():
+    namespace = {}
+    exec("from pymeasure.instruments.ni import *", namespace)
+    assert "VirtualBench" not in namespace
+    assert "VirtualBench" in dir(importlib.import_module("pymeasure.instruments.ni"))
+
+
+def test_import_time():
+    """Importing an instrument imports only its own driver."""
+    times = import_times("from pymeasure.instruments.keithley import Keithley2400")
+    assert "pymeasure.instruments.keithley.keithley2400" in times
+    assert "pymeasure.instruments.keithley.keithley2000" not in times
+    assert "asyncio" not in times
+    adapter_times = import_times("import pymeasure.adapters")
+    for optional in ("pyvisa", "serial", "vxi11", "asyncio"):
+        assert optional not in adapter_times